@@ -122,6 +122,8 @@ class DesignAgent(BaseAgent):
                 - model: Leonardo model (lightning, photoreal, kino, diffusion)
                 - photo_real: Use PhotoReal mode for realistic images
                 - count: Number of variations (for generate_variations)
+                - wait: Wait for ad set/variation images to complete
+                - save_dir: Download completed images here (with wait)
 
         Returns:
             AgentResult with generated creatives
@@ -283,31 +285,30 @@ class DesignAgent(BaseAgent):
         creatives = []
         errors = []
 
-        for format_name in formats:
-            try:
-                aspect_ratio = self._get_aspect_ratio(format_name)
-                result = self.leonardo.generate_image(
-                    prompt=prompt,
-                    aspect_ratio=aspect_ratio,
-                    model=model,
-                    alchemy=True,
-                    photo_real=photo_real,
-                    negative_prompt="blurry, low quality, distorted, watermark, text, logo"
-                )
-
-                creatives.append({
-                    'name': f"{context['product'][:30]} - {format_name}",
-                    'format': format_name,
-                    'generation_id': result.generation_id,
-                    'status': result.status,
-                    'aspect_ratio': aspect_ratio.value
-                })
+        # All formats are submitted together and, with 'wait', awaited together
+        jobs = [
+            self._generation_job(prompt, self._get_aspect_ratio(format_name), model, photo_real)
+            for format_name in formats
+        ]
+        batch = self._run_batch(jobs, context)
 
-            except Exception as e:
+        for format_name, job, result in zip(formats, jobs, batch['generations']):
+            if result.error:
                 errors.append({
                     'format': format_name,
-                    'error': str(e)
+                    'error': result.error,
+                    **self._pending_fields(result)
                 })
+                continue
+
+            creatives.append({
+                'name': f"{context['product'][:30]} - {format_name}",
+                'format': format_name,
+                'generation_id': result.generation_id,
+                'status': result.status,
+                'aspect_ratio': job['aspect_ratio'].value,
+                **self._image_fields(result)
+            })
 
         return AgentResult(
             success=len(creatives) > 0,
@@ -315,7 +316,8 @@ class DesignAgent(BaseAgent):
                 'creatives': creatives,
                 'errors': errors,
                 'prompt_used': prompt,
-                'total_generated': len(creatives)
+                'total_generated': len(creatives),
+                'timings': batch['timings']
             },
             message=f"Generated {len(creatives)} ad creatives across {len(formats)} formats"
         )
@@ -352,44 +354,92 @@ class DesignAgent(BaseAgent):
             "studio background"
         ]
 
-        for i in range(count):
-            modifier = variation_modifiers[i % len(variation_modifiers)]
-            prompt = f"{base_prompt}, {modifier}" if modifier else base_prompt
-
-            try:
-                result = self.leonardo.generate_image(
-                    prompt=prompt,
-                    aspect_ratio=aspect_ratio,
-                    model=model,
-                    alchemy=True,
-                    photo_real=photo_real,
-                    negative_prompt="blurry, low quality, distorted, watermark, text, logo"
-                )
+        modifiers = [variation_modifiers[i % len(variation_modifiers)] for i in range(count)]
+        jobs = [
+            self._generation_job(
+                f"{base_prompt}, {modifier}" if modifier else base_prompt,
+                aspect_ratio, model, photo_real
+            )
+            for modifier in modifiers
+        ]
+        batch = self._run_batch(jobs, context)
 
+        for i, (modifier, job, result) in enumerate(zip(modifiers, jobs, batch['generations'])):
+            if result.error:
                 variations.append({
                     'variation': i + 1,
-                    'modifier': modifier or 'base',
-                    'generation_id': result.generation_id,
-                    'status': result.status,
-                    'prompt': prompt
+                    'error': result.error,
+                    **self._pending_fields(result)
                 })
+                continue
 
-            except Exception as e:
-                variations.append({
-                    'variation': i + 1,
-                    'error': str(e)
-                })
+            variations.append({
+                'variation': i + 1,
+                'modifier': modifier or 'base',
+                'generation_id': result.generation_id,
+                'status': result.status,
+                'prompt': job['prompt'],
+                **self._image_fields(result)
+            })
 
         return AgentResult(
             success=True,
             data={
                 'variations': variations,
                 'format': format_name,
-                'total': len(variations)
+                'total': len(variations),
+                'timings': batch['timings']
             },
             message=f"Generated {len(variations)} variations"
         )
 
+    def _generation_job(
+        self,
+        prompt: str,
+        aspect_ratio: AspectRatio,
+        model: LeonardoModel,
+        photo_real: bool
+    ) -> Dict[str, Any]:
+        """generate_image arguments for one ad image"""
+        return {
+            'prompt': prompt,
+            'aspect_ratio': aspect_ratio,
+            'model': model,
+            'alchemy': True,
+            'photo_real': photo_real,
+            'negative_prompt': "blurry, low quality, distorted, watermark, text, logo"
+        }
+
+    def _run_batch(self, jobs: List[Dict[str, Any]], context: Dict[str, Any]) -> Dict[str, Any]:
+        """Submit jobs concurrently; await/download them if the context asks to"""
+        wait = context.get('wait', False)
+        return self.leonardo.generate_batch(
+            jobs,
+            wait=wait,
+            save_dir=context.get('save_dir') if wait else None
+        )
+
+    @staticmethod
+    def _image_fields(result: GeneratedImage) -> Dict[str, Any]:
+        """Image URLs and downloaded files of an awaited generation"""
+        if not result.images:
+            return {}
+        return {
+            'image_urls': [img.get('url') for img in result.images if img.get('url')],
+            'files': result.files
+        }
+
+    @staticmethod
+    def _pending_fields(result: GeneratedImage) -> Dict[str, Any]:
+        """
+        Id and status of a generation that was created but failed or timed
+        out while awaited; credits are spent, and it can still be fetched
+        with check_status / wait_and_download
+        """
+        if not result.generation_id:
+            return {}
+        return {'generation_id': result.generation_id, 'status': result.status}
+
     def check_status(self, generation_id: str) -> Dict[str, Any]:
         """Check status of a generation"""
         if not self.leonardo:
@@ -409,17 +459,15 @@ class DesignAgent(BaseAgent):
             result = self.leonardo.wait_for_completion(generation_id)
             if result.get('status') == 'COMPLETE':
                 images = result.get('generated_images', [])
-                downloaded = []
                 os.makedirs(save_dir, exist_ok=True)
 
-                for i, img in enumerate(images):
-                    url = img.get('url')
-                    if url:
-                        save_path = f"{save_dir}/{generation_id}_{i}.png"
-                        self.leonardo.download_image(url, save_path)
-                        downloaded.append(save_path)
-
-                return downloaded
+                items = [
+                    (img['url'], f"{save_dir}/{generation_id}_{i}.png")
+                    for i, img in enumerate(images)
+                    if img.get('url')
+                ]
+                paths = self.leonardo.download_images(items)
+                return [path for path in paths if path]
         except Exception as e:
             print(f"Download failed: {e}")
 
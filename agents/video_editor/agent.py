@@ -21,8 +21,11 @@ try:
         VoiceModel,
         OutputFormat,
         Voice,
-        GeneratedAudio
+        GeneratedAudio,
+        DEFAULT_AUDIO_CACHE_PATH,
+        AUDIO_CACHE_MAX_BYTES
     )
+    from core.adapters.disk_cache import DiskCache
     ELEVENLABS_AVAILABLE = True
 except ImportError:
     ELEVENLABS_AVAILABLE = False
@@ -135,7 +138,10 @@ class VideoEditorAgent(BaseAgent):
         # ElevenLabs for voice
         if ELEVENLABS_AVAILABLE and os.getenv("ELEVENLABS_API_KEY"):
             try:
-                self.elevenlabs = ElevenLabsAdapter()
+                # Bulk runs and A/B tests often repeat script + voice combinations
+                self.elevenlabs = ElevenLabsAdapter(
+                    audio_cache=DiskCache(DEFAULT_AUDIO_CACHE_PATH, max_bytes=AUDIO_CACHE_MAX_BYTES)
+                )
             except Exception as e:
                 print(f"Warning: Could not initialize ElevenLabs: {e}")
 
@@ -331,7 +337,7 @@ class VideoEditorAgent(BaseAgent):
 
         try:
             # Step 1: Generate audio with ElevenLabs
-            audio = self.elevenlabs.text_to_speech(
+            audio = self.elevenlabs.text_to_speech_chunked(
                 text=script,
                 voice_id=voice_id,
                 model=VoiceModel.ELEVEN_MULTILINGUAL_V2,
@@ -411,7 +417,7 @@ class VideoEditorAgent(BaseAgent):
             )
 
         try:
-            audio = self.elevenlabs.text_to_speech(
+            audio = self.elevenlabs.text_to_speech_chunked(
                 text=script,
                 voice_id=voice_id,
                 model=VoiceModel.ELEVEN_MULTILINGUAL_V2,
@@ -636,7 +642,8 @@ class VideoEditorAgent(BaseAgent):
                 'results': results,
                 'total': len(scripts),
                 'successful': successful,
-                'failed': len(scripts) - successful
+                'failed': len(scripts) - successful,
+                'audio_cache': self.elevenlabs.audio_cache_stats() if self.elevenlabs else None
             },
             message=f"Started {successful}/{len(scripts)} videos"
         )
@@ -730,6 +737,7 @@ class VideoEditorAgent(BaseAgent):
                 usage['elevenlabs'] = self.elevenlabs.get_character_usage()
             except:
                 usage['elevenlabs'] = {'error': 'Failed to get usage'}
+            usage['elevenlabs_cache'] = self.elevenlabs.audio_cache_stats()
 
         if self.heygen:
             try:
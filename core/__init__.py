@@ -9,10 +9,13 @@ from .client_registry import ClientRegistry, Client
 from .funnel_registry import FunnelRegistry, Funnel, FunnelType
 from .data_aggregator import DataAggregator, AggregatedMetrics, FunnelData, ClientData
 from .product_registry import ProductRegistry, FunnelProduct
+from .attribution_engine import AttributionEngine, AttributionReport, TrueRoasRow
+from .campaign_join import CampaignJoin, CampaignJoinResult
 
 # Adapters for external platforms
 from .adapters.meta_ads import MetaAdsAdapter
 from .adapters.hyros import HyrosAdapter
+from .adapters.hyros_snapshot import HyrosSnapshot
 
 # Checkout platform adapters
 from .adapters.checkout import (
@@ -28,6 +31,9 @@ from .adapters.checkout import (
     StripeAdapter,
     WhopAdapter,
     ClickFunnelsAdapter,
+    SalesLedger,
+    SalesTable,
+    CheckoutHub,
 )
 
 __all__ = [
@@ -45,9 +51,15 @@ __all__ = [
     'ClientData',
     'ProductRegistry',
     'FunnelProduct',
+    'AttributionEngine',
+    'AttributionReport',
+    'TrueRoasRow',
+    'CampaignJoin',
+    'CampaignJoinResult',
     # Ads Adapters
     'MetaAdsAdapter',
     'HyrosAdapter',
+    'HyrosSnapshot',
     # Checkout Adapters
     'BaseCheckoutAdapter',
     'Product',
@@ -61,6 +73,9 @@ __all__ = [
     'StripeAdapter',
     'WhopAdapter',
     'ClickFunnelsAdapter',
+    'SalesLedger',
+    'SalesTable',
+    'CheckoutHub',
 ]
 
 __version__ = '1.0.0'
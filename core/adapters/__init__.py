@@ -4,7 +4,8 @@ Connectors for external platforms (Meta, Hyros, Leonardo.ai, ElevenLabs, HeyGen,
 """
 
 from .meta_ads import MetaAdsAdapter
-from .hyros import HyrosAdapter
+from .hyros import HyrosAdapter, HyrosBundle
+from .hyros_snapshot import HyrosSnapshot
 from .leonardo import (
     LeonardoAdapter,
     LeonardoModel,
@@ -23,7 +24,8 @@ from .elevenlabs import (
     VoiceModel,
     OutputFormat,
     Voice,
-    GeneratedAudio
+    GeneratedAudio,
+    ChunkedSpeechError
 )
 from .heygen import (
     HeyGenAdapter,
@@ -40,11 +42,19 @@ from .google_analytics import (
     GAReport,
     get_mock_ga_data
 )
+from .token_cache import TokenCache
+from .disk_cache import DiskCache
+from .response_cache import ResponseCache
+from .job_poller import JobPoller
+from .rate_limit import RateLimiter, retry_with_backoff
+from .media_downloader import MediaDownloader
 
 __all__ = [
     # Meta & Attribution
     'MetaAdsAdapter',
     'HyrosAdapter',
+    'HyrosBundle',
+    'HyrosSnapshot',
     # Image Generation
     'LeonardoAdapter',
     'LeonardoModel',
@@ -62,6 +72,7 @@ __all__ = [
     'OutputFormat',
     'Voice',
     'GeneratedAudio',
+    'ChunkedSpeechError',
     # Avatar Lip Sync
     'HeyGenAdapter',
     'HeyGenAspectRatio',
@@ -74,5 +85,13 @@ __all__ = [
     'GAMetric',
     'GADimension',
     'GAReport',
-    'get_mock_ga_data'
+    'get_mock_ga_data',
+    # Shared utilities
+    'TokenCache',
+    'DiskCache',
+    'ResponseCache',
+    'JobPoller',
+    'RateLimiter',
+    'retry_with_backoff',
+    'MediaDownloader',
 ]
@@ -9,6 +9,10 @@ from .kiwify import KiwifyAdapter
 from .stripe import StripeAdapter
 from .whop import WhopAdapter
 from .clickfunnels import ClickFunnelsAdapter
+from .ledger import SalesLedger
+from .sales_table import SalesTable
+from .webhooks import WebhookReceiver
+from .hub import CheckoutHub
 
 __all__ = [
     # Base
@@ -25,4 +29,9 @@ __all__ = [
     'StripeAdapter',
     'WhopAdapter',
     'ClickFunnelsAdapter',
+    'CheckoutHub',
+    # Local storage
+    'SalesLedger',
+    'SalesTable',
+    'WebhookReceiver',
 ]
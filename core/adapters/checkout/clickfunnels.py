@@ -4,11 +4,12 @@ Integration with ClickFunnels 2.0 checkout/funnel platform
 """
 
 import requests
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 from datetime import datetime
 
+from ..timestamps import parse_timestamp
 from .base import (
-    BaseCheckoutAdapter, Product, Offer, Sale, CheckoutMetrics,
+    BaseCheckoutAdapter, Product, Offer, Sale,
     PaymentStatus, ProductType
 )
 
@@ -88,7 +89,7 @@ class ClickFunnelsAdapter(BaseCheckoutAdapter):
             'response': result
         }
 
-    def get_products(self) -> List[Product]:
+    def get_products(self, errors: Optional[List[str]] = None) -> List[Product]:
         """Fetch all products from ClickFunnels"""
         if not self.workspace_id:
             return []
@@ -96,6 +97,8 @@ class ClickFunnelsAdapter(BaseCheckoutAdapter):
         result = self._request(f'/workspaces/{self.workspace_id}/products')
 
         if 'error' in result:
+            if errors is not None:
+                errors.append(str(result['error']))
             return []
 
         products = []
@@ -232,8 +235,23 @@ class ClickFunnelsAdapter(BaseCheckoutAdapter):
         status: Optional[str] = None
     ) -> List[Dict]:
         """Fetch orders from ClickFunnels"""
+        return list(self.iter_orders(start_date, end_date, status))
+
+    def iter_orders(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        status: Optional[str] = None,
+        errors: Optional[List[str]] = None
+    ) -> Iterator[Dict]:
+        """
+        Stream every order of a period.
+
+        Pages with the `after` cursor (id of the last order seen) until
+        an empty page.
+        """
         if not self.workspace_id:
-            return []
+            return
 
         params = {'per_page': 100}
 
@@ -245,15 +263,26 @@ class ClickFunnelsAdapter(BaseCheckoutAdapter):
         if end_date:
             params['filter[created_at_lte]'] = end_date.isoformat()
 
-        result = self._request(
-            f'/workspaces/{self.workspace_id}/orders',
-            params=params
-        )
+        while True:
+            result = self._request(
+                f'/workspaces/{self.workspace_id}/orders',
+                params=params
+            )
 
-        if 'error' in result:
-            return []
+            if isinstance(result, dict) and 'error' in result:
+                if errors is not None:
+                    errors.append(str(result['error']))
+                return
 
-        return result if isinstance(result, list) else result.get('data', [])
+            orders = result if isinstance(result, list) else result.get('data', [])
+            if not orders:
+                return
+            yield from orders
+
+            last_id = orders[-1].get('id')
+            if last_id is None:
+                return
+            params = {**params, 'after': last_id}
 
     def get_sales(
         self,
@@ -263,6 +292,17 @@ class ClickFunnelsAdapter(BaseCheckoutAdapter):
         status: Optional[PaymentStatus] = None
     ) -> List[Sale]:
         """Fetch sales/orders from ClickFunnels"""
+        return list(self.iter_sales(start_date, end_date, product_id, status))
+
+    def iter_sales(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        product_id: Optional[str] = None,
+        status: Optional[PaymentStatus] = None,
+        errors: Optional[List[str]] = None
+    ) -> Iterator[Sale]:
+        """Stream every sale/order of a period"""
         # Map PaymentStatus to CF status
         cf_status = None
         if status:
@@ -274,19 +314,14 @@ class ClickFunnelsAdapter(BaseCheckoutAdapter):
             }
             cf_status = status_map.get(status)
 
-        orders = self.get_orders(start_date, end_date, cf_status)
-
-        sales = []
-        for order in orders:
+        for order in self.iter_orders(start_date, end_date, cf_status, errors):
             sale = self._parse_sale(order)
 
             # Filter by product if specified
             if product_id and sale.product_id != product_id:
                 continue
 
-            sales.append(sale)
-
-        return sales
+            yield sale
 
     def _parse_sale(self, data: Dict) -> Sale:
         """Parse ClickFunnels order as sale"""
@@ -310,15 +345,7 @@ class ClickFunnelsAdapter(BaseCheckoutAdapter):
         amount = float(attrs.get('total_amount', 0)) / 100
 
         # Parse date
-        created_str = attrs.get('created_at', '')
-        created_at = None
-        if created_str:
-            try:
-                created_at = datetime.fromisoformat(
-                    created_str.replace('Z', '+00:00')
-                )
-            except Exception:
-                pass
+        created_at = parse_timestamp(attrs.get('created_at', ''))
 
         # Get contact/customer info
         contact = attrs.get('contact', {}) or {}
@@ -357,68 +384,6 @@ class ClickFunnelsAdapter(BaseCheckoutAdapter):
             raw_data=data
         )
 
-    def get_metrics(
-        self,
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
-    ) -> CheckoutMetrics:
-        """Get aggregated checkout metrics"""
-        sales = self.get_sales(start_date, end_date)
-
-        metrics = CheckoutMetrics(
-            platform=self.platform_name,
-            period_start=start_date,
-            period_end=end_date
-        )
-
-        for sale in sales:
-            metrics.total_sales += 1
-
-            if sale.status == PaymentStatus.APPROVED:
-                metrics.approved_sales += 1
-                metrics.gross_revenue += sale.amount
-                metrics.net_revenue += sale.net_amount
-            elif sale.status == PaymentStatus.REFUNDED:
-                metrics.refunded_sales += 1
-                metrics.refunded_amount += sale.amount
-            elif sale.status == PaymentStatus.CHARGEBACK:
-                metrics.chargeback_sales += 1
-
-            # Group by product
-            if sale.product_id:
-                if sale.product_id not in metrics.products:
-                    metrics.products[sale.product_id] = {
-                        'name': sale.product_name,
-                        'sales': 0,
-                        'revenue': 0
-                    }
-                metrics.products[sale.product_id]['sales'] += 1
-                metrics.products[sale.product_id]['revenue'] += sale.amount
-
-            # Group by funnel
-            if sale.funnel_tag:
-                if sale.funnel_tag not in metrics.by_funnel:
-                    metrics.by_funnel[sale.funnel_tag] = {'sales': 0, 'revenue': 0}
-                metrics.by_funnel[sale.funnel_tag]['sales'] += 1
-                metrics.by_funnel[sale.funnel_tag]['revenue'] += sale.amount
-
-            # Group by UTM source
-            if sale.utm_source:
-                if sale.utm_source not in metrics.by_utm_source:
-                    metrics.by_utm_source[sale.utm_source] = {'sales': 0, 'revenue': 0}
-                metrics.by_utm_source[sale.utm_source]['sales'] += 1
-                metrics.by_utm_source[sale.utm_source]['revenue'] += sale.amount
-
-            # Group by UTM campaign
-            if sale.utm_campaign:
-                if sale.utm_campaign not in metrics.by_utm_campaign:
-                    metrics.by_utm_campaign[sale.utm_campaign] = {'sales': 0, 'revenue': 0}
-                metrics.by_utm_campaign[sale.utm_campaign]['sales'] += 1
-                metrics.by_utm_campaign[sale.utm_campaign]['revenue'] += sale.amount
-
-        metrics.calculate_derived()
-        return metrics
-
     def get_contacts(
         self,
         start_date: Optional[datetime] = None,
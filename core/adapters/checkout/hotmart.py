@@ -3,12 +3,14 @@ Hotmart Adapter
 Integration with Hotmart checkout platform
 """
 
+import base64
 import requests
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 
+from ..token_cache import TokenCache
 from .base import (
-    BaseCheckoutAdapter, Product, Offer, Sale, CheckoutMetrics,
+    BaseCheckoutAdapter, Product, Offer, Sale,
     PaymentStatus, ProductType
 )
 
@@ -31,43 +33,95 @@ class HotmartAdapter(BaseCheckoutAdapter):
 
     platform_name = "hotmart"
     base_url = "https://developers.hotmart.com/payments/api/v1"
+    token_url = "https://api-sec-vlc.hotmart.com/security/oauth/token"
 
     def __init__(
         self,
         api_key: str,
         client_id: str = "",
         client_secret: str = "",
+        token_cache: Optional[TokenCache] = None,
         **kwargs
     ):
+        """
+        Args:
+            api_key: Hotmart "Basic" credential (or a raw access token
+                when client_id/client_secret are not set)
+            client_id: OAuth client id
+            client_secret: OAuth client secret
+            token_cache: Token cache to use (defaults to the process-wide
+                cache, so instances with the same client_id share a token)
+        """
         super().__init__(api_key, **kwargs)
         self.client_id = client_id
         self.client_secret = client_secret
-        self._access_token = None
+        self.token_cache = token_cache or TokenCache.shared()
+
+    @property
+    def _token_key(self) -> str:
+        return f"{self.platform_name}:{self.client_id}"
 
     def _get_access_token(self) -> str:
-        """Get OAuth access token"""
-        if self._access_token:
-            return self._access_token
+        """Get OAuth access token (cached until shortly before expiry)"""
+        if not (self.client_id and self.client_secret):
+            # No OAuth credentials: api_key is used as the bearer token
+            return self.api_key
+
+        return self.token_cache.get(self._token_key, self._fetch_access_token)
+
+    def _fetch_access_token(self) -> Tuple[str, int]:
+        """
+        Run the client-credentials exchange.
+
+        Returns:
+            Tuple of (access token, expires_in seconds)
+
+        Raises:
+            requests.HTTPError: If Hotmart rejects the credentials
+        """
+        basic = self.api_key or base64.b64encode(
+            f"{self.client_id}:{self.client_secret}".encode()
+        ).decode()
+        if basic.startswith('Basic '):
+            basic = basic[len('Basic '):]
+
+        response = requests.post(
+            self.token_url,
+            headers={'Authorization': f'Basic {basic}'},
+            params={
+                'grant_type': 'client_credentials',
+                'client_id': self.client_id,
+                'client_secret': self.client_secret
+            },
+            timeout=30
+        )
+        response.raise_for_status()
 
-        # TODO: Implement OAuth flow with Hotmart
-        # For now, use API key directly
-        return self.api_key
+        data = response.json()
+        return data['access_token'], int(data.get('expires_in', 3600))
 
     def _request(self, endpoint: str, params: Optional[Dict] = None, method: str = "GET") -> Dict:
         """Make API request to Hotmart"""
         url = f"{self.base_url}{endpoint}"
-        headers = {
-            'Authorization': f'Bearer {self._get_access_token()}',
-            'Content-Type': 'application/json'
-        }
 
         try:
-            if method == "GET":
-                response = requests.get(url, headers=headers, params=params)
-            else:
-                response = requests.post(url, headers=headers, json=params)
+            for attempt in range(2):
+                headers = {
+                    'Authorization': f'Bearer {self._get_access_token()}',
+                    'Content-Type': 'application/json'
+                }
+
+                if method == "GET":
+                    response = requests.get(url, headers=headers, params=params)
+                else:
+                    response = requests.post(url, headers=headers, json=params)
+
+                # Token revoked or expired early: mint a new one once
+                if response.status_code == 401 and attempt == 0 and self.client_id and self.client_secret:
+                    self.token_cache.invalidate(self._token_key)
+                    continue
 
-            return response.json()
+                return response.json()
         except Exception as e:
             return {'error': str(e)}
 
@@ -83,11 +137,13 @@ class HotmartAdapter(BaseCheckoutAdapter):
             'response': result
         }
 
-    def get_products(self) -> List[Product]:
+    def get_products(self, errors: Optional[List[str]] = None) -> List[Product]:
         """Fetch all products from Hotmart"""
         result = self._request('/products')
 
         if 'error' in result:
+            if errors is not None:
+                errors.append(str(result['error']))
             return []
 
         products = []
@@ -159,7 +215,19 @@ class HotmartAdapter(BaseCheckoutAdapter):
         status: Optional[PaymentStatus] = None
     ) -> List[Sale]:
         """Fetch sales/transactions from Hotmart"""
-        params = {}
+        return list(self.iter_sales(start_date, end_date, product_id, status))
+
+    def iter_sales(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        product_id: Optional[str] = None,
+        status: Optional[PaymentStatus] = None,
+        errors: Optional[List[str]] = None,
+        page_size: int = 500
+    ) -> Iterator[Sale]:
+        """Stream every sale of a period, following `page_info.next_page_token`"""
+        params = {'max_results': page_size}
 
         if start_date:
             params['start_date'] = int(start_date.timestamp() * 1000)  # Hotmart uses milliseconds
@@ -180,16 +248,21 @@ class HotmartAdapter(BaseCheckoutAdapter):
             }
             params['transaction_status'] = status_map.get(status, 'APPROVED')
 
-        result = self._request('/sales/history', params)
+        while True:
+            result = self._request('/sales/history', params)
 
-        if 'error' in result:
-            return []
+            if 'error' in result:
+                if errors is not None:
+                    errors.append(str(result['error']))
+                return
 
-        sales = []
-        for item in result.get('items', []):
-            sales.append(self._parse_sale(item))
+            for item in result.get('items', []):
+                yield self._parse_sale(item)
 
-        return sales
+            next_token = (result.get('page_info') or {}).get('next_page_token')
+            if not next_token or not result.get('items'):
+                return
+            params = {**params, 'page_token': next_token}
 
     def _parse_sale(self, data: Dict) -> Sale:
         """Parse Hotmart sale data"""
@@ -239,57 +312,3 @@ class HotmartAdapter(BaseCheckoutAdapter):
             net_amount=price - (price * 0.099) - commission,
             raw_data=data
         )
-
-    def get_metrics(
-        self,
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
-    ) -> CheckoutMetrics:
-        """Get aggregated checkout metrics"""
-        sales = self.get_sales(start_date, end_date)
-
-        metrics = CheckoutMetrics(
-            platform=self.platform_name,
-            period_start=start_date,
-            period_end=end_date
-        )
-
-        for sale in sales:
-            metrics.total_sales += 1
-
-            if sale.status == PaymentStatus.APPROVED:
-                metrics.approved_sales += 1
-                metrics.gross_revenue += sale.amount
-                metrics.net_revenue += sale.net_amount
-            elif sale.status == PaymentStatus.REFUNDED:
-                metrics.refunded_sales += 1
-                metrics.refunded_amount += sale.amount
-            elif sale.status == PaymentStatus.CHARGEBACK:
-                metrics.chargeback_sales += 1
-
-            # Group by product
-            if sale.product_id not in metrics.products:
-                metrics.products[sale.product_id] = {
-                    'name': sale.product_name,
-                    'sales': 0,
-                    'revenue': 0
-                }
-            metrics.products[sale.product_id]['sales'] += 1
-            metrics.products[sale.product_id]['revenue'] += sale.amount
-
-            # Group by UTM source
-            if sale.utm_source:
-                if sale.utm_source not in metrics.by_utm_source:
-                    metrics.by_utm_source[sale.utm_source] = {'sales': 0, 'revenue': 0}
-                metrics.by_utm_source[sale.utm_source]['sales'] += 1
-                metrics.by_utm_source[sale.utm_source]['revenue'] += sale.amount
-
-            # Group by funnel tag
-            if sale.funnel_tag:
-                if sale.funnel_tag not in metrics.by_funnel:
-                    metrics.by_funnel[sale.funnel_tag] = {'sales': 0, 'revenue': 0}
-                metrics.by_funnel[sale.funnel_tag]['sales'] += 1
-                metrics.by_funnel[sale.funnel_tag]['revenue'] += sale.amount
-
-        metrics.calculate_derived()
-        return metrics
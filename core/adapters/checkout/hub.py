@@ -0,0 +1,243 @@
+"""
+Checkout Hub
+Concurrent fan-out over several checkout platforms with cross-platform dedupe
+"""
+
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .base import BaseCheckoutAdapter, CheckoutMetrics, Sale
+from .sales_table import SalesTable
+
+
+class CheckoutHub:
+    """
+    Merges sales from every checkout platform a client sells through.
+
+    Adapters are queried concurrently, sales are converted to a single
+    base currency, and transactions reported by more than one platform
+    are collapsed into one. When a sale appears twice, the copy from the
+    adapter listed first wins.
+
+    A sale is a duplicate when it shares an explicit order reference
+    (Sale.order_refs, e.g. a Stripe payment_intent in a Whop payment) with
+    a kept sale from another platform, or when the same customer email
+    paid the same amount within `dedupe_window` on another platform.
+    Platform ids are only compared within their own platform, since
+    unrelated platforms can reuse the same id, and records of one
+    platform sharing a ref (a failed charge and its successful retry) are
+    all kept. Ledger-backed sales keep their order refs.
+
+    Usage:
+        hub = CheckoutHub(
+            [HotmartAdapter(...), StripeAdapter(...), WhopAdapter(...)],
+            base_currency="BRL",
+            fx_rates={"USD": 5.0}
+        )
+        metrics = hub.get_metrics(start_date, end_date)
+    """
+
+    platform_name = "all"
+
+    def __init__(
+        self,
+        adapters: List[BaseCheckoutAdapter],
+        base_currency: str = "BRL",
+        fx_rates: Optional[Dict[str, float]] = None,
+        dedupe_window: timedelta = timedelta(minutes=10),
+        max_workers: Optional[int] = None
+    ):
+        """
+        Args:
+            adapters: Configured adapters, in dedupe priority order
+            base_currency: Currency every sale is converted to
+            fx_rates: Units of base currency per unit of each other currency
+            dedupe_window: Max time between matching email+amount sales
+            max_workers: Platforms fetched at once (defaults to all)
+        """
+        self.adapters = adapters
+        self.base_currency = base_currency.upper()
+        self.fx_rates = {code.upper(): rate for code, rate in (fx_rates or {}).items()}
+        self.fx_rates[self.base_currency] = 1.0
+        self.dedupe_window = dedupe_window
+        self.max_workers = max_workers
+
+    def get_sales(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[Sale]:
+        """
+        Fetch, normalize and dedupe sales from all adapters.
+
+        Args:
+            start_date: Filter from this date
+            end_date: Filter until this date
+
+        Returns:
+            List of Sale objects in base currency, without cross-posted duplicates
+        """
+        return list(self.iter_sales(start_date, end_date))
+
+    def iter_sales(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> Iterator[Sale]:
+        """Stream merged sales (see get_sales)"""
+        results = self._fetch_all(start_date, end_date)
+
+        # dedupe key -> platform of the kept sale that claimed it
+        seen_refs: Dict[str, str] = {}
+        seen_fingerprints: Dict[str, List[Tuple[float, str]]] = {}
+        window = self.dedupe_window.total_seconds()
+        warned = set()
+
+        for adapter in self.adapters:
+            for sale in results.get(id(adapter), ()):
+                sale = self._normalize(sale, warned)
+
+                refs = self._order_refs(sale)
+                if any(self._claimed(seen_refs, key, sale.platform) for key in refs):
+                    continue
+
+                fingerprint = self._fingerprint(sale)
+                if fingerprint is not None:
+                    timestamp = sale.created_at.timestamp()
+                    times = seen_fingerprints.setdefault(fingerprint, [])
+                    # Repeat purchases on the same platform are genuine
+                    if any(
+                        platform != sale.platform and abs(timestamp - seen) <= window
+                        for seen, platform in times
+                    ):
+                        self._claim(seen_refs, refs, sale.platform)
+                        continue
+                    times.append((timestamp, sale.platform))
+
+                self._claim(seen_refs, refs, sale.platform)
+                yield sale
+
+    def get_metrics(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> CheckoutMetrics:
+        """
+        Get consolidated checkout metrics across all platforms.
+
+        Args:
+            start_date: Start of period
+            end_date: End of period
+
+        Returns:
+            CheckoutMetrics in base currency, with platform "all"
+        """
+        return CheckoutMetrics.from_sales(
+            self.platform_name, self.iter_sales(start_date, end_date), start_date, end_date
+        )
+
+    def get_sales_table(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> SalesTable:
+        """Merged, deduplicated sales as a columnar SalesTable"""
+        return SalesTable.from_sales(self.iter_sales(start_date, end_date))
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    def _fetch_all(
+        self,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime]
+    ) -> Dict[int, List[Sale]]:
+        """Fetch every adapter concurrently; failing platforms are skipped"""
+        adapters = [adapter for adapter in self.adapters if adapter.is_configured()]
+        if not adapters:
+            return {}
+
+        workers = self.max_workers or len(adapters)
+        results = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                id(adapter): (adapter, executor.submit(self._fetch, adapter, start_date, end_date))
+                for adapter in adapters
+            }
+            for key, (adapter, future) in futures.items():
+                try:
+                    results[key] = future.result()
+                except Exception as e:
+                    print(f"Warning: {adapter.platform_name} sales unavailable: {e}")
+        return results
+
+    @staticmethod
+    def _fetch(
+        adapter: BaseCheckoutAdapter,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime]
+    ) -> List[Sale]:
+        if adapter.ledger_covers(start_date, end_date):
+            return list(adapter.ledger.query_sales(adapter.platform_name, start_date, end_date))
+        return list(adapter.iter_sales(start_date, end_date))
+
+    def _normalize(self, sale: Sale, warned: set) -> Sale:
+        """Convert a sale's amounts to the base currency"""
+        currency = (sale.currency or self.base_currency).upper()
+        if currency == self.base_currency:
+            return sale
+
+        rate = self.fx_rates.get(currency)
+        if rate is None:
+            if currency not in warned:
+                warned.add(currency)
+                print(f"Warning: no FX rate for {currency}, keeping original amounts")
+            return sale
+
+        return replace(
+            sale,
+            amount=sale.amount * rate,
+            currency=self.base_currency,
+            platform_fee=sale.platform_fee * rate,
+            affiliate_commission=sale.affiliate_commission * rate,
+            net_amount=sale.net_amount * rate
+        )
+
+    @staticmethod
+    def _order_refs(sale: Sale) -> Tuple[str, ...]:
+        """
+        Keys a cross-posted copy of this sale could share: its own id,
+        namespaced by platform, plus its explicit cross-platform refs
+        """
+        refs = [f"{sale.platform}:{sale.id}"] if sale.id else []
+        refs.extend(f"ref:{ref}" for ref in sale.order_refs)
+        return tuple(refs)
+
+    @staticmethod
+    def _claimed(seen_refs: Dict[str, str], key: str, platform: str) -> bool:
+        """Whether a key marks this sale as a copy of one already kept"""
+        owner = seen_refs.get(key)
+        if owner is None:
+            return False
+        # Own ids are namespaced by platform, so a match is the same record
+        return owner != platform or not key.startswith('ref:')
+
+    @staticmethod
+    def _claim(seen_refs: Dict[str, str], refs: Tuple[str, ...], platform: str):
+        for key in refs:
+            seen_refs.setdefault(key, platform)
+
+    @staticmethod
+    def _fingerprint(sale: Sale) -> Optional[str]:
+        """Hash of customer email + amount in cents + status; None if incomplete"""
+        if not sale.customer_email or not sale.created_at:
+            return None
+        cents = int(round(sale.amount * 100))
+        if cents <= 0:
+            return None
+        key = f"{sale.customer_email.strip().lower()}|{cents}|{sale.status.value}"
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()
@@ -4,11 +4,12 @@ Integration with Kiwify checkout platform
 """
 
 import requests
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 from datetime import datetime
 
+from ..timestamps import parse_timestamp
 from .base import (
-    BaseCheckoutAdapter, Product, Offer, Sale, CheckoutMetrics,
+    BaseCheckoutAdapter, Product, Offer, Sale,
     PaymentStatus, ProductType
 )
 
@@ -27,6 +28,7 @@ class KiwifyAdapter(BaseCheckoutAdapter):
 
     platform_name = "kiwify"
     base_url = "https://api.kiwify.com.br/v1"
+    max_concurrent_requests = 3  # Kiwify allows ~100 requests/minute
 
     def __init__(self, api_key: str, **kwargs):
         super().__init__(api_key, **kwargs)
@@ -61,19 +63,31 @@ class KiwifyAdapter(BaseCheckoutAdapter):
             'response': result
         }
 
-    def get_products(self) -> List[Product]:
+    def get_products(self, page_size: int = 100, errors: Optional[List[str]] = None) -> List[Product]:
         """Fetch all products from Kiwify"""
-        result = self._request('/products')
-
-        if 'error' in result:
-            return []
+        pages = self._iter_pages(
+            lambda page: self._request('/products', {'page_size': page_size, 'page_number': page}),
+            self._total_pages,
+            errors=errors
+        )
 
         products = []
-        for item in result.get('data', []):
-            products.append(self._parse_product(item))
+        for result in pages:
+            for item in result.get('data', []):
+                products.append(self._parse_product(item))
 
         return products
 
+    @staticmethod
+    def _total_pages(result: Dict) -> int:
+        """Derive page count from Kiwify's count/page_size pagination block"""
+        pagination = result.get('pagination', {})
+        count = pagination.get('count', 0)
+        page_size = pagination.get('page_size', 0)
+        if not count or not page_size:
+            return 1
+        return -(-count // page_size)
+
     def get_product(self, product_id: str) -> Optional[Product]:
         """Fetch a specific product"""
         result = self._request(f'/products/{product_id}')
@@ -134,10 +148,23 @@ class KiwifyAdapter(BaseCheckoutAdapter):
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         product_id: Optional[str] = None,
-        status: Optional[PaymentStatus] = None
+        status: Optional[PaymentStatus] = None,
+        page_size: int = 100
     ) -> List[Sale]:
         """Fetch sales from Kiwify"""
-        params = {}
+        return list(self.iter_sales(start_date, end_date, product_id, status, page_size))
+
+    def iter_sales(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        product_id: Optional[str] = None,
+        status: Optional[PaymentStatus] = None,
+        page_size: int = 100,
+        errors: Optional[List[str]] = None
+    ) -> Iterator[Sale]:
+        """Stream sales from Kiwify page by page"""
+        params = {'page_size': page_size}
 
         if start_date:
             params['start_date'] = start_date.strftime('%Y-%m-%d')
@@ -158,16 +185,15 @@ class KiwifyAdapter(BaseCheckoutAdapter):
             }
             params['status'] = status_map.get(status, 'paid')
 
-        result = self._request('/orders', params)
-
-        if 'error' in result:
-            return []
-
-        sales = []
-        for item in result.get('data', []):
-            sales.append(self._parse_sale(item))
+        pages = self._iter_pages(
+            lambda page: self._request('/orders', {**params, 'page_number': page}),
+            self._total_pages,
+            errors=errors
+        )
 
-        return sales
+        for result in pages:
+            for item in result.get('data', []):
+                yield self._parse_sale(item)
 
     def _parse_sale(self, data: Dict) -> Sale:
         """Parse Kiwify sale data"""
@@ -190,8 +216,7 @@ class KiwifyAdapter(BaseCheckoutAdapter):
         amount = float(data.get('amount', 0)) / 100
 
         # Parse date
-        created_str = data.get('created_at', '')
-        created_at = datetime.fromisoformat(created_str.replace('Z', '+00:00')) if created_str else None
+        created_at = parse_timestamp(data.get('created_at', ''))
 
         return Sale(
             id=str(data.get('id', '')),
@@ -213,50 +238,3 @@ class KiwifyAdapter(BaseCheckoutAdapter):
             net_amount=amount * 0.9101,
             raw_data=data
         )
-
-    def get_metrics(
-        self,
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
-    ) -> CheckoutMetrics:
-        """Get aggregated checkout metrics"""
-        sales = self.get_sales(start_date, end_date)
-
-        metrics = CheckoutMetrics(
-            platform=self.platform_name,
-            period_start=start_date,
-            period_end=end_date
-        )
-
-        for sale in sales:
-            metrics.total_sales += 1
-
-            if sale.status == PaymentStatus.APPROVED:
-                metrics.approved_sales += 1
-                metrics.gross_revenue += sale.amount
-                metrics.net_revenue += sale.net_amount
-            elif sale.status == PaymentStatus.REFUNDED:
-                metrics.refunded_sales += 1
-                metrics.refunded_amount += sale.amount
-            elif sale.status == PaymentStatus.CHARGEBACK:
-                metrics.chargeback_sales += 1
-
-            # Group by product
-            if sale.product_id not in metrics.products:
-                metrics.products[sale.product_id] = {
-                    'name': sale.product_name,
-                    'sales': 0,
-                    'revenue': 0
-                }
-            metrics.products[sale.product_id]['sales'] += 1
-            metrics.products[sale.product_id]['revenue'] += sale.amount
-
-            # Group by UTM
-            if sale.utm_source:
-                if sale.utm_source not in metrics.by_utm_source:
-                    metrics.by_utm_source[sale.utm_source] = {'sales': 0, 'revenue': 0}
-                metrics.by_utm_source[sale.utm_source]['sales'] += 1
-                metrics.by_utm_source[sale.utm_source]['revenue'] += sale.amount
-
-        metrics.calculate_derived()
-        return metrics
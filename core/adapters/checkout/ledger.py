@@ -0,0 +1,572 @@
+"""
+Sales Ledger
+Durable local store of checkout sales with incremental sync per platform
+"""
+
+import sqlite3
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from .base import BaseCheckoutAdapter, Sale, CheckoutMetrics, PaymentStatus
+
+
+SALE_COLUMNS = (
+    'platform', 'id', 'product_id', 'product_name', 'offer_id',
+    'amount', 'currency', 'status', 'payment_method',
+    'customer_email', 'customer_name',
+    'utm_source', 'utm_medium', 'utm_campaign', 'utm_content',
+    'funnel_tag', 'created_at', 'approved_at',
+    'platform_fee', 'affiliate_commission', 'net_amount', 'order_refs'
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sales (
+    platform TEXT NOT NULL,
+    id TEXT NOT NULL,
+    product_id TEXT,
+    product_name TEXT,
+    offer_id TEXT,
+    amount REAL DEFAULT 0,
+    currency TEXT,
+    status TEXT,
+    payment_method TEXT,
+    customer_email TEXT,
+    customer_name TEXT,
+    utm_source TEXT,
+    utm_medium TEXT,
+    utm_campaign TEXT,
+    utm_content TEXT,
+    funnel_tag TEXT,
+    created_at INTEGER,
+    approved_at INTEGER,
+    platform_fee REAL DEFAULT 0,
+    affiliate_commission REAL DEFAULT 0,
+    net_amount REAL DEFAULT 0,
+    order_refs TEXT,
+    PRIMARY KEY (platform, id)
+);
+CREATE INDEX IF NOT EXISTS idx_sales_platform_created ON sales (platform, created_at);
+CREATE TABLE IF NOT EXISTS sync_state (
+    platform TEXT PRIMARY KEY,
+    high_watermark INTEGER,
+    synced_at INTEGER,
+    low_watermark INTEGER
+);
+CREATE TABLE IF NOT EXISTS webhook_events (
+    platform TEXT NOT NULL,
+    event_id TEXT NOT NULL,
+    received_at INTEGER,
+    PRIMARY KEY (platform, event_id)
+);
+"""
+
+# Sales written per transaction while a sync streams pages in
+SYNC_BATCH_SIZE = 1000
+
+# Lifecycle order of sale statuses; a webhook never moves a sale backwards
+STATUS_RANK = {
+    PaymentStatus.PENDING.value: 0,
+    PaymentStatus.APPROVED.value: 1,
+    PaymentStatus.CANCELLED.value: 1,
+    PaymentStatus.EXPIRED.value: 1,
+    PaymentStatus.REFUNDED.value: 2,
+    PaymentStatus.CHARGEBACK.value: 3,
+}
+
+
+def _to_ms(value: Optional[datetime]) -> Optional[int]:
+    return int(value.timestamp() * 1000) if value else None
+
+
+def _from_ms(value: Optional[int]) -> Optional[datetime]:
+    return datetime.fromtimestamp(value / 1000) if value is not None else None
+
+
+class SalesLedger:
+    """
+    Local SQLite ledger of sales from all checkout platforms.
+
+    Sales are upserted by (platform, id). Each platform keeps the range
+    of created_at it has fully synced: the low watermark (0 for the whole
+    history) and the high watermark (start of the last complete sync). A
+    sync pages through the whole API listing from the high watermark,
+    minus a lookback that picks up late status changes such as refunds
+    and chargebacks, and backfills when a period before the low watermark
+    is requested. A watermark only moves when its listing completed
+    without errors, so a failed or partial sync is retried rather than
+    leaving a gap. Metrics are then answered with indexed queries instead
+    of re-downloading the period; use covers() before trusting a range.
+
+    Platforms fed by the webhook receiver are still polled, since a
+    webhook can be lost; while pushes keep arriving they are polled every
+    push_sync_interval instead of every sync_interval.
+
+    Usage:
+        ledger = SalesLedger.for_client("brez-scales")
+        adapter = HotmartAdapter(api_key="...", ledger=ledger)
+        metrics = adapter.get_metrics(start_date, end_date)  # synced tail + local query
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        sync_interval: timedelta = timedelta(minutes=5),
+        lookback: timedelta = timedelta(days=7),
+        push_sync_interval: Optional[timedelta] = timedelta(hours=1)
+    ):
+        """
+        Args:
+            db_path: Path to the SQLite database file
+            sync_interval: Minimum time between API syncs of a platform
+            lookback: How far before the watermark each sync re-reads
+            push_sync_interval: Minimum time between API syncs of a
+                platform that delivered a webhook within this interval
+                (None polls every platform at sync_interval)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.sync_interval = sync_interval
+        self.lookback = lookback
+        self.push_sync_interval = push_sync_interval
+
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(SCHEMA)
+            columns = {row[1] for row in conn.execute('PRAGMA table_info(sync_state)')}
+            if 'low_watermark' not in columns:
+                # Ledgers created before coverage tracking: backfilled on next use
+                conn.execute('ALTER TABLE sync_state ADD COLUMN low_watermark INTEGER')
+            columns = {row[1] for row in conn.execute('PRAGMA table_info(sales)')}
+            if 'order_refs' not in columns:
+                # Filled in as the lookback re-reads recent sales
+                conn.execute('ALTER TABLE sales ADD COLUMN order_refs TEXT')
+
+    @classmethod
+    def for_client(cls, client_slug: str, base_path: str = "clients", **kwargs) -> 'SalesLedger':
+        """Open the ledger stored under clients/<slug>/data/"""
+        return cls(str(Path(base_path) / client_slug / "data" / "sales_ledger.db"), **kwargs)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a short-lived connection, committing on success"""
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+
+    def upsert_sales(self, sales: Iterable[Sale]) -> int:
+        """
+        Insert or update sales by (platform, id).
+
+        Returns:
+            Number of sales written
+        """
+        rows = [self._sale_to_row(sale) for sale in sales if sale.id]
+        if not rows:
+            return 0
+
+        with self._connect() as conn:
+            self._upsert_rows(conn, rows)
+
+        return len(rows)
+
+    def ingest_event(self, platform: str, event_id: str, sale: Sale) -> str:
+        """
+        Record a webhook delivery and upsert its sale in one transaction.
+
+        Events can arrive out of order, so a sale whose stored status is
+        further along its lifecycle (e.g. refunded) isn't moved back by an
+        older event (e.g. approved). The next sync still reconciles it
+        with the API.
+
+        Returns:
+            'stored', 'duplicate' (event already ingested) or 'stale'
+            (recorded, but the sale already has a later status)
+        """
+        with self._connect() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            if not self._record_event(conn, platform, event_id):
+                return 'duplicate'
+
+            stored = self._stored_status(conn, sale.platform, sale.id)
+            if stored and STATUS_RANK.get(stored, 0) > STATUS_RANK.get(sale.status.value, 0):
+                return 'stale'
+
+            self._upsert_rows(conn, [self._sale_to_row(sale)])
+            return 'stored'
+
+    def ingest_status_event(self, platform: str, event_id: str, sale_id: str, status: PaymentStatus) -> str:
+        """
+        Record a webhook delivery that only changes a stored sale's status
+        (e.g. a Stripe dispute on a charge), in one transaction.
+
+        Returns:
+            'stored', 'duplicate', 'stale' (the sale already has a later
+            status) or 'unknown_sale' (recorded; the next sync brings the
+            sale in with its current status)
+        """
+        with self._connect() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            if not self._record_event(conn, platform, event_id):
+                return 'duplicate'
+
+            stored = self._stored_status(conn, platform, sale_id)
+            if stored is None:
+                return 'unknown_sale'
+            if STATUS_RANK.get(stored, 0) > STATUS_RANK.get(status.value, 0):
+                return 'stale'
+
+            conn.execute(
+                "UPDATE sales SET status = ? WHERE platform = ? AND id = ?",
+                (status.value, platform, sale_id)
+            )
+            return 'stored'
+
+    def sync(
+        self,
+        adapter: BaseCheckoutAdapter,
+        force: bool = False,
+        start_date: Optional[datetime] = None
+    ) -> int:
+        """
+        Pull new and recently changed sales from a platform.
+
+        Args:
+            adapter: Checkout adapter to sync from
+            force: Sync even if the platform was synced within sync_interval
+            start_date: Oldest sale the caller needs (None for the whole
+                history); periods before the covered range are backfilled
+
+        Returns:
+            Number of sales written
+        """
+        platform = adapter.platform_name
+        low, high, synced_at = self._get_state(platform)
+        requested = _to_ms(start_date) or 0
+
+        now = time.time()
+        now_ms = int(now * 1000)
+        covered = low is not None and high is not None
+        backfill = not covered or requested < low
+
+        if not force and not backfill:
+            interval = self.sync_interval
+            last_push = self.get_last_push(platform)
+            if self.push_sync_interval and last_push and now - last_push.timestamp() < self.push_sync_interval.total_seconds():
+                interval = max(interval, self.push_sync_interval)
+
+            if synced_at and now - synced_at / 1000 < interval.total_seconds():
+                return 0
+
+        written = 0
+        if not covered:
+            # First sync (or a ledger from before coverage tracking)
+            count, complete = self._pull(adapter, requested, None)
+            written += count
+            if complete:
+                self._set_state(platform, low_watermark=requested, high_watermark=now_ms)
+        else:
+            if backfill:
+                count, complete = self._pull(adapter, requested, low)
+                written += count
+                if complete:
+                    self._set_state(platform, low_watermark=requested)
+
+            tail_start = max(high - int(self.lookback.total_seconds() * 1000), 0)
+            count, complete = self._pull(adapter, tail_start, None)
+            written += count
+            if complete:
+                self._set_state(platform, high_watermark=now_ms)
+
+        self._set_state(platform, synced_at=now_ms)
+        return written
+
+    def covers(self, platform: str, start_date: Optional[datetime] = None) -> bool:
+        """
+        Whether sales from start_date (None: the whole history) onwards
+        have been fully synced, up to the last successful sync.
+        """
+        low, high, _ = self._get_state(platform)
+        if low is None or high is None:
+            return False
+        return (_to_ms(start_date) or 0) >= low
+
+    def _pull(self, adapter: BaseCheckoutAdapter, start_ms: int, end_ms: Optional[int]) -> Tuple[int, bool]:
+        """
+        Page through the adapter's full listing for a range and store it.
+
+        Returns:
+            (sales written, whether the listing completed without errors)
+        """
+        errors: List[str] = []
+        written = 0
+        try:
+            # Query the adapter's API directly, not through the ledger
+            sales = adapter.iter_sales(
+                start_date=_from_ms(start_ms) if start_ms else None,
+                end_date=_from_ms(end_ms),
+                errors=errors
+            )
+            while True:
+                batch = list(islice(sales, SYNC_BATCH_SIZE))
+                if not batch:
+                    break
+                written += self.upsert_sales(batch)
+        except Exception as e:
+            errors.append(str(e))
+
+        if errors:
+            print(f"Warning: {adapter.platform_name} sync incomplete, will retry: {errors[0]}")
+        return written, not errors
+
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+
+    def has_event(self, platform: str, event_id: str) -> bool:
+        """Whether a webhook delivery was already ingested"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM webhook_events WHERE platform = ? AND event_id = ?",
+                (platform, event_id)
+            ).fetchone()
+        return row is not None
+
+    def get_last_push(self, platform: str) -> Optional[datetime]:
+        """When the platform last delivered a webhook"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT MAX(received_at) FROM webhook_events WHERE platform = ?",
+                (platform,)
+            ).fetchone()
+        return _from_ms(row[0]) if row else None
+
+    def get_watermark(self, platform: str) -> Optional[datetime]:
+        """Newest created_at stored for a platform"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT MAX(created_at) FROM sales WHERE platform = ?",
+                (platform,)
+            ).fetchone()
+        return _from_ms(row[0]) if row else None
+
+    def get_coverage(self, platform: str) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """(low, high) watermarks of the fully synced range, None if never synced"""
+        low, high, _ = self._get_state(platform)
+        return _from_ms(low), _from_ms(high)
+
+    def query_sales(
+        self,
+        platform: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> Iterator[Sale]:
+        """Stream stored sales for a platform and period, oldest first"""
+        where, params = self._window(platform, start_date, end_date)
+
+        with self._connect() as conn:
+            cursor = conn.execute(
+                f"SELECT {', '.join(SALE_COLUMNS)} FROM sales {where} ORDER BY created_at",
+                params
+            )
+            for row in cursor:
+                yield self._row_to_sale(row)
+
+    def get_sales_table(
+        self,
+        platform: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ):
+        """
+        Load stored sales for a platform and period into a SalesTable.
+
+        Rows go straight from SQLite into the columnar builder without
+        creating Sale objects.
+        """
+        from .sales_table import SalesTable
+
+        where, params = self._window(platform, start_date, end_date)
+
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "SELECT id, status, amount, net_amount, created_at, platform, product_id, "
+                "currency, utm_source, utm_medium, utm_campaign, funnel_tag, product_name "
+                f"FROM sales {where} ORDER BY created_at",
+                params
+            )
+            return SalesTable.from_rows(cursor)
+
+    def get_metrics(
+        self,
+        platform: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> CheckoutMetrics:
+        """
+        Aggregate stored sales into CheckoutMetrics with SQL queries.
+
+        Args:
+            platform: Platform name (hotmart, kiwify, stripe, whop, clickfunnels)
+            start_date: Start of period
+            end_date: End of period
+
+        Returns:
+            CheckoutMetrics object with aggregated data
+        """
+        where, params = self._window(platform, start_date, end_date)
+
+        metrics = CheckoutMetrics(
+            platform=platform,
+            period_start=start_date,
+            period_end=end_date
+        )
+
+        approved = PaymentStatus.APPROVED.value
+        refunded = PaymentStatus.REFUNDED.value
+        chargeback = PaymentStatus.CHARGEBACK.value
+
+        with self._connect() as conn:
+            totals = conn.execute(
+                f"""
+                SELECT COUNT(*),
+                       SUM(status = ?),
+                       COALESCE(SUM(CASE WHEN status = ? THEN amount END), 0),
+                       COALESCE(SUM(CASE WHEN status = ? THEN net_amount END), 0),
+                       SUM(status = ?),
+                       COALESCE(SUM(CASE WHEN status = ? THEN amount END), 0),
+                       SUM(status = ?)
+                FROM sales {where}
+                """,
+                (approved, approved, approved, refunded, refunded, chargeback, *params)
+            ).fetchone()
+
+            (metrics.total_sales, metrics.approved_sales, metrics.gross_revenue,
+             metrics.net_revenue, metrics.refunded_sales, metrics.refunded_amount,
+             metrics.chargeback_sales) = (value or 0 for value in totals)
+
+            for product_id, name, count, revenue in conn.execute(
+                f"SELECT product_id, MAX(product_name), COUNT(*), SUM(amount) FROM sales "
+                f"{where} AND COALESCE(product_id, '') != '' GROUP BY product_id",
+                params
+            ):
+                metrics.products[product_id] = {'name': name or '', 'sales': count, 'revenue': revenue}
+
+            groups = (
+                ('utm_source', metrics.by_utm_source),
+                ('utm_campaign', metrics.by_utm_campaign),
+                ('funnel_tag', metrics.by_funnel),
+            )
+            for column, target in groups:
+                for key, count, revenue in conn.execute(
+                    f"SELECT {column}, COUNT(*), SUM(amount) FROM sales "
+                    f"{where} AND COALESCE({column}, '') != '' GROUP BY {column}",
+                    params
+                ):
+                    target[key] = {'sales': count, 'revenue': revenue}
+
+        metrics.calculate_derived()
+        return metrics
+
+    # -------------------------------------------------------------------------
+    # Helpers
+    # -------------------------------------------------------------------------
+
+    def _get_state(self, platform: str) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+        """(low_watermark, high_watermark, synced_at) in epoch ms"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT low_watermark, high_watermark, synced_at FROM sync_state WHERE platform = ?",
+                (platform,)
+            ).fetchone()
+        return row if row else (None, None, None)
+
+    def _set_state(self, platform: str, **values: int):
+        columns = ', '.join(values)
+        placeholders = ', '.join('?' for _ in values)
+        updates = ', '.join(f'{column} = excluded.{column}' for column in values)
+        with self._connect() as conn:
+            conn.execute(
+                f"INSERT INTO sync_state (platform, {columns}) VALUES (?, {placeholders}) "
+                f"ON CONFLICT(platform) DO UPDATE SET {updates}",
+                (platform, *values.values())
+            )
+
+    @staticmethod
+    def _record_event(conn: sqlite3.Connection, platform: str, event_id: str) -> bool:
+        """Insert a webhook delivery; False if it was already ingested"""
+        cursor = conn.execute(
+            "INSERT OR IGNORE INTO webhook_events (platform, event_id, received_at) VALUES (?, ?, ?)",
+            (platform, event_id, int(time.time() * 1000))
+        )
+        return cursor.rowcount == 1
+
+    @staticmethod
+    def _stored_status(conn: sqlite3.Connection, platform: str, sale_id: str) -> Optional[str]:
+        row = conn.execute(
+            "SELECT status FROM sales WHERE platform = ? AND id = ?",
+            (platform, sale_id)
+        ).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _upsert_rows(conn: sqlite3.Connection, rows: List[tuple]):
+        placeholders = ', '.join('?' for _ in SALE_COLUMNS)
+        updates = ', '.join(
+            f'{col} = excluded.{col}' for col in SALE_COLUMNS if col not in ('platform', 'id')
+        )
+        conn.executemany(
+            f"INSERT INTO sales ({', '.join(SALE_COLUMNS)}) VALUES ({placeholders}) "
+            f"ON CONFLICT(platform, id) DO UPDATE SET {updates}",
+            rows
+        )
+
+    @staticmethod
+    def _window(
+        platform: Optional[str],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime]
+    ) -> Tuple[str, list]:
+        """Build a WHERE clause served by the (platform, created_at) index"""
+        clauses, params = ['1 = 1'], []
+        if platform:
+            clauses.append('platform = ?')
+            params.append(platform)
+        if start_date:
+            clauses.append('created_at >= ?')
+            params.append(_to_ms(start_date))
+        if end_date:
+            clauses.append('created_at <= ?')
+            params.append(_to_ms(end_date))
+        return 'WHERE ' + ' AND '.join(clauses), params
+
+    @staticmethod
+    def _sale_to_row(sale: Sale) -> tuple:
+        return (
+            sale.platform, sale.id, sale.product_id, sale.product_name, sale.offer_id,
+            sale.amount, sale.currency, sale.status.value, sale.payment_method,
+            sale.customer_email, sale.customer_name,
+            sale.utm_source, sale.utm_medium, sale.utm_campaign, sale.utm_content,
+            sale.funnel_tag, _to_ms(sale.created_at), _to_ms(sale.approved_at),
+            sale.platform_fee, sale.affiliate_commission, sale.net_amount,
+            ' '.join(sale.order_refs)
+        )
+
+    @staticmethod
+    def _row_to_sale(row: tuple) -> Sale:
+        data = dict(zip(SALE_COLUMNS, row))
+        data['status'] = PaymentStatus(data['status'])
+        data['created_at'] = _from_ms(data['created_at'])
+        data['approved_at'] = _from_ms(data['approved_at'])
+        data['order_refs'] = (data['order_refs'] or '').split()
+        return Sale(**data)
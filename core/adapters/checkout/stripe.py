@@ -4,11 +4,11 @@ Integration with Stripe payment platform
 """
 
 import requests
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 from datetime import datetime
 
 from .base import (
-    BaseCheckoutAdapter, Product, Offer, Sale, CheckoutMetrics,
+    BaseCheckoutAdapter, Product, Offer, Sale,
     PaymentStatus, ProductType
 )
 
@@ -57,33 +57,76 @@ class StripeAdapter(BaseCheckoutAdapter):
             'response': result
         }
 
-    def get_products(self) -> List[Product]:
-        """Fetch all products from Stripe"""
-        result = self._request('/products', {'active': 'true', 'limit': 100})
-
-        if 'error' in result:
-            return []
+    def _list_all(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        errors: Optional[List[str]] = None
+    ) -> Iterator[Dict]:
+        """
+        Iterate every object of a Stripe list endpoint.
+
+        Follows `has_more` with `starting_after`, 100 objects per request.
+        Stops at the first error, which is appended to `errors` if given.
+        """
+        params = {**(params or {}), 'limit': 100}
+
+        while True:
+            result = self._request(endpoint, params)
+            if 'error' in result:
+                if errors is not None:
+                    errors.append(str(result['error']))
+                return
+
+            data = result.get('data', [])
+            yield from data
+
+            if not result.get('has_more') or not data:
+                return
+            params['starting_after'] = data[-1]['id']
+
+    def get_products(self, errors: Optional[List[str]] = None) -> List[Product]:
+        """
+        Fetch all active products from Stripe with their prices.
+
+        Products are listed with `default_price` expanded, so the common
+        case is a single request per 100 products. Prices for products
+        without a default price come from one bulk /prices listing.
+
+        Args:
+            errors: Optional list that receives errors from either listing
+        """
+        items = list(self._list_all(
+            '/products', {'active': 'true', 'expand[]': ['data.default_price']}, errors
+        ))
+
+        fallback_prices = {}
+        if any(not isinstance(item.get('default_price'), dict) for item in items):
+            # Prices are listed newest first; keep the first per product
+            for price in self._list_all('/prices', {'active': 'true'}, errors):
+                fallback_prices.setdefault(price.get('product'), price)
 
         products = []
-        for item in result.get('data', []):
-            # Get price for this product
-            prices = self._request('/prices', {'product': item['id'], 'active': 'true'})
-            default_price = prices.get('data', [{}])[0] if prices.get('data') else {}
+        for item in items:
+            default_price = item.get('default_price')
+            if not isinstance(default_price, dict):
+                default_price = fallback_prices.get(item['id'], {})
 
             products.append(self._parse_product(item, default_price))
 
         return products
 
     def get_product(self, product_id: str) -> Optional[Product]:
-        """Fetch a specific product"""
-        result = self._request(f'/products/{product_id}')
+        """Fetch a specific product with its default price expanded"""
+        result = self._request(f'/products/{product_id}', {'expand[]': ['default_price']})
 
         if 'error' in result:
             return None
 
-        # Get price
-        prices = self._request('/prices', {'product': product_id, 'active': 'true'})
-        default_price = prices.get('data', [{}])[0] if prices.get('data') else {}
+        default_price = result.get('default_price')
+        if not isinstance(default_price, dict):
+            prices = self._request('/prices', {'product': product_id, 'active': 'true', 'limit': 1})
+            default_price = prices.get('data', [{}])[0] if prices.get('data') else {}
 
         return self._parse_product(result, default_price)
 
@@ -144,7 +187,18 @@ class StripeAdapter(BaseCheckoutAdapter):
         status: Optional[PaymentStatus] = None
     ) -> List[Sale]:
         """Fetch charges/payments from Stripe"""
-        params = {'limit': 100}
+        return list(self.iter_sales(start_date, end_date, product_id, status))
+
+    def iter_sales(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        product_id: Optional[str] = None,
+        status: Optional[PaymentStatus] = None,
+        errors: Optional[List[str]] = None
+    ) -> Iterator[Sale]:
+        """Stream every charge of a period, following Stripe's pagination"""
+        params = {}
 
         if start_date:
             params['created[gte]'] = int(start_date.timestamp())
@@ -152,28 +206,23 @@ class StripeAdapter(BaseCheckoutAdapter):
         if end_date:
             params['created[lte]'] = int(end_date.timestamp())
 
-        result = self._request('/charges', params)
-
-        if 'error' in result:
-            return []
-
-        sales = []
-        for item in result.get('data', []):
+        for item in self._list_all('/charges', params, errors):
             sale = self._parse_sale(item)
 
             # Filter by status if specified
             if status and sale.status != status:
                 continue
 
-            sales.append(sale)
-
-        return sales
+            yield sale
 
     def _parse_sale(self, data: Dict) -> Sale:
         """Parse Stripe charge data"""
         # Map Stripe status
         if data.get('refunded'):
             payment_status = PaymentStatus.REFUNDED
+        elif data.get('disputed'):
+            # Matches the webhook receiver, which marks disputes as chargebacks
+            payment_status = PaymentStatus.CHARGEBACK
         elif data.get('status') == 'succeeded':
             payment_status = PaymentStatus.APPROVED
         elif data.get('status') == 'pending':
@@ -211,51 +260,3 @@ class StripeAdapter(BaseCheckoutAdapter):
             net_amount=amount - stripe_fee,
             raw_data=data
         )
-
-    def get_metrics(
-        self,
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
-    ) -> CheckoutMetrics:
-        """Get aggregated checkout metrics"""
-        sales = self.get_sales(start_date, end_date)
-
-        metrics = CheckoutMetrics(
-            platform=self.platform_name,
-            period_start=start_date,
-            period_end=end_date
-        )
-
-        for sale in sales:
-            metrics.total_sales += 1
-
-            if sale.status == PaymentStatus.APPROVED:
-                metrics.approved_sales += 1
-                metrics.gross_revenue += sale.amount
-                metrics.net_revenue += sale.net_amount
-            elif sale.status == PaymentStatus.REFUNDED:
-                metrics.refunded_sales += 1
-                metrics.refunded_amount += sale.amount
-            elif sale.status == PaymentStatus.CHARGEBACK:
-                metrics.chargeback_sales += 1
-
-            # Group by product
-            if sale.product_id:
-                if sale.product_id not in metrics.products:
-                    metrics.products[sale.product_id] = {
-                        'name': sale.product_name,
-                        'sales': 0,
-                        'revenue': 0
-                    }
-                metrics.products[sale.product_id]['sales'] += 1
-                metrics.products[sale.product_id]['revenue'] += sale.amount
-
-            # Group by UTM
-            if sale.utm_source:
-                if sale.utm_source not in metrics.by_utm_source:
-                    metrics.by_utm_source[sale.utm_source] = {'sales': 0, 'revenue': 0}
-                metrics.by_utm_source[sale.utm_source]['sales'] += 1
-                metrics.by_utm_source[sale.utm_source]['revenue'] += sale.amount
-
-        metrics.calculate_derived()
-        return metrics
@@ -0,0 +1,411 @@
+"""
+Checkout Webhook Receiver
+Local HTTP endpoint that ingests purchase/refund webhooks into the sales ledger
+
+Run:
+    python -m core.adapters.checkout.webhooks --client brez-scales --port 8787
+
+Platforms post to /webhooks/<platform> (hotmart, kiwify, stripe, whop).
+Signing secrets are read from HOTMART_HOTTOK, KIWIFY_WEBHOOK_TOKEN,
+STRIPE_WEBHOOK_SECRET and WHOP_WEBHOOK_SECRET.
+
+Recorded deliveries (--record) can be replayed locally with --replay.
+"""
+
+import argparse
+import hashlib
+import hmac
+import json
+import os
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlparse
+
+from .base import BaseCheckoutAdapter, PaymentStatus
+from .hotmart import HotmartAdapter
+from .kiwify import KiwifyAdapter
+from .stripe import StripeAdapter
+from .whop import WhopAdapter
+from .ledger import SalesLedger
+
+
+SECRET_ENV_VARS = {
+    'hotmart': 'HOTMART_HOTTOK',
+    'kiwify': 'KIWIFY_WEBHOOK_TOKEN',
+    'stripe': 'STRIPE_WEBHOOK_SECRET',
+    'whop': 'WHOP_WEBHOOK_SECRET',
+}
+
+# Maximum age of a timestamped signature (Stripe, Whop)
+SIGNATURE_TOLERANCE_SECONDS = 300
+
+
+class WebhookReceiver:
+    """
+    Verifies checkout webhooks and appends them to a SalesLedger.
+
+    Each payload is normalized through the platform adapter's existing
+    _parse_sale. Deliveries are deduplicated by event id, and sales are
+    upserted by id in the same transaction, so retries and replays are
+    idempotent. Payloads without an event or sale id are rejected.
+
+    Usage:
+        receiver = WebhookReceiver(
+            ledger=SalesLedger.for_client("brez-scales"),
+            secrets={'stripe': 'whsec_...', 'hotmart': 'hottok'}
+        )
+        receiver.serve(port=8787)
+
+        # Or feed recorded deliveries without a server
+        receiver.replay("recorded_webhooks.jsonl")
+    """
+
+    def __init__(
+        self,
+        ledger: SalesLedger,
+        secrets: Dict[str, str],
+        adapters: Optional[Dict[str, BaseCheckoutAdapter]] = None,
+        record_path: Optional[str] = None
+    ):
+        """
+        Args:
+            ledger: Ledger that receives the parsed sales
+            secrets: Signing secret per platform; platforms without one are rejected
+            adapters: Adapters used for parsing (defaults to unconfigured instances)
+            record_path: Optional JSONL file where raw deliveries are appended
+        """
+        self.ledger = ledger
+        self.secrets = secrets
+        self.adapters = adapters or {
+            'hotmart': HotmartAdapter(api_key=''),
+            'kiwify': KiwifyAdapter(api_key=''),
+            'stripe': StripeAdapter(api_key=''),
+            'whop': WhopAdapter(api_key=''),
+        }
+        self.record_path = record_path
+
+    def handle(
+        self,
+        platform: str,
+        headers: Dict[str, str],
+        body: bytes,
+        query: Optional[Dict[str, str]] = None,
+        replayed: bool = False
+    ) -> Tuple[int, Dict]:
+        """
+        Process one webhook delivery.
+
+        Args:
+            platform: Platform name from the request path
+            headers: Request headers
+            body: Raw request body (signatures cover the exact bytes)
+            query: Query string parameters
+            replayed: Skip the signature age check for recorded deliveries
+
+        Returns:
+            Tuple of (HTTP status code, response body)
+        """
+        query = query or {}
+        headers = {key.lower(): value for key, value in headers.items()}
+
+        if platform not in self.adapters:
+            return 404, {'error': f'Unknown platform: {platform}'}
+
+        secret = self.secrets.get(platform)
+        if not secret:
+            return 503, {'error': f'No webhook secret configured for {platform}'}
+
+        max_age = None if replayed else SIGNATURE_TOLERANCE_SECONDS
+        if not self._verify(platform, secret, headers, body, query, max_age):
+            return 401, {'error': 'Invalid signature'}
+
+        if self.record_path and not replayed:
+            self._record(platform, headers, body, query)
+
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return 400, {'error': 'Body is not valid JSON'}
+
+        update = self._extract_status_update(platform, payload)
+        if update is not None:
+            event_id, sale_id, sale_status = update
+            if not event_id or not sale_id:
+                return 400, {'error': 'Payload has no event or sale id'}
+            status = self.ledger.ingest_status_event(platform, event_id, sale_id, sale_status)
+            return 200, {'status': status, 'event_id': event_id, 'sale_id': sale_id}
+
+        event_id, sale_data = self._extract(platform, payload)
+        if sale_data is None:
+            return 200, {'status': 'ignored'}
+
+        if not event_id:
+            return 400, {'error': 'Payload has no event id'}
+
+        sale = self.adapters[platform]._parse_sale(sale_data)
+        if not sale.id:
+            return 400, {'error': 'Payload has no sale id'}
+
+        status = self.ledger.ingest_event(platform, event_id, sale)
+        return 200, {'status': status, 'event_id': event_id, 'sale_id': sale.id}
+
+    def replay(self, path: str) -> List[Tuple[int, Dict]]:
+        """
+        Re-deliver recorded webhooks from a JSONL file.
+
+        Each line holds {"platform", "headers", "query", "body"}, as written
+        by record_path.
+
+        Returns:
+            List of (status code, response) per delivery
+        """
+        results = []
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                delivery = json.loads(line)
+                results.append(self.handle(
+                    delivery['platform'],
+                    delivery.get('headers', {}),
+                    delivery['body'].encode('utf-8'),
+                    delivery.get('query', {}),
+                    replayed=True
+                ))
+        return results
+
+    def serve(self, host: str = "127.0.0.1", port: int = 8787):
+        """Run the HTTP receiver until interrupted"""
+        handler = type('WebhookHandler', (_WebhookHandler,), {'receiver': self})
+        server = ThreadingHTTPServer((host, port), handler)
+        print(f"Webhook receiver listening on http://{host}:{port}/webhooks/<platform>")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+
+    # -------------------------------------------------------------------------
+    # Signature verification
+    # -------------------------------------------------------------------------
+
+    def _verify(
+        self,
+        platform: str,
+        secret: str,
+        headers: Dict[str, str],
+        body: bytes,
+        query: Dict[str, str],
+        max_age: Optional[int]
+    ) -> bool:
+        if platform == 'hotmart':
+            # Hotmart sends the account's static hottok in a header
+            return hmac.compare_digest(headers.get('x-hotmart-hottok', ''), secret)
+
+        if platform == 'kiwify':
+            # Kiwify signs the body with HMAC-SHA1 and passes it as ?signature=
+            expected = hmac.new(secret.encode(), body, hashlib.sha1).hexdigest()
+            return hmac.compare_digest(query.get('signature', ''), expected)
+
+        if platform == 'stripe':
+            return self._verify_timestamped(secret, headers.get('stripe-signature', ''), body, max_age)
+
+        if platform == 'whop':
+            return self._verify_timestamped(secret, headers.get('x-whop-signature', ''), body, max_age)
+
+        return False
+
+    @staticmethod
+    def _verify_timestamped(secret: str, header: str, body: bytes, max_age: Optional[int]) -> bool:
+        """Verify a 't=<ts>,v1=<hmac>' header over '<ts>.<body>' (HMAC-SHA256)"""
+        timestamp = None
+        signatures = []
+        for part in header.split(','):
+            key, _, value = part.strip().partition('=')
+            if key == 't':
+                timestamp = value
+            elif key == 'v1':
+                signatures.append(value)
+
+        if not timestamp or not signatures:
+            return False
+
+        try:
+            if max_age is not None and abs(time.time() - int(timestamp)) > max_age:
+                return False
+        except ValueError:
+            return False
+
+        signed_payload = timestamp.encode() + b'.' + body
+        expected = hmac.new(secret.encode(), signed_payload, hashlib.sha256).hexdigest()
+        return any(hmac.compare_digest(expected, signature) for signature in signatures)
+
+    # -------------------------------------------------------------------------
+    # Payload extraction
+    # -------------------------------------------------------------------------
+
+    def _extract(self, platform: str, payload: Dict) -> Tuple[str, Optional[Dict]]:
+        """
+        Pull the event id and the sale object expected by _parse_sale.
+
+        Returns:
+            Tuple of (event id, sale data), with sale data None for
+            events that don't describe a purchase
+        """
+        if platform == 'hotmart':
+            # {"id", "event": "PURCHASE_APPROVED", "data": {product, buyer, purchase}}
+            if not str(payload.get('event', '')).startswith('PURCHASE_'):
+                return '', None
+            return str(payload.get('id', '')), payload.get('data', {})
+
+        if platform == 'kiwify':
+            return self._extract_kiwify(payload)
+
+        if platform == 'stripe':
+            # {"id": "evt_...", "type": "charge.refunded", "data": {"object": charge}}
+            # charge.refund.* and charge.dispute.* carry Refund/Dispute objects
+            # instead; refunds reach the ledger through charge.refunded
+            charge = payload.get('data', {}).get('object', {}) or {}
+            if not str(payload.get('type', '')).startswith('charge.') or charge.get('object') != 'charge':
+                return '', None
+            return str(payload.get('id', '')), charge
+
+        if platform == 'whop':
+            # {"id"?, "action": "payment.succeeded", "data": payment}
+            action = str(payload.get('action', ''))
+            if not action.startswith('payment.'):
+                return '', None
+            data = payload.get('data', {})
+            if payload.get('id'):
+                return str(payload['id']), data
+            return (f"{data['id']}:{action}" if data.get('id') else ''), data
+
+        return '', None
+
+    @staticmethod
+    def _extract_status_update(platform: str, payload: Dict) -> Optional[Tuple[str, str, PaymentStatus]]:
+        """
+        (event id, sale id, new status) for events that change the status
+        of an existing sale without describing it, else None
+        """
+        if platform == 'stripe':
+            # A dispute takes the funds when opened; a lost one keeps them
+            event_type = payload.get('type')
+            dispute = payload.get('data', {}).get('object', {}) or {}
+            if dispute.get('object') != 'dispute':
+                return None
+            if event_type == 'charge.dispute.created' or (
+                event_type == 'charge.dispute.closed' and dispute.get('status') == 'lost'
+            ):
+                return str(payload.get('id', '')), str(dispute.get('charge') or ''), PaymentStatus.CHARGEBACK
+
+        return None
+
+    @staticmethod
+    def _extract_kiwify(payload: Dict) -> Tuple[str, Optional[Dict]]:
+        """Reshape a Kiwify order webhook into the /orders API shape"""
+        order_id = payload.get('order_id')
+        if not order_id:
+            return '', None
+
+        status = payload.get('order_status', '')
+        product = payload.get('Product', {}) or {}
+        customer = payload.get('Customer', {}) or {}
+        commissions = payload.get('Commissions', {}) or {}
+
+        # Kiwify sends no event id; one delivery per order status change
+        event_id = f"{order_id}:{status}"
+
+        return event_id, {
+            'id': order_id,
+            'status': status,
+            'amount': commissions.get('charge_amount', 0),
+            'created_at': payload.get('created_at', ''),
+            'payment_method': payload.get('payment_method', ''),
+            'product': {
+                'id': product.get('product_id', ''),
+                'name': product.get('product_name', '')
+            },
+            'customer': {
+                'email': customer.get('email', ''),
+                'name': customer.get('full_name', '')
+            },
+            'tracking': payload.get('TrackingParameters', {}) or {}
+        }
+
+    def _record(self, platform: str, headers: Dict[str, str], body: bytes, query: Dict[str, str]):
+        """Append a verified delivery to the replay file"""
+        with open(self.record_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({
+                'platform': platform,
+                'headers': headers,
+                'query': query,
+                'body': body.decode('utf-8')
+            }) + '\n')
+
+
+class _WebhookHandler(BaseHTTPRequestHandler):
+    """Routes POST /webhooks/<platform> to a WebhookReceiver"""
+
+    receiver: WebhookReceiver = None
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        parts = url.path.strip('/').split('/')
+
+        if len(parts) != 2 or parts[0] != 'webhooks':
+            self._respond(404, {'error': 'Not found'})
+            return
+
+        length = int(self.headers.get('Content-Length', 0) or 0)
+        body = self.rfile.read(length)
+
+        try:
+            status, response = self.receiver.handle(
+                parts[1], dict(self.headers), body, dict(parse_qsl(url.query))
+            )
+        except Exception as e:
+            status, response = 500, {'error': str(e)}
+
+        self._respond(status, response)
+
+    def _respond(self, status: int, body: Dict):
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Checkout webhook receiver")
+    parser.add_argument("--client", required=True, help="Client slug (ledger under clients/<slug>/data/)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--record", help="Append verified deliveries to this JSONL file")
+    parser.add_argument("--replay", help="Replay deliveries from a JSONL file and exit")
+    args = parser.parse_args()
+
+    secrets = {
+        platform: os.getenv(env_var, '')
+        for platform, env_var in SECRET_ENV_VARS.items()
+    }
+    receiver = WebhookReceiver(
+        ledger=SalesLedger.for_client(args.client),
+        secrets=secrets,
+        record_path=args.record
+    )
+
+    if args.replay:
+        for status, response in receiver.replay(args.replay):
+            print(status, json.dumps(response))
+        return
+
+    receiver.serve(args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,11 +4,12 @@ Integration with Whop membership/payments platform
 """
 
 import requests
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 from datetime import datetime
 
+from ..timestamps import parse_timestamp
 from .base import (
-    BaseCheckoutAdapter, Product, Offer, Sale, CheckoutMetrics,
+    BaseCheckoutAdapter, Product, Offer, Sale,
     PaymentStatus, ProductType
 )
 
@@ -27,6 +28,7 @@ class WhopAdapter(BaseCheckoutAdapter):
 
     platform_name = "whop"
     base_url = "https://api.whop.com/api/v5"  # Updated to v5 API
+    max_concurrent_requests = 5
 
     def __init__(self, api_key: str, company_id: str = "", **kwargs):
         super().__init__(api_key, **kwargs)
@@ -69,32 +71,26 @@ class WhopAdapter(BaseCheckoutAdapter):
             'response': result if not success else 'Connected successfully'
         }
 
-    def get_products(self, per_page: int = 100) -> List[Product]:
+    def get_products(self, per_page: int = 100, errors: Optional[List[str]] = None) -> List[Product]:
         """Fetch all products from Whop using v5 API"""
-        all_products = []
-        page = 1
-
-        while True:
-            result = self._request('/company/products', {'per': per_page, 'page': page})
-
-            if 'error' in result:
-                break
-
-            data = result.get('data', [])
-            if not data:
-                break
+        pages = self._iter_pages(
+            lambda page: self._request('/company/products', {'per': per_page, 'page': page}),
+            self._total_pages,
+            errors=errors
+        )
 
-            for item in data:
+        all_products = []
+        for result in pages:
+            for item in result.get('data', []):
                 all_products.append(self._parse_product(item))
 
-            # Check pagination
-            pagination = result.get('pagination', {})
-            if page >= pagination.get('total_pages', 1):
-                break
-            page += 1
-
         return all_products
 
+    @staticmethod
+    def _total_pages(result: Dict) -> int:
+        """Read page count from a v5 paginated response"""
+        return result.get('pagination', {}).get('total_pages', 1) or 1
+
     def get_product(self, product_id: str) -> Optional[Product]:
         """Fetch a specific product"""
         # In v5, we need to search through products
@@ -152,31 +148,60 @@ class WhopAdapter(BaseCheckoutAdapter):
         product_id: Optional[str] = None,
         status: Optional[PaymentStatus] = None,
         per_page: int = 100,
-        max_pages: int = 10
+        max_pages: Optional[int] = None
     ) -> List[Sale]:
         """Fetch payments from Whop using v5 API"""
-        all_sales = []
-        page = 1
+        return list(self.iter_sales(start_date, end_date, product_id, status, per_page, max_pages))
 
-        while page <= max_pages:
-            params = {'per': per_page, 'page': page}
-            result = self._request('/company/payments', params)
+    def iter_sales(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        product_id: Optional[str] = None,
+        status: Optional[PaymentStatus] = None,
+        per_page: int = 100,
+        max_pages: Optional[int] = None,
+        errors: Optional[List[str]] = None
+    ) -> Iterator[Sale]:
+        """
+        Stream payments from Whop page by page.
+
+        The v5 payments listing has no date filter, but it is returned
+        newest first, so paging stops as soon as a page reaches payments
+        older than start_date. Out-of-range payments are skipped on their
+        raw timestamp, before being parsed.
+        """
+        start_ts = start_date.timestamp() if start_date else None
+        end_ts = end_date.timestamp() if end_date else None
+
+        pages = self._iter_pages(
+            lambda page: self._request('/company/payments', {'per': per_page, 'page': page}),
+            self._total_pages,
+            max_pages=max_pages,
+            errors=errors
+        )
 
-            if 'error' in result:
-                break
+        for result in pages:
+            passed_window = False
 
-            data = result.get('data', [])
-            if not data:
-                break
+            for item in result.get('data', []):
+                # Filter by date
+                created_ts = self._created_timestamp(item)
+                if created_ts is not None:
+                    if end_ts is not None and created_ts > end_ts:
+                        continue
+                    if start_ts is not None and created_ts < start_ts:
+                        passed_window = True
+                        continue
 
-            for item in data:
                 sale = self._parse_sale(item)
 
-                # Filter by date
-                if start_date and sale.created_at and sale.created_at < start_date:
-                    continue
-                if end_date and sale.created_at and sale.created_at > end_date:
-                    continue
+                # ISO timestamps can only be compared once parsed
+                if created_ts is None and sale.created_at:
+                    if start_date and sale.created_at < start_date:
+                        continue
+                    if end_date and sale.created_at > end_date:
+                        continue
 
                 # Filter by product
                 if product_id and sale.product_id != product_id:
@@ -186,15 +211,18 @@ class WhopAdapter(BaseCheckoutAdapter):
                 if status and sale.status != status:
                     continue
 
-                all_sales.append(sale)
+                yield sale
 
-            # Check pagination
-            pagination = result.get('pagination', {})
-            if page >= pagination.get('total_pages', 1):
+            if passed_window:
                 break
-            page += 1
 
-        return all_sales
+    @staticmethod
+    def _created_timestamp(data: Dict) -> Optional[float]:
+        """Read a payment's Unix created_at without building a Sale"""
+        created_ts = data.get('created_at')
+        if isinstance(created_ts, (int, float)):
+            return float(created_ts)
+        return None
 
     def _parse_sale(self, data: Dict) -> Sale:
         """Parse Whop payment data (v5 format)"""
@@ -218,16 +246,7 @@ class WhopAdapter(BaseCheckoutAdapter):
             amount = subtotal
 
         # Parse date - v5 uses Unix timestamp
-        created_ts = data.get('created_at')
-        created_at = None
-        if created_ts:
-            try:
-                if isinstance(created_ts, (int, float)):
-                    created_at = datetime.fromtimestamp(created_ts)
-                else:
-                    created_at = datetime.fromisoformat(str(created_ts).replace('Z', '+00:00'))
-            except:
-                pass
+        created_at = parse_timestamp(data.get('created_at') or None)
 
         # Extract UTM from membership metadata
         metadata = data.get('membership_metadata', {}) or {}
@@ -260,51 +279,3 @@ class WhopAdapter(BaseCheckoutAdapter):
             return []
 
         return result.get('data', [])
-
-    def get_metrics(
-        self,
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
-    ) -> CheckoutMetrics:
-        """Get aggregated checkout metrics"""
-        sales = self.get_sales(start_date, end_date)
-
-        metrics = CheckoutMetrics(
-            platform=self.platform_name,
-            period_start=start_date,
-            period_end=end_date
-        )
-
-        for sale in sales:
-            metrics.total_sales += 1
-
-            if sale.status == PaymentStatus.APPROVED:
-                metrics.approved_sales += 1
-                metrics.gross_revenue += sale.amount
-                metrics.net_revenue += sale.net_amount
-            elif sale.status == PaymentStatus.REFUNDED:
-                metrics.refunded_sales += 1
-                metrics.refunded_amount += sale.amount
-            elif sale.status == PaymentStatus.CHARGEBACK:
-                metrics.chargeback_sales += 1
-
-            # Group by product
-            if sale.product_id:
-                if sale.product_id not in metrics.products:
-                    metrics.products[sale.product_id] = {
-                        'name': sale.product_name,
-                        'sales': 0,
-                        'revenue': 0
-                    }
-                metrics.products[sale.product_id]['sales'] += 1
-                metrics.products[sale.product_id]['revenue'] += sale.amount
-
-            # Group by UTM
-            if sale.utm_source:
-                if sale.utm_source not in metrics.by_utm_source:
-                    metrics.by_utm_source[sale.utm_source] = {'sales': 0, 'revenue': 0}
-                metrics.by_utm_source[sale.utm_source]['sales'] += 1
-                metrics.by_utm_source[sale.utm_source]['revenue'] += sale.amount
-
-        metrics.calculate_derived()
-        return metrics
@@ -4,12 +4,16 @@ Integration for automated video generation and editing
 """
 
 import os
-import time
 import requests
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
+from .job_poller import JobPoller, RESULT_MARGIN
+from .media_downloader import MediaDownloader
+from .rate_limit import RateLimiter, is_unsent, retry_with_backoff
+
 
 class VideoFormat(Enum):
     """Output video formats"""
@@ -46,6 +50,9 @@ class RenderResult:
     template_id: str = ""
     format: str = "mp4"
     duration: float = 0.0
+    error: Optional[str] = None
+    # Completion Future when the render is tracked by a JobPoller
+    future: Optional[Future] = field(default=None, repr=False, compare=False)
 
 
 class CreatomateAdapter:
@@ -72,7 +79,20 @@ class CreatomateAdapter:
 
     BASE_URL = "https://api.creatomate.com/v1"
 
-    def __init__(self, api_key: Optional[str] = None):
+    # Request budget for render submissions (requests per second);
+    # lower it if the account's plan allows less
+    RENDER_RATE = 10
+
+    # (connect, read) timeout for status requests made by the poller
+    STATUS_TIMEOUT = (5, 15)
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        poller: Optional[JobPoller] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        downloader: Optional[MediaDownloader] = None
+    ):
         self.api_key = api_key or os.getenv("CREATOMATE_API_KEY")
         if not self.api_key:
             raise ValueError("CREATOMATE_API_KEY is required")
@@ -82,6 +102,14 @@ class CreatomateAdapter:
             "Content-Type": "application/json"
         }
 
+        # Shared status poller: waiting on many renders costs one thread
+        self.poller = poller or JobPoller.shared()
+        # Shared by every adapter using this API key
+        self.rate_limiter = rate_limiter or RateLimiter.for_key(
+            f"creatomate:{self.api_key}", rate=self.RENDER_RATE
+        )
+        self.downloader = downloader or MediaDownloader.shared()
+
     def render_from_template(
         self,
         template_id: str,
@@ -187,7 +215,8 @@ class CreatomateAdapter:
         """
         response = requests.get(
             f"{self.BASE_URL}/renders/{render_id}",
-            headers=self.headers
+            headers=self.headers,
+            timeout=self.STATUS_TIMEOUT
         )
         response.raise_for_status()
 
@@ -210,20 +239,46 @@ class CreatomateAdapter:
         Returns:
             Final render data with URL
         """
-        start_time = time.time()
+        future = self.watch_render(render_id, max_wait, poll_interval)
+        try:
+            return future.result(timeout=max_wait + RESULT_MARGIN)
+        finally:
+            future.cancel()
+
+    def watch_render(
+        self,
+        render_id: str,
+        max_wait: int = 300,
+        poll_interval: int = 5
+    ) -> Future:
+        """
+        Track a render on the shared poller without blocking.
+
+        Args:
+            render_id: ID of the render
+            max_wait: Maximum seconds to wait
+            poll_interval: Initial seconds between status checks
 
-        while time.time() - start_time < max_wait:
-            result = self.get_render_status(render_id)
-            status = result.get("status", "pending")
+        Returns:
+            Future resolved with the final render data (fails with the
+            render error or TimeoutError)
+        """
+        return self.poller.watch(
+            "creatomate", render_id, self._check_render,
+            timeout=max_wait, min_interval=poll_interval
+        )
 
-            if status == "succeeded":
-                return result
-            elif status == "failed":
-                raise Exception(f"Render failed: {result.get('error_message', 'Unknown error')}")
+    def _check_render(self, render_id: str) -> Optional[Dict[str, Any]]:
+        """Poller check: render data once succeeded, None while pending"""
+        result = self.get_render_status(render_id)
+        status = result.get("status", "pending")
 
-            time.sleep(poll_interval)
+        if status == "succeeded":
+            return result
+        elif status == "failed":
+            raise Exception(f"Render failed: {result.get('error_message', 'Unknown error')}")
 
-        raise TimeoutError(f"Render {render_id} did not complete within {max_wait} seconds")
+        return None
 
     def render_and_wait(
         self,
@@ -287,37 +342,64 @@ class CreatomateAdapter:
         self,
         template_id: str,
         data_list: List[Dict[str, Any]],
-        output_format: VideoFormat = VideoFormat.MP4
+        output_format: VideoFormat = VideoFormat.MP4,
+        max_workers: int = 8,
+        retries: int = 3,
+        watch: bool = False,
+        max_wait: int = 600
     ) -> List[RenderResult]:
         """
         Render multiple videos from the same template with different data.
 
+        Submissions run on a bounded worker pool under the adapter's rate
+        limiter. Only failures that guarantee no render was created
+        (connect timeouts, 429) are retried with backoff: after a 5xx or a
+        dropped connection the render may exist and be billed, so those
+        are reported as failed rather than resubmitted.
+
         Args:
             template_id: Template ID
             data_list: List of modification dicts
             output_format: Output format for all videos
+            max_workers: Concurrent submissions
+            retries: Retries per render for throttling/connect failures
+            watch: Track each submitted render on the poller; its
+                completion Future is set as RenderResult.future
+            max_wait: Seconds before a watched render times out
 
         Returns:
-            List of RenderResult objects
+            List of RenderResult objects in the order of data_list; failed
+            submissions have status "failed" and the reason in `error`
         """
-        results = []
-
-        for modifications in data_list:
-            try:
-                result = self.render_from_template(
+        def submit(modifications: Dict[str, Any]) -> RenderResult:
+            def attempt() -> RenderResult:
+                self.rate_limiter.acquire()
+                return self.render_from_template(
                     template_id=template_id,
                     modifications=modifications,
                     output_format=output_format
                 )
-                results.append(result)
+
+            try:
+                result = retry_with_backoff(attempt, retries=retries, should_retry=is_unsent)
             except Exception as e:
-                results.append(RenderResult(
+                return RenderResult(
                     render_id="",
                     status="failed",
-                    template_id=template_id
-                ))
+                    template_id=template_id,
+                    format=output_format.value,
+                    error=str(e)
+                )
+
+            if watch and result.render_id:
+                result.future = self.watch_render(result.render_id, max_wait=max_wait)
+            return result
+
+        if not data_list:
+            return []
 
-        return results
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(data_list))) as executor:
+            return list(executor.map(submit, data_list))
 
     def create_text_video(
         self,
@@ -381,6 +463,9 @@ class CreatomateAdapter:
         """
         Download rendered video to local file.
 
+        The file is streamed in chunks, resumed if interrupted and only
+        appears at save_path once complete.
+
         Args:
             url: Video URL from render result
             save_path: Local path to save file
@@ -388,10 +473,4 @@ class CreatomateAdapter:
         Returns:
             Path to saved file
         """
-        response = requests.get(url)
-        response.raise_for_status()
-
-        with open(save_path, "wb") as f:
-            f.write(response.content)
-
-        return save_path
+        return self.downloader.download(url, save_path)
@@ -0,0 +1,226 @@
+"""
+Disk Cache
+Content-addressed, size-bounded LRU cache stored in SQLite
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    tag TEXT,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries (accessed_at);
+CREATE INDEX IF NOT EXISTS idx_entries_tag ON entries (tag);
+"""
+
+
+class DiskCache:
+    """
+    Byte values keyed by the SHA-256 of their inputs.
+
+    Entries may carry a TTL (None never expires) and a tag used for bulk
+    invalidation. When the stored size exceeds `max_bytes`, the least
+    recently read entries are evicted. The database runs in WAL mode with
+    short-lived connections, so several processes can share one file.
+
+    Usage:
+        cache = DiskCache("~/.cache/marketing-agents/audio.db", max_bytes=512 * 1024 ** 2)
+        key = DiskCache.make_key("tts", text, voice_id)
+        audio = cache.get(key)
+        if audio is None:
+            audio = synthesize()
+            cache.set(key, audio)
+        cache.stats()
+    """
+
+    def __init__(self, path: str, max_bytes: int = 256 * 1024 ** 2):
+        """
+        Args:
+            path: SQLite database file
+            max_bytes: Total value size kept before LRU eviction
+        """
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+        self._stats_lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'sets': 0, 'evictions': 0, 'expired': 0}
+
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(SCHEMA)
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """SHA-256 of the canonical JSON encoding of `parts`"""
+        encoded = json.dumps(parts, sort_keys=True, separators=(',', ':'), default=str)
+        return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a short-lived connection, committing on success"""
+        conn = sqlite3.connect(str(self.path), timeout=30)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    # -------------------------------------------------------------------------
+    # Bytes
+    # -------------------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Cached value, or None on a miss or an expired entry"""
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT value, expires_at FROM entries WHERE key = ?', (key,)
+            ).fetchone()
+
+            if row is None:
+                self._count('misses')
+                return None
+
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                conn.execute('DELETE FROM entries WHERE key = ?', (key,))
+                self._count('misses')
+                self._count('expired')
+                return None
+
+            conn.execute('UPDATE entries SET accessed_at = ? WHERE key = ?', (now, key))
+
+        self._count('hits')
+        return bytes(value)
+
+    def set(
+        self,
+        key: str,
+        value: bytes,
+        ttl: Optional[float] = None,
+        tag: Optional[str] = None
+    ) -> bool:
+        """
+        Store a value, evicting least recently used entries if needed.
+
+        Args:
+            key: Cache key (see make_key)
+            value: Bytes to store
+            ttl: Seconds until the entry expires (None never expires)
+            tag: Optional label for delete_tag
+
+        Returns:
+            False if the value alone is larger than max_bytes (not stored)
+        """
+        size = len(value)
+        if size > self.max_bytes:
+            return False
+
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO entries '
+                '(key, tag, value, size, created_at, expires_at, accessed_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (key, tag, sqlite3.Binary(value), size, now,
+                 now + ttl if ttl is not None else None, now)
+            )
+            self._evict(conn, now)
+
+        self._count('sets')
+        return True
+
+    def delete(self, key: str):
+        with self._connect() as conn:
+            conn.execute('DELETE FROM entries WHERE key = ?', (key,))
+
+    def delete_tag(self, pattern: str) -> int:
+        """Delete entries whose tag matches a SQL LIKE pattern; returns the count"""
+        with self._connect() as conn:
+            return conn.execute('DELETE FROM entries WHERE tag LIKE ?', (pattern,)).rowcount
+
+    def clear(self):
+        with self._connect() as conn:
+            conn.execute('DELETE FROM entries')
+
+    # -------------------------------------------------------------------------
+    # JSON
+    # -------------------------------------------------------------------------
+
+    def get_json(self, key: str) -> Optional[Any]:
+        value = self.get(key)
+        return json.loads(value) if value is not None else None
+
+    def set_json(self, key: str, value: Any, ttl: Optional[float] = None, tag: Optional[str] = None) -> bool:
+        return self.set(key, json.dumps(value, default=str).encode('utf-8'), ttl=ttl, tag=tag)
+
+    # -------------------------------------------------------------------------
+    # Metrics
+    # -------------------------------------------------------------------------
+
+    def stats(self) -> Dict:
+        """
+        Counters for this instance plus the current size of the store.
+
+        Returns:
+            Dict with hits, misses, hit_rate, sets, evictions, expired,
+            entries, bytes and max_bytes
+        """
+        with self._connect() as conn:
+            entries, total = conn.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries').fetchone()
+
+        with self._stats_lock:
+            stats = dict(self._stats)
+
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        stats['entries'] = entries
+        stats['bytes'] = total
+        stats['max_bytes'] = self.max_bytes
+        return stats
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    def _evict(self, conn: sqlite3.Connection, now: float):
+        """Drop expired entries, then least recently read ones until under max_bytes"""
+        expired = conn.execute(
+            'DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?', (now,)
+        ).rowcount
+
+        total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+        excess = total - self.max_bytes
+
+        evicted = []
+        if excess > 0:
+            for key, size in conn.execute('SELECT key, size FROM entries ORDER BY accessed_at'):
+                evicted.append((key,))
+                excess -= size
+                if excess <= 0:
+                    break
+            conn.executemany('DELETE FROM entries WHERE key = ?', evicted)
+
+        if expired:
+            self._count('expired', expired)
+        if evicted:
+            self._count('evictions', len(evicted))
+
+    def _count(self, name: str, amount: int = 1):
+        with self._stats_lock:
+            self._stats[name] += amount
@@ -4,12 +4,82 @@ Integration for AI voice cloning and text-to-speech
 """
 
 import os
+import re
+import threading
 import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+from .disk_cache import DiskCache
+from .rate_limit import is_unsent, retry_with_backoff
+
+
+DEFAULT_AUDIO_CACHE_PATH = os.getenv(
+    'AUDIO_CACHE_PATH',
+    os.path.join(os.path.expanduser('~'), '.cache', 'marketing-agents', 'audio.db')
+)
+AUDIO_CACHE_MAX_BYTES = 512 * 1024 ** 2
+
+# Full-width (CJK) punctuation is usually not followed by a space
+FULL_WIDTH_BREAKS = '。！？，；：、'
+SENTENCE_END_PATTERN = re.compile(r'(?<=[.!?…])\s+|(?<=[。！？])\s*')
+CLAUSE_END_PATTERN = re.compile(r'(?<=[,;:])\s+|(?<=[，；：、])\s*')
+
+
+def split_script(text: str, max_chars: int = 800) -> List[str]:
+    """
+    Split a script into chunks of whole sentences, each at most max_chars.
+
+    Sentences longer than max_chars are split at clause punctuation,
+    then at spaces, and as a last resort every max_chars characters.
+    """
+    def pieces(segment: str, patterns: List[re.Pattern]) -> List[str]:
+        if len(segment) <= max_chars:
+            return [segment]
+        if not patterns:
+            words, parts = [], []
+            for word in segment.split():
+                # No break point at all: hard split
+                words.extend(word[i:i + max_chars] for i in range(0, len(word), max_chars))
+            for word in words:
+                if parts and len(parts[-1]) + 1 + len(word) <= max_chars:
+                    parts[-1] += ' ' + word
+                else:
+                    parts.append(word)
+            return parts
+        result = []
+        for part in patterns[0].split(segment):
+            if part:
+                result.extend(pieces(part, patterns[1:]))
+        return result
+
+    units = []
+    for paragraph in text.split('\n'):
+        paragraph = paragraph.strip()
+        if paragraph:
+            units.extend(pieces(paragraph, [SENTENCE_END_PATTERN, CLAUSE_END_PATTERN]))
+
+    chunks: List[str] = []
+    for unit in units:
+        separator = '' if chunks and chunks[-1][-1] in FULL_WIDTH_BREAKS else ' '
+        if chunks and len(chunks[-1]) + len(separator) + len(unit) <= max_chars:
+            chunks[-1] += separator + unit
+        else:
+            chunks.append(unit)
+    return chunks
+
+
+def _strip_id3(data: bytes) -> bytes:
+    """Drop a leading ID3v2 tag so MP3 chunks concatenate cleanly"""
+    if len(data) >= 10 and data[:3] == b'ID3':
+        size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+        footer = 10 if data[5] & 0x10 else 0
+        return data[10 + size + footer:]
+    return data
+
 
 class VoiceModel(Enum):
     """ElevenLabs voice models"""
@@ -50,6 +120,20 @@ class GeneratedAudio:
     text: str
     model: str
     character_count: int
+    cached: bool = False
+
+
+class ChunkedSpeechError(RuntimeError):
+    """
+    Some chunks of a chunked synthesis failed.
+
+    `chunks` holds the GeneratedAudio of each chunk in script order, None
+    where it failed; pass it back as resume_from to request only those.
+    """
+
+    def __init__(self, message: str, chunks: List[Optional[GeneratedAudio]]):
+        super().__init__(message)
+        self.chunks = chunks
 
 
 class ElevenLabsAdapter:
@@ -76,11 +160,31 @@ class ElevenLabsAdapter:
 
         # Save audio
         adapter.save_audio(audio, "output.mp3")
+
+        # Reuse audio for repeated script/voice/settings combinations
+        adapter = ElevenLabsAdapter(audio_cache=DiskCache(DEFAULT_AUDIO_CACHE_PATH))
+        adapter.audio_cache_stats()
     """
 
     BASE_URL = "https://api.elevenlabs.io/v1"
 
-    def __init__(self, api_key: Optional[str] = None):
+    # Concurrent TTS requests per API key; set to the plan's limit
+    MAX_CONCURRENCY = 4
+
+    # (connect, read) timeout for a TTS request; synthesis of a long chunk takes a while
+    TTS_TIMEOUT = (10, 120)
+
+    _slots: Dict[str, threading.BoundedSemaphore] = {}
+    _slots_lock = threading.Lock()
+
+    def __init__(self, api_key: Optional[str] = None, audio_cache: Optional[DiskCache] = None):
+        """
+        Args:
+            api_key: ElevenLabs API key (defaults to ELEVENLABS_API_KEY)
+            audio_cache: Optional cache for synthesized audio; identical
+                text, voice, model, format and settings are served from
+                it without using character quota
+        """
         self.api_key = api_key or os.getenv("ELEVENLABS_API_KEY")
         if not self.api_key:
             raise ValueError("ELEVENLABS_API_KEY is required")
@@ -90,6 +194,16 @@ class ElevenLabsAdapter:
             "Content-Type": "application/json"
         }
 
+        self.audio_cache = audio_cache
+        self._usage_lock = threading.Lock()
+
+        # Shared by every adapter using this API key
+        with ElevenLabsAdapter._slots_lock:
+            if self.api_key not in ElevenLabsAdapter._slots:
+                ElevenLabsAdapter._slots[self.api_key] = threading.BoundedSemaphore(self.MAX_CONCURRENCY)
+            self._concurrency = ElevenLabsAdapter._slots[self.api_key]
+        self._usage = {'characters_synthesized': 0, 'characters_saved': 0}
+
     def list_voices(self) -> List[Voice]:
         """
         List all available voices (cloned and premade).
@@ -151,7 +265,8 @@ class ElevenLabsAdapter:
         stability: float = 0.5,
         similarity_boost: float = 0.75,
         style: float = 0.0,
-        use_speaker_boost: bool = True
+        use_speaker_boost: bool = True,
+        use_cache: bool = True
     ) -> GeneratedAudio:
         """
         Generate speech from text using a specific voice.
@@ -165,32 +280,58 @@ class ElevenLabsAdapter:
             similarity_boost: How closely to match original voice (0-1)
             style: Style exaggeration (0-1). Higher = more expressive
             use_speaker_boost: Boost similarity to original speaker
+            use_cache: Look up and store the audio in audio_cache
 
         Returns:
-            GeneratedAudio with audio bytes
+            GeneratedAudio with audio bytes (cached=True when no request
+            was made)
         """
         url = f"{self.BASE_URL}/text-to-speech/{voice_id}"
 
         params = {"output_format": output_format.value}
 
+        voice_settings = {
+            "stability": stability,
+            "similarity_boost": similarity_boost,
+            "style": style,
+            "use_speaker_boost": use_speaker_boost
+        }
+
         payload = {
             "text": text,
             "model_id": model.value,
-            "voice_settings": {
-                "stability": stability,
-                "similarity_boost": similarity_boost,
-                "style": style,
-                "use_speaker_boost": use_speaker_boost
-            }
+            "voice_settings": voice_settings
         }
 
+        cache_key = None
+        if use_cache and self.audio_cache is not None:
+            cache_key = DiskCache.make_key(
+                "elevenlabs-tts", text, voice_id, model.value, output_format.value, voice_settings
+            )
+            audio_data = self.audio_cache.get(cache_key)
+            if audio_data is not None:
+                self._count_usage('characters_saved', len(text))
+                return GeneratedAudio(
+                    audio_data=audio_data,
+                    voice_id=voice_id,
+                    text=text,
+                    model=model.value,
+                    character_count=len(text),
+                    cached=True
+                )
+
         response = requests.post(
             url,
             headers=self.headers,
             params=params,
-            json=payload
+            json=payload,
+            timeout=self.TTS_TIMEOUT
         )
         response.raise_for_status()
+        self._count_usage('characters_synthesized', len(text))
+
+        if cache_key is not None:
+            self.audio_cache.set(cache_key, response.content, tag=f"elevenlabs:{voice_id}")
 
         return GeneratedAudio(
             audio_data=response.content,
@@ -200,6 +341,119 @@ class ElevenLabsAdapter:
             character_count=len(text)
         )
 
+    def text_to_speech_chunked(
+        self,
+        text: str,
+        voice_id: str,
+        model: VoiceModel = VoiceModel.ELEVEN_MULTILINGUAL_V2,
+        output_format: OutputFormat = OutputFormat.MP3_44100_128,
+        max_chunk_chars: int = 800,
+        retries: int = 3,
+        resume_from: Optional[List[Optional[GeneratedAudio]]] = None,
+        **settings
+    ) -> GeneratedAudio:
+        """
+        Generate speech for a long script chunk by chunk, in parallel.
+
+        The script is split at sentence boundaries and chunks are
+        synthesized concurrently (at most MAX_CONCURRENCY requests per API
+        key). When some fail, the ChunkedSpeechError carries the chunks
+        that succeeded; calling again with resume_from=error.chunks only
+        re-requests the failed ones. With an audio_cache each chunk is
+        also cached on its own, so a plain retry is just as cheap. MP3 and
+        PCM chunks are joined byte by byte in script order, without
+        re-encoding.
+
+        Args:
+            text: Text to convert to speech
+            voice_id: ID of the voice to use
+            model: Voice model to use
+            output_format: Audio output format (MP3 or PCM)
+            max_chunk_chars: Maximum characters per request
+            retries: Retries per chunk, only for requests that certainly
+                weren't synthesized (connect timeout, 429); a read timeout
+                may come after the chunk was billed, so it fails the chunk
+                and is left to resume_from
+            resume_from: ChunkedSpeechError.chunks from an earlier call with
+                the same script and max_chunk_chars
+            **settings: Voice settings passed to text_to_speech
+
+        Returns:
+            GeneratedAudio for the whole script (cached=True when every
+            chunk came from the cache)
+
+        Raises:
+            ChunkedSpeechError: Some chunks still failed after retries
+            ValueError: resume_from doesn't match the script's chunks
+        """
+        chunks = split_script(text, max_chunk_chars)
+        if len(chunks) <= 1 and resume_from is None:
+            return self.text_to_speech(text, voice_id, model, output_format, **settings)
+
+        done = list(resume_from) if resume_from is not None else [None] * len(chunks)
+        if len(done) != len(chunks) or any(
+            audio is not None and audio.text != chunk for audio, chunk in zip(done, chunks)
+        ):
+            raise ValueError("resume_from doesn't match this script's chunks")
+
+        def synthesize(chunk: str) -> GeneratedAudio:
+            def attempt() -> GeneratedAudio:
+                with self._concurrency:
+                    return self.text_to_speech(chunk, voice_id, model, output_format, **settings)
+            return retry_with_backoff(attempt, retries=retries, should_retry=is_unsent)
+
+        pending = [index for index, audio in enumerate(done) if audio is None]
+        failed = []
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(self.MAX_CONCURRENCY, len(pending))) as executor:
+                futures = {index: executor.submit(synthesize, chunks[index]) for index in pending}
+
+            for index, future in futures.items():
+                try:
+                    done[index] = future.result()
+                except Exception as e:
+                    failed.append(f"chunk {index + 1}: {e}")
+
+        if failed:
+            raise ChunkedSpeechError(
+                f"{len(failed)} of {len(chunks)} chunks failed: {'; '.join(failed)}", done
+            )
+
+        audios = done
+
+        if output_format.value.startswith('mp3'):
+            audio_data = audios[0].audio_data + b''.join(_strip_id3(a.audio_data) for a in audios[1:])
+        else:
+            audio_data = b''.join(a.audio_data for a in audios)
+
+        return GeneratedAudio(
+            audio_data=audio_data,
+            voice_id=voice_id,
+            text=text,
+            model=model.value,
+            character_count=len(text),
+            cached=all(a.cached for a in audios)
+        )
+
+    def audio_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Audio cache hit statistics for this adapter.
+
+        Returns:
+            DiskCache.stats() plus characters_synthesized and
+            characters_saved (served from cache), or None without a cache
+        """
+        if self.audio_cache is None:
+            return None
+
+        with self._usage_lock:
+            usage = dict(self._usage)
+        return {**self.audio_cache.stats(), **usage}
+
+    def _count_usage(self, name: str, amount: int):
+        with self._usage_lock:
+            self._usage[name] += amount
+
     def text_to_speech_stream(
         self,
         text: str,
@@ -233,7 +487,8 @@ class ElevenLabsAdapter:
             headers=self.headers,
             params=params,
             json=payload,
-            stream=True
+            stream=True,
+            timeout=self.TTS_TIMEOUT
         )
         response.raise_for_status()
 
@@ -5,11 +5,16 @@ Connects to Google Analytics Data API for website metrics
 
 import requests
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, Iterator, List, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+from .response_cache import ResponseCache
+from .token_cache import TokenCache
+
 
 class GAMetric(Enum):
     """Available GA4 metrics"""
@@ -88,13 +93,29 @@ class GoogleAnalyticsAdapter:
     """
 
     BASE_URL = "https://analyticsdata.googleapis.com/v1beta"
+    TOKEN_URL = "https://oauth2.googleapis.com/token"
+    SCOPE = "https://www.googleapis.com/auth/analytics.readonly"
+
+    # batchRunReports accepts at most 5 requests per call
+    BATCH_SIZE = 5
+
+    # Rows per request when paging through a whole report
+    PAGE_SIZE = 10000
+
+    OVERVIEW_METRICS = [
+        "sessions", "totalUsers", "newUsers", "screenPageViews",
+        "bounceRate", "averageSessionDuration", "conversions",
+        "sessionConversionRate", "totalRevenue", "transactions"
+    ]
 
     def __init__(
         self,
         property_id: str,
         access_token: Optional[str] = None,
         service_account_json: Optional[str] = None,
-        credentials_json: Optional[str] = None
+        credentials_json: Optional[str] = None,
+        token_cache: Optional[TokenCache] = None,
+        response_cache: Optional[ResponseCache] = None
     ):
         """
         Initialize GA4 adapter
@@ -104,6 +125,10 @@ class GoogleAnalyticsAdapter:
             access_token: OAuth2 access token
             service_account_json: Path to service account JSON file
             credentials_json: Service account JSON as string (alternative to file)
+            token_cache: Token cache to use (defaults to the on-disk cache
+                shared by all processes, keyed by service account and scope)
+            response_cache: Optional cache for report responses; closed
+                date ranges are then served from disk
         """
         # Ensure property_id is in correct format
         if property_id and not property_id.startswith("properties/"):
@@ -114,8 +139,8 @@ class GoogleAnalyticsAdapter:
         self.access_token = access_token
         self.service_account_json = service_account_json
         self.credentials_json = credentials_json
-        self._token = None
-        self._token_expiry = None
+        self.token_cache = token_cache or TokenCache.persistent()
+        self.response_cache = response_cache
         self._credentials = None
 
         # Parse credentials JSON if provided as string
@@ -144,56 +169,24 @@ class GoogleAnalyticsAdapter:
 
         return ""
 
-    def _get_service_account_token(self) -> str:
-        """Get access token from service account using JWT"""
-        try:
-            import jwt
-            import time
-
-            if not self._credentials:
-                return ""
-
-            # Check if we have a valid cached token
-            if self._token and self._token_expiry and time.time() < self._token_expiry:
-                return self._token
-
-            # Create JWT for service account
-            now = int(time.time())
-            claims = {
-                "iss": self._credentials.get("client_email"),
-                "sub": self._credentials.get("client_email"),
-                "aud": "https://oauth2.googleapis.com/token",
-                "iat": now,
-                "exp": now + 3600,
-                "scope": "https://www.googleapis.com/auth/analytics.readonly"
-            }
-
-            private_key = self._credentials.get("private_key", "")
-
-            # Sign JWT
-            signed_jwt = jwt.encode(
-                claims,
-                private_key,
-                algorithm="RS256"
-            )
-
-            # Exchange JWT for access token
-            response = requests.post(
-                "https://oauth2.googleapis.com/token",
-                data={
-                    "grant_type": "urn:ietf:params:oauth:grant-type:jwt-bearer",
-                    "assertion": signed_jwt
-                }
-            )
+    @property
+    def _token_key(self) -> str:
+        client_email = (self._credentials or {}).get("client_email", "")
+        return f"ga:{client_email}:{self.SCOPE}"
 
-            if response.status_code == 200:
-                token_data = response.json()
-                self._token = token_data.get("access_token")
-                self._token_expiry = now + token_data.get("expires_in", 3600) - 60
-                return self._token
+    def _get_service_account_token(self) -> str:
+        """
+        Get access token from service account using JWT
 
+        Tokens are shared through the token cache (on disk by default), so
+        the RS256 signing and token exchange happen about once an hour per
+        service account rather than once per adapter or process.
+        """
+        if not self._credentials:
             return ""
 
+        try:
+            return self.token_cache.get(self._token_key, self._fetch_service_account_token)
         except ImportError:
             # PyJWT not installed, return empty (will use mock data)
             return ""
@@ -201,7 +194,56 @@ class GoogleAnalyticsAdapter:
             print(f"GA Auth error: {e}")
             return ""
 
-    def run_report(
+    def _fetch_service_account_token(self) -> Tuple[str, int]:
+        """
+        Sign a JWT with the service account key and exchange it for a token.
+
+        Returns:
+            Tuple of (access token, expires_in seconds)
+
+        Raises:
+            ImportError: If PyJWT is not installed
+            RuntimeError: If Google rejects the assertion
+        """
+        import jwt
+
+        # Create JWT for service account
+        now = int(time.time())
+        claims = {
+            "iss": self._credentials.get("client_email"),
+            "sub": self._credentials.get("client_email"),
+            "aud": self.TOKEN_URL,
+            "iat": now,
+            "exp": now + 3600,
+            "scope": self.SCOPE
+        }
+
+        private_key = self._credentials.get("private_key", "")
+
+        # Sign JWT
+        signed_jwt = jwt.encode(
+            claims,
+            private_key,
+            algorithm="RS256"
+        )
+
+        # Exchange JWT for access token
+        response = requests.post(
+            self.TOKEN_URL,
+            data={
+                "grant_type": "urn:ietf:params:oauth:grant-type:jwt-bearer",
+                "assertion": signed_jwt
+            },
+            timeout=30
+        )
+
+        if response.status_code != 200:
+            raise RuntimeError(f"token exchange failed ({response.status_code}): {response.text}")
+
+        token_data = response.json()
+        return token_data["access_token"], token_data.get("expires_in", 3600)
+
+    def _report_request(
         self,
         start_date: str,
         end_date: str,
@@ -211,23 +253,7 @@ class GoogleAnalyticsAdapter:
         order_by: Optional[List[Dict]] = None,
         limit: int = 100
     ) -> Dict[str, Any]:
-        """
-        Run a GA4 report
-
-        Args:
-            start_date: Start date (YYYY-MM-DD or "7daysAgo")
-            end_date: End date (YYYY-MM-DD or "today")
-            metrics: List of metric names
-            dimensions: Optional list of dimension names
-            dimension_filter: Optional dimension filter
-            order_by: Optional ordering
-            limit: Max rows to return
-
-        Returns:
-            Report data as dictionary
-        """
-        url = f"{self.BASE_URL}/{self.property_id}:runReport"
-
+        """Build a runReport request body"""
         request_body = {
             "dateRanges": [{"startDate": start_date, "endDate": end_date}],
             "metrics": [{"name": m} for m in metrics],
@@ -243,10 +269,21 @@ class GoogleAnalyticsAdapter:
         if order_by:
             request_body["orderBys"] = order_by
 
+        return request_body
+
+    def _post(
+        self,
+        method: str,
+        request_body: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """POST to a property-level Data API method (runReport, batchRunReports)"""
+        url = f"{self.BASE_URL}/{self.property_id}:{method}"
+
         try:
             response = requests.post(
                 url,
-                headers=self._get_headers(),
+                headers=headers or self._get_headers(),
                 json=request_body,
                 timeout=30
             )
@@ -258,33 +295,391 @@ class GoogleAnalyticsAdapter:
         except Exception as e:
             return {"error": str(e)}
 
-    def get_overview(
+    def run_report(
         self,
-        start_date: str = "7daysAgo",
-        end_date: str = "today"
-    ) -> GAReport:
+        start_date: str,
+        end_date: str,
+        metrics: List[str],
+        dimensions: Optional[List[str]] = None,
+        dimension_filter: Optional[Dict] = None,
+        order_by: Optional[List[Dict]] = None,
+        limit: int = 100
+    ) -> Dict[str, Any]:
         """
-        Get overview metrics for the date range
+        Run a GA4 report
 
         Args:
-            start_date: Start date
-            end_date: End date
+            start_date: Start date (YYYY-MM-DD or "7daysAgo")
+            end_date: End date (YYYY-MM-DD or "today")
+            metrics: List of metric names
+            dimensions: Optional list of dimension names
+            dimension_filter: Optional dimension filter
+            order_by: Optional ordering
+            limit: Max rows to return
 
         Returns:
-            GAReport with all metrics
+            Report data as dictionary
+        """
+        return self._report(self._report_request(
+            start_date, end_date, metrics, dimensions, dimension_filter, order_by, limit
+        ))
+
+    def run_reports(self, report_requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run several reports with as few round-trips as possible
+
+        Requests are grouped into batchRunReports calls of up to
+        BATCH_SIZE reports, and the batches run concurrently. If a batch
+        fails as a whole, its reports are retried individually (also
+        concurrently) so one bad request doesn't sink the others.
+
+        Args:
+            report_requests: runReport bodies (see _report_request)
+
+        Returns:
+            One report per request, in order; failed ones contain "error"
+        """
+        if self.response_cache is None:
+            return self._run_batched(report_requests)
+
+        reports = [self._cached_report(request_body) for request_body in report_requests]
+        misses = [i for i, report in enumerate(reports) if report is None]
+
+        fetched = self._run_batched([report_requests[i] for i in misses])
+        for i, report in zip(misses, fetched):
+            reports[i] = report
+            self._store_report(report_requests[i], report)
+
+        return reports
+
+    def _run_batched(self, report_requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """run_reports without the response cache"""
+        if not report_requests:
+            return []
+
+        headers = self._get_headers()
+        chunks = [
+            report_requests[i:i + self.BATCH_SIZE]
+            for i in range(0, len(report_requests), self.BATCH_SIZE)
+        ]
+
+        def run_single(request_body: Dict) -> Dict:
+            return self._post("runReport", request_body, headers)
+
+        def run_chunk(chunk: List[Dict]) -> List[Dict]:
+            if len(chunk) == 1:
+                return [run_single(chunk[0])]
+
+            result = self._post("batchRunReports", {"requests": chunk}, headers)
+            reports = result.get("reports")
+            if "error" not in result and reports is not None and len(reports) == len(chunk):
+                return reports
+
+            with ThreadPoolExecutor(max_workers=len(chunk)) as executor:
+                return list(executor.map(run_single, chunk))
+
+        if len(chunks) == 1:
+            return run_chunk(chunks[0])
+
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            return [report for reports in executor.map(run_chunk, chunks) for report in reports]
+
+    def iter_report(
+        self,
+        start_date: str,
+        end_date: str,
+        metrics: List[str],
+        dimensions: Optional[List[str]] = None,
+        dimension_filter: Optional[Dict] = None,
+        order_by: Optional[List[Dict]] = None,
+        page_size: int = PAGE_SIZE,
+        max_rows: Optional[int] = None,
+        errors: Optional[List[str]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream every row of a report, paging with offset until rowCount.
+
+        Pages are requested lazily, so only one page is held in memory.
+
+        Args:
+            start_date: Start date (YYYY-MM-DD or "7daysAgo")
+            end_date: End date (YYYY-MM-DD or "today")
+            metrics: List of metric names
+            dimensions: Optional list of dimension names
+            dimension_filter: Optional dimension filter
+            order_by: Optional ordering (keep it set for stable paging)
+            page_size: Rows per request (GA4 allows up to 250,000)
+            max_rows: Optional cap on the total rows returned
+            errors: Optional list that receives the error that ended paging
+
+        Yields:
+            Dicts of dimension name -> str and metric name -> int/float
+        """
+        request_body = self._report_request(
+            start_date, end_date, metrics, dimensions, dimension_filter, order_by, page_size
+        )
+
+        for page in self._iter_report_pages(request_body, page_size, max_rows, errors):
+            yield from self._typed_rows(page)
+
+    def export_report(
+        self,
+        path: str,
+        start_date: str,
+        end_date: str,
+        metrics: List[str],
+        dimensions: Optional[List[str]] = None,
+        dimension_filter: Optional[Dict] = None,
+        order_by: Optional[List[Dict]] = None,
+        page_size: int = PAGE_SIZE,
+        max_rows: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Stream a report straight into a Parquet file, one row group per page.
+
+        Requires pyarrow (installed with streamlit). Dimensions are stored
+        as strings, integer metrics as int64 and the rest as float64.
+
+        Args:
+            path: Output .parquet file
+            (other args as in iter_report)
+
+        Returns:
+            {"path", "rows", "pages"} plus "error" if paging stopped early
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        request_body = self._report_request(
+            start_date, end_date, metrics, dimensions, dimension_filter, order_by, page_size
+        )
+        errors: List[str] = []
+        writer = None
+        rows = pages = 0
+
+        try:
+            for page in self._iter_report_pages(request_body, page_size, max_rows, errors):
+                if writer is None:
+                    fields = [(name, pa.string()) for name in self._dimension_names(page)]
+                    fields += [
+                        (name, pa.int64() if integer else pa.float64())
+                        for name, integer in self._metric_types(page)
+                    ]
+                    schema = pa.schema(fields)
+                    writer = pq.ParquetWriter(path, schema)
+
+                columns = {name: [] for name in schema.names}
+                for row in self._typed_rows(page):
+                    for name, value in row.items():
+                        columns[name].append(value)
+
+                writer.write_table(pa.Table.from_pydict(columns, schema=schema))
+                rows += len(page.get("rows", []))
+                pages += 1
+        finally:
+            if writer is not None:
+                writer.close()
+
+        result = {"path": path, "rows": rows, "pages": pages}
+        if errors:
+            result["error"] = errors[0]
+        return result
+
+    def _report(self, request_body: Dict[str, Any]) -> Dict[str, Any]:
+        """runReport a prepared body, through the response cache if configured"""
+        report = self._cached_report(request_body)
+        if report is None:
+            report = self._post("runReport", request_body)
+            self._store_report(request_body, report)
+        return report
+
+    def _cache_args(self, request_body: Dict[str, Any]) -> tuple:
+        """(provider, account, endpoint, fields, date_ranges) for the response cache"""
+        fields = {key: value for key, value in request_body.items() if key != "dateRanges"}
+        date_ranges = [
+            (date_range.get("startDate"), date_range.get("endDate"))
+            for date_range in request_body.get("dateRanges", [])
+        ]
+        return "ga", self.property_id, "runReport", fields, date_ranges
+
+    def _cached_report(self, request_body: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        if self.response_cache is None:
+            return None
+        return self.response_cache.get(*self._cache_args(request_body))
+
+    def _store_report(self, request_body: Dict[str, Any], report: Dict[str, Any]):
+        if self.response_cache is not None:
+            self.response_cache.put(*self._cache_args(request_body), report)
+
+    def _run_body(self, request_body: Dict[str, Any], all_rows: bool = False) -> Dict[str, Any]:
+        """runReport a prepared body; with all_rows, page through every row"""
+        if not all_rows:
+            return self._report(request_body)
+
+        rows: List[Dict] = []
+        errors: List[str] = []
+        for page in self._iter_report_pages(request_body, request_body["limit"], errors=errors):
+            rows.extend(page["rows"])
+
+        if errors and not rows:
+            return {"error": errors[0]}
+        return {"rows": rows, "rowCount": len(rows)}
+
+    def _remaining_rows(self, request_body: Dict[str, Any], report: Dict[str, Any]) -> Dict[str, Any]:
+        """Page in the rows past a report's first page, when rowCount says there are more"""
+        rows = report.get("rows", [])
+        if "error" in report or len(rows) >= report.get("rowCount", 0):
+            return report
+
+        rows = list(rows)
+        errors: List[str] = []
+        for page in self._iter_report_pages(request_body, request_body["limit"], errors=errors, offset=len(rows)):
+            rows.extend(page["rows"])
+
+        if errors:
+            print(f"Warning: GA report truncated at {len(rows)} of {report['rowCount']} rows: {errors[0]}")
+        return {**report, "rows": rows}
+
+    def _iter_report_pages(
+        self,
+        request_body: Dict[str, Any],
+        page_size: int,
+        max_rows: Optional[int] = None,
+        errors: Optional[List[str]] = None,
+        offset: int = 0
+    ) -> Iterator[Dict[str, Any]]:
         """
-        metrics = [
-            "sessions", "totalUsers", "newUsers", "screenPageViews",
-            "bounceRate", "averageSessionDuration", "conversions",
-            "sessionConversionRate", "totalRevenue", "transactions"
+        Yield raw runReport pages, advancing offset by the rows received.
+
+        Stops at the first error, an empty page, rowCount, or max_rows.
+        The error message, if any, is appended to `errors`. `offset`
+        skips rows already fetched.
+        """
+        request_body = dict(request_body)
+
+        while True:
+            limit = page_size if max_rows is None else min(page_size, max_rows - offset)
+            if limit <= 0:
+                return
+
+            request_body["offset"] = offset
+            request_body["limit"] = limit
+            page = self._post("runReport", request_body)
+            if "error" in page:
+                if errors is not None:
+                    errors.append(str(page["error"]))
+                return
+
+            rows = page.get("rows", [])
+            if not rows:
+                return
+
+            yield page
+            offset += len(rows)
+
+            if offset >= page.get("rowCount", 0):
+                return
+
+    @staticmethod
+    def _dimension_names(report: Dict[str, Any]) -> List[str]:
+        return [header.get("name", "") for header in report.get("dimensionHeaders", [])]
+
+    @staticmethod
+    def _metric_types(report: Dict[str, Any]) -> List[Tuple[str, bool]]:
+        """(metric name, is integer) per metric header"""
+        return [
+            (header.get("name", ""), header.get("type") == "TYPE_INTEGER")
+            for header in report.get("metricHeaders", [])
         ]
 
-        report = self.run_report(start_date, end_date, metrics)
+    @classmethod
+    def _typed_rows(cls, report: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Rows of a runReport response as flat dicts with numeric metrics"""
+        dimension_names = cls._dimension_names(report)
+        metric_types = cls._metric_types(report)
 
+        for row in report.get("rows", []):
+            typed = {
+                name: value.get("value", "")
+                for name, value in zip(dimension_names, row.get("dimensionValues", []))
+            }
+            for (name, integer), value in zip(metric_types, row.get("metricValues", [])):
+                number = float(value.get("value") or 0)
+                typed[name] = int(number) if integer else number
+            yield typed
+
+    # -------------------------------------------------------------------------
+    # Report definitions
+    # -------------------------------------------------------------------------
+
+    def _overview_request(self, start_date: str, end_date: str) -> Dict[str, Any]:
+        return self._report_request(start_date, end_date, self.OVERVIEW_METRICS)
+
+    def _traffic_sources_request(self, start_date: str, end_date: str, limit: int = 10) -> Dict[str, Any]:
+        return self._report_request(
+            start_date,
+            end_date,
+            metrics=["sessions", "totalUsers", "conversions"],
+            dimensions=["sessionSource", "sessionMedium"],
+            order_by=[{"metric": {"metricName": "sessions"}, "desc": True}],
+            limit=limit
+        )
+
+    def _channels_request(self, start_date: str, end_date: str) -> Dict[str, Any]:
+        return self._report_request(
+            start_date,
+            end_date,
+            metrics=["sessions"],
+            dimensions=["sessionDefaultChannelGroup"]
+        )
+
+    def _devices_request(self, start_date: str, end_date: str) -> Dict[str, Any]:
+        return self._report_request(
+            start_date,
+            end_date,
+            metrics=["sessions"],
+            dimensions=["deviceCategory"]
+        )
+
+    def _top_pages_request(self, start_date: str, end_date: str, limit: int = 10) -> Dict[str, Any]:
+        return self._report_request(
+            start_date,
+            end_date,
+            metrics=["screenPageViews", "averageSessionDuration", "bounceRate"],
+            dimensions=["pagePath"],
+            order_by=[{"metric": {"metricName": "screenPageViews"}, "desc": True}],
+            limit=limit
+        )
+
+    def _landing_pages_request(self, start_date: str, end_date: str, limit: int = 10) -> Dict[str, Any]:
+        return self._report_request(
+            start_date,
+            end_date,
+            metrics=["sessions", "conversions", "sessionConversionRate", "bounceRate"],
+            dimensions=["landingPage"],
+            order_by=[{"metric": {"metricName": "sessions"}, "desc": True}],
+            limit=limit
+        )
+
+    def _campaigns_request(self, start_date: str, end_date: str, limit: int = 20) -> Dict[str, Any]:
+        return self._report_request(
+            start_date,
+            end_date,
+            metrics=["sessions", "totalUsers", "conversions", "totalRevenue"],
+            dimensions=["sessionCampaignName"],
+            order_by=[{"metric": {"metricName": "sessions"}, "desc": True}],
+            limit=limit
+        )
+
+    # -------------------------------------------------------------------------
+    # Report parsers
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _parse_overview(report: Dict[str, Any]) -> GAReport:
         if "error" in report:
             return GAReport()
 
-        # Parse the response
         try:
             rows = report.get("rows", [])
             if rows:
@@ -306,27 +701,8 @@ class GoogleAnalyticsAdapter:
 
         return GAReport()
 
-    def get_traffic_sources(
-        self,
-        start_date: str = "7daysAgo",
-        end_date: str = "today",
-        limit: int = 10
-    ) -> List[Dict]:
-        """
-        Get traffic breakdown by source/medium
-
-        Returns:
-            List of traffic sources with sessions
-        """
-        report = self.run_report(
-            start_date,
-            end_date,
-            metrics=["sessions", "totalUsers", "conversions"],
-            dimensions=["sessionSource", "sessionMedium"],
-            order_by=[{"metric": {"metricName": "sessions"}, "desc": True}],
-            limit=limit
-        )
-
+    @staticmethod
+    def _parse_traffic_sources(report: Dict[str, Any]) -> List[Dict]:
         if "error" in report:
             return []
 
@@ -344,6 +720,113 @@ class GoogleAnalyticsAdapter:
 
         return sources
 
+    @staticmethod
+    def _parse_sessions_by(report: Dict[str, Any]) -> Dict[str, int]:
+        """Single-dimension sessions breakdown (channels, devices)"""
+        if "error" in report:
+            return {}
+
+        breakdown = {}
+        for row in report.get("rows", []):
+            key = row.get("dimensionValues", [{}])[0].get("value", "Other")
+            sessions = int(float(row.get("metricValues", [{}])[0].get("value", 0)))
+            breakdown[key] = sessions
+
+        return breakdown
+
+    @staticmethod
+    def _parse_top_pages(report: Dict[str, Any]) -> List[Dict]:
+        if "error" in report:
+            return []
+
+        pages = []
+        for row in report.get("rows", []):
+            path = row.get("dimensionValues", [{}])[0].get("value", "/")
+            vals = row.get("metricValues", [])
+            pages.append({
+                "path": path,
+                "pageviews": int(float(vals[0].get("value", 0))),
+                "avg_time": float(vals[1].get("value", 0)),
+                "bounce_rate": float(vals[2].get("value", 0)) * 100
+            })
+
+        return pages
+
+    @staticmethod
+    def _parse_landing_pages(report: Dict[str, Any]) -> List[Dict]:
+        if "error" in report:
+            return []
+
+        pages = []
+        for row in report.get("rows", []):
+            path = row.get("dimensionValues", [{}])[0].get("value", "/")
+            vals = row.get("metricValues", [])
+            pages.append({
+                "path": path,
+                "sessions": int(float(vals[0].get("value", 0))),
+                "conversions": int(float(vals[1].get("value", 0))),
+                "conversion_rate": float(vals[2].get("value", 0)) * 100,
+                "bounce_rate": float(vals[3].get("value", 0)) * 100
+            })
+
+        return pages
+
+    @staticmethod
+    def _parse_campaigns(report: Dict[str, Any]) -> List[Dict]:
+        if "error" in report:
+            return []
+
+        campaigns = []
+        for row in report.get("rows", []):
+            campaign = row.get("dimensionValues", [{}])[0].get("value", "(not set)")
+            vals = row.get("metricValues", [])
+            campaigns.append({
+                "campaign": campaign,
+                "sessions": int(float(vals[0].get("value", 0))),
+                "users": int(float(vals[1].get("value", 0))),
+                "conversions": int(float(vals[2].get("value", 0))),
+                "revenue": float(vals[3].get("value", 0))
+            })
+
+        return campaigns
+
+    # -------------------------------------------------------------------------
+    # Reports
+    # -------------------------------------------------------------------------
+
+    def get_overview(
+        self,
+        start_date: str = "7daysAgo",
+        end_date: str = "today"
+    ) -> GAReport:
+        """
+        Get overview metrics for the date range
+
+        Args:
+            start_date: Start date
+            end_date: End date
+
+        Returns:
+            GAReport with all metrics
+        """
+        return self._parse_overview(self._report(self._overview_request(start_date, end_date)))
+
+    def get_traffic_sources(
+        self,
+        start_date: str = "7daysAgo",
+        end_date: str = "today",
+        limit: int = 10
+    ) -> List[Dict]:
+        """
+        Get traffic breakdown by source/medium
+
+        Returns:
+            List of traffic sources with sessions
+        """
+        return self._parse_traffic_sources(
+            self._report(self._traffic_sources_request(start_date, end_date, limit))
+        )
+
     def get_channel_breakdown(
         self,
         start_date: str = "7daysAgo",
@@ -355,23 +838,7 @@ class GoogleAnalyticsAdapter:
         Returns:
             Dictionary with channel -> sessions
         """
-        report = self.run_report(
-            start_date,
-            end_date,
-            metrics=["sessions"],
-            dimensions=["sessionDefaultChannelGroup"]
-        )
-
-        if "error" in report:
-            return {}
-
-        channels = {}
-        for row in report.get("rows", []):
-            channel = row.get("dimensionValues", [{}])[0].get("value", "Other")
-            sessions = int(float(row.get("metricValues", [{}])[0].get("value", 0)))
-            channels[channel] = sessions
-
-        return channels
+        return self._parse_sessions_by(self._report(self._channels_request(start_date, end_date)))
 
     def get_device_breakdown(
         self,
@@ -384,136 +851,61 @@ class GoogleAnalyticsAdapter:
         Returns:
             Dictionary with device -> sessions
         """
-        report = self.run_report(
-            start_date,
-            end_date,
-            metrics=["sessions"],
-            dimensions=["deviceCategory"]
-        )
-
-        if "error" in report:
-            return {}
-
-        devices = {}
-        for row in report.get("rows", []):
-            device = row.get("dimensionValues", [{}])[0].get("value", "Other")
-            sessions = int(float(row.get("metricValues", [{}])[0].get("value", 0)))
-            devices[device] = sessions
-
-        return devices
+        return self._parse_sessions_by(self._report(self._devices_request(start_date, end_date)))
 
     def get_top_pages(
         self,
         start_date: str = "7daysAgo",
         end_date: str = "today",
-        limit: int = 10
+        limit: Optional[int] = 10
     ) -> List[Dict]:
         """
         Get top pages by pageviews
 
+        Args:
+            limit: Max rows; None pages through every row
+
         Returns:
             List of pages with metrics
         """
-        report = self.run_report(
-            start_date,
-            end_date,
-            metrics=["screenPageViews", "averageSessionDuration", "bounceRate"],
-            dimensions=["pagePath"],
-            order_by=[{"metric": {"metricName": "screenPageViews"}, "desc": True}],
-            limit=limit
-        )
-
-        if "error" in report:
-            return []
-
-        pages = []
-        for row in report.get("rows", []):
-            path = row.get("dimensionValues", [{}])[0].get("value", "/")
-            vals = row.get("metricValues", [])
-            pages.append({
-                "path": path,
-                "pageviews": int(float(vals[0].get("value", 0))),
-                "avg_time": float(vals[1].get("value", 0)),
-                "bounce_rate": float(vals[2].get("value", 0)) * 100
-            })
-
-        return pages
+        request_body = self._top_pages_request(start_date, end_date, limit or self.PAGE_SIZE)
+        return self._parse_top_pages(self._run_body(request_body, all_rows=limit is None))
 
     def get_landing_pages(
         self,
         start_date: str = "7daysAgo",
         end_date: str = "today",
-        limit: int = 10
+        limit: Optional[int] = 10
     ) -> List[Dict]:
         """
         Get top landing pages with conversion metrics
 
+        Args:
+            limit: Max rows; None pages through every row
+
         Returns:
             List of landing pages with metrics
         """
-        report = self.run_report(
-            start_date,
-            end_date,
-            metrics=["sessions", "conversions", "sessionConversionRate", "bounceRate"],
-            dimensions=["landingPage"],
-            order_by=[{"metric": {"metricName": "sessions"}, "desc": True}],
-            limit=limit
-        )
-
-        if "error" in report:
-            return []
-
-        pages = []
-        for row in report.get("rows", []):
-            path = row.get("dimensionValues", [{}])[0].get("value", "/")
-            vals = row.get("metricValues", [])
-            pages.append({
-                "path": path,
-                "sessions": int(float(vals[0].get("value", 0))),
-                "conversions": int(float(vals[1].get("value", 0))),
-                "conversion_rate": float(vals[2].get("value", 0)) * 100,
-                "bounce_rate": float(vals[3].get("value", 0)) * 100
-            })
-
-        return pages
+        request_body = self._landing_pages_request(start_date, end_date, limit or self.PAGE_SIZE)
+        return self._parse_landing_pages(self._run_body(request_body, all_rows=limit is None))
 
     def get_campaign_performance(
         self,
         start_date: str = "7daysAgo",
         end_date: str = "today",
-        limit: int = 20
+        limit: Optional[int] = 20
     ) -> List[Dict]:
         """
         Get performance by campaign (UTM campaign)
 
+        Args:
+            limit: Max rows; None pages through every row
+
         Returns:
             List of campaigns with metrics
         """
-        report = self.run_report(
-            start_date,
-            end_date,
-            metrics=["sessions", "totalUsers", "conversions", "totalRevenue"],
-            dimensions=["sessionCampaignName"],
-            order_by=[{"metric": {"metricName": "sessions"}, "desc": True}],
-            limit=limit
-        )
-
-        if "error" in report:
-            return []
-
-        campaigns = []
-        for row in report.get("rows", []):
-            campaign = row.get("dimensionValues", [{}])[0].get("value", "(not set)")
-            vals = row.get("metricValues", [])
-            campaigns.append({
-                "campaign": campaign,
-                "sessions": int(float(vals[0].get("value", 0))),
-                "users": int(float(vals[1].get("value", 0))),
-                "conversions": int(float(vals[2].get("value", 0))),
-                "revenue": float(vals[3].get("value", 0))
-            })
-
-        return campaigns
+        request_body = self._campaigns_request(start_date, end_date, limit or self.PAGE_SIZE)
+        return self._parse_campaigns(self._run_body(request_body, all_rows=limit is None))
 
     def get_full_report(
         self,
@@ -523,10 +915,29 @@ class GoogleAnalyticsAdapter:
         """
         Get comprehensive analytics report
 
+        All seven reports go out through run_reports: two batchRunReports
+        calls issued concurrently instead of seven sequential requests.
+
         Returns:
             Dictionary with all analytics data
         """
-        overview = self.get_overview(start_date, end_date)
+        campaigns_request = self._campaigns_request(start_date, end_date, self.PAGE_SIZE)
+
+        (overview_report, channels, devices, traffic_sources,
+         top_pages, landing_pages, campaigns) = self.run_reports([
+            self._overview_request(start_date, end_date),
+            self._channels_request(start_date, end_date),
+            self._devices_request(start_date, end_date),
+            self._traffic_sources_request(start_date, end_date),
+            self._top_pages_request(start_date, end_date),
+            self._landing_pages_request(start_date, end_date),
+            campaigns_request,
+        ])
+
+        # Every campaign row, so callers can join them to ad platforms
+        campaigns = self._remaining_rows(campaigns_request, campaigns)
+
+        overview = self._parse_overview(overview_report)
 
         return {
             "overview": {
@@ -541,12 +952,12 @@ class GoogleAnalyticsAdapter:
                 "revenue": overview.revenue,
                 "transactions": overview.transactions
             },
-            "channels": self.get_channel_breakdown(start_date, end_date),
-            "devices": self.get_device_breakdown(start_date, end_date),
-            "traffic_sources": self.get_traffic_sources(start_date, end_date),
-            "top_pages": self.get_top_pages(start_date, end_date),
-            "landing_pages": self.get_landing_pages(start_date, end_date),
-            "campaigns": self.get_campaign_performance(start_date, end_date)
+            "channels": self._parse_sessions_by(channels),
+            "devices": self._parse_sessions_by(devices),
+            "traffic_sources": self._parse_traffic_sources(traffic_sources),
+            "top_pages": self._parse_top_pages(top_pages),
+            "landing_pages": self._parse_landing_pages(landing_pages),
+            "campaigns": self._parse_campaigns(campaigns)
         }
 
 
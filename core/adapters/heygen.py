@@ -4,12 +4,15 @@ Integration for AI avatar videos and lip sync
 """
 
 import os
-import time
 import requests
+from concurrent.futures import Future
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+from .job_poller import JobPoller, RESULT_MARGIN
+from .media_downloader import MediaDownloader
+
 
 class VideoAspectRatio(Enum):
     """Video aspect ratios"""
@@ -84,7 +87,15 @@ class HeyGenAdapter:
 
     BASE_URL = "https://api.heygen.com"
 
-    def __init__(self, api_key: Optional[str] = None):
+    # (connect, read) timeout for status requests made by the poller
+    STATUS_TIMEOUT = (5, 15)
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        poller: Optional[JobPoller] = None,
+        downloader: Optional[MediaDownloader] = None
+    ):
         self.api_key = api_key or os.getenv("HEYGEN_API_KEY")
         if not self.api_key:
             raise ValueError("HEYGEN_API_KEY is required")
@@ -94,6 +105,10 @@ class HeyGenAdapter:
             "Content-Type": "application/json"
         }
 
+        # Shared status poller: waiting on many videos costs one thread
+        self.poller = poller or JobPoller.shared()
+        self.downloader = downloader or MediaDownloader.shared()
+
     def list_avatars(self) -> List[Avatar]:
         """
         List all available avatars.
@@ -305,7 +320,8 @@ class HeyGenAdapter:
         response = requests.get(
             f"{self.BASE_URL}/v1/video_status.get",
             headers=self.headers,
-            params={"video_id": video_id}
+            params={"video_id": video_id},
+            timeout=self.STATUS_TIMEOUT
         )
         response.raise_for_status()
 
@@ -338,19 +354,44 @@ class HeyGenAdapter:
         Returns:
             VideoResult with final status and video_url
         """
-        start_time = time.time()
+        future = self.watch_video(video_id, max_wait, poll_interval)
+        try:
+            return future.result(timeout=max_wait + RESULT_MARGIN)
+        finally:
+            future.cancel()
+
+    def watch_video(
+        self,
+        video_id: str,
+        max_wait: int = 600,
+        poll_interval: int = 10
+    ) -> Future:
+        """
+        Track a video on the shared poller without blocking.
+
+        Args:
+            video_id: ID of the video
+            max_wait: Maximum seconds to wait
+            poll_interval: Initial seconds between status checks
 
-        while time.time() - start_time < max_wait:
-            result = self.get_video_status(video_id)
+        Returns:
+            Future resolved with the completed VideoResult
+        """
+        return self.poller.watch(
+            "heygen", video_id, self._check_video,
+            timeout=max_wait, min_interval=poll_interval
+        )
 
-            if result.status == "completed":
-                return result
-            elif result.status == "failed":
-                raise Exception(f"Video generation failed: {result.error}")
+    def _check_video(self, video_id: str) -> Optional[VideoResult]:
+        """Poller check: VideoResult once completed, None while pending"""
+        result = self.get_video_status(video_id)
 
-            time.sleep(poll_interval)
+        if result.status == "completed":
+            return result
+        elif result.status == "failed":
+            raise Exception(f"Video generation failed: {result.error}")
 
-        raise TimeoutError(f"Video {video_id} did not complete within {max_wait} seconds")
+        return None
 
     def upload_talking_photo(
         self,
@@ -425,6 +466,9 @@ class HeyGenAdapter:
         """
         Download a video to local file.
 
+        The file is streamed in chunks, resumed if interrupted and only
+        appears at save_path once complete.
+
         Args:
             video_url: URL of the video
             save_path: Local path to save
@@ -432,15 +476,7 @@ class HeyGenAdapter:
         Returns:
             Path to saved file
         """
-        response = requests.get(video_url)
-        response.raise_for_status()
-
-        os.makedirs(os.path.dirname(save_path) if os.path.dirname(save_path) else ".", exist_ok=True)
-
-        with open(save_path, 'wb') as f:
-            f.write(response.content)
-
-        return save_path
+        return self.downloader.download(video_url, save_path)
 
     def create_full_video(
         self,
@@ -3,10 +3,16 @@ Hyros Adapter
 Integration with Hyros analytics and attribution platform
 """
 
-from typing import Dict, List, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 import requests
+from requests.adapters import HTTPAdapter
+
+from .timestamps import parse_timestamp
 
 
 @dataclass
@@ -28,7 +34,8 @@ class HyrosSale:
     last_source_tag: str = ""
     ad_platform: str = ""
     ad_account_id: str = ""
-    ad_id: str = ""
+    ad_id: str = ""  # First-click ad source id
+    last_ad_id: str = ""  # Last-click ad source id
     tags: List[str] = field(default_factory=list)
     raw_data: Dict = field(default_factory=dict)
 
@@ -62,6 +69,71 @@ class HyrosSource:
     raw_data: Dict = field(default_factory=dict)
 
 
+# Per-request timeout (seconds) for each endpoint in fetch_bundle
+BUNDLE_TIMEOUTS = {
+    'sales': 20,
+    'leads': 20,
+    'sources': 10,
+    'tags': 10,
+    'ads': 15,
+    'calls': 15,
+}
+
+# Wall-clock budget (seconds) for each endpoint in fetch_bundle, all pages included
+BUNDLE_BUDGETS = {
+    'sales': 120,
+    'leads': 120,
+    'sources': 30,
+    'tags': 30,
+    'ads': 45,
+    'calls': 45,
+}
+
+# Sales/leads window fetch_bundle uses when no start date is given
+BUNDLE_DEFAULT_WINDOW = timedelta(days=30)
+
+
+@dataclass
+class HyrosBundle:
+    """
+    Everything the attribution panel needs, fetched in one fan-out.
+
+    Endpoints that failed or timed out are listed in `errors` and their
+    data is left empty (or partial, for paged sales/leads).
+    """
+    sales: List[HyrosSale] = field(default_factory=list)
+    leads: List[HyrosLead] = field(default_factory=list)
+    sources: List[HyrosSource] = field(default_factory=list)
+    tags: List[str] = field(default_factory=list)
+    ads: List[Dict] = field(default_factory=list)
+    calls: List[Dict] = field(default_factory=list)
+
+    errors: Dict[str, str] = field(default_factory=dict)
+    timings: Dict[str, float] = field(default_factory=dict)  # seconds per endpoint
+
+    @property
+    def complete(self) -> bool:
+        return not self.errors
+
+    def to_attribution_data(self, attribution_window: int = 7) -> Dict:
+        """Shape sales for the dashboard's render_hyros_attribution panel"""
+        by_source: Dict[str, Dict] = {}
+        for sale in self.sales:
+            source = sale.first_source or 'unknown'
+            group = by_source.get(source)
+            if group is None:
+                group = by_source[source] = {'revenue': 0, 'conversions': 0}
+            group['revenue'] += sale.amount
+            group['conversions'] += 1
+
+        return {
+            'total_attributed_revenue': sum(sale.amount for sale in self.sales),
+            'attribution_window': attribution_window,
+            'by_source': by_source,
+            'errors': dict(self.errors)
+        }
+
+
 class HyrosAdapter:
     """
     Adapter for Hyros analytics and attribution platform.
@@ -80,19 +152,40 @@ class HyrosAdapter:
         self.api_key = api_key
         self.base_url = base_url or "https://api.hyros.com/v1/api/v1.0"
 
-    def _request(self, endpoint: str, params: Optional[Dict] = None, method: str = "GET") -> Dict:
+        # requests.Session isn't thread-safe: fetch_bundle's workers each get their own
+        self._local = threading.local()
+        # Long-lived so the workers, and their sessions' connections, are reused
+        self._bundle_executor: Optional[ThreadPoolExecutor] = None
+        self._bundle_executor_lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """Keep-alive session of the calling thread"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            session.headers.update({
+                'API-Key': self.api_key,
+                'Content-Type': 'application/json'
+            })
+            session.mount('https://', HTTPAdapter(pool_maxsize=1))
+        return session
+
+    def _request(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        method: str = "GET",
+        timeout: float = 30
+    ) -> Dict:
         """Make API request using API-Key header authentication"""
         url = f"{self.base_url}{endpoint}"
-        headers = {
-            'API-Key': self.api_key,
-            'Content-Type': 'application/json'
-        }
 
         try:
             if method == "GET":
-                response = requests.get(url, headers=headers, params=params, timeout=30)
+                response = self.session.get(url, params=params, timeout=timeout)
             else:
-                response = requests.post(url, headers=headers, json=params, timeout=30)
+                response = self.session.post(url, json=params, timeout=timeout)
 
             if response.status_code == 401:
                 return {'error': 'Unauthorized - invalid API key'}
@@ -128,6 +221,16 @@ class HyrosAdapter:
             'response': 'Connected successfully'
         }
 
+    def snapshot(self, **kwargs):
+        """
+        Get the shared HyrosSnapshot for this API key.
+
+        Dashboards issuing several attribution queries per render should
+        go through the snapshot instead of calling the API each time.
+        """
+        from .hyros_snapshot import HyrosSnapshot
+        return HyrosSnapshot.for_adapter(self, **kwargs)
+
     def get_user_info(self) -> Dict:
         """Get account user information"""
         result = self._request('/user-info')
@@ -143,7 +246,9 @@ class HyrosAdapter:
         end_date: Optional[datetime] = None
     ) -> List[HyrosSale]:
         """
-        Fetch sales/transactions from Hyros.
+        Fetch one page of sales/transactions from Hyros.
+
+        Use iter_sales to walk the full history of a period.
 
         Args:
             limit: Number of results per page
@@ -154,7 +259,7 @@ class HyrosAdapter:
         Returns:
             List of HyrosSale objects
         """
-        params = {'limit': limit}
+        params = {'limit': limit, **self._date_params(start_date, end_date)}
         if page_id:
             params['pageId'] = page_id
 
@@ -166,31 +271,168 @@ class HyrosAdapter:
         sales = []
         for item in result.get('result', []):
             sale = self._parse_sale(item)
+            if self._in_window(sale.created_at, start_date, end_date):
+                sales.append(sale)
 
-            # Date filtering
-            if start_date and sale.created_at and sale.created_at < start_date:
-                continue
-            if end_date and sale.created_at and sale.created_at > end_date:
-                continue
+        return sales
 
-            sales.append(sale)
+    def iter_sales(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        page_size: int = 250,
+        max_pages: Optional[int] = None,
+        timeout: float = 30,
+        errors: Optional[List[str]] = None,
+        deadline: Optional[float] = None
+    ) -> Iterator[HyrosSale]:
+        """
+        Stream every sale in a period, following Hyros nextPageId cursors.
 
-        return sales
+        Pages are fetched lazily, so callers can aggregate the full
+        history without holding it in memory.
+
+        Args:
+            start_date: Filter by start date
+            end_date: Filter by end date
+            page_size: Results per request
+            max_pages: Optional cap on the number of pages fetched
+            timeout: Per-request timeout in seconds
+            errors: Optional list that receives the error that ended paging
+            deadline: Optional time.monotonic() after which paging stops
+
+        Yields:
+            HyrosSale objects within the window
+        """
+        params = {'limit': page_size, **self._date_params(start_date, end_date)}
+
+        for items in self._iter_pages('/sales', params, max_pages, timeout, errors, deadline):
+            before_window = 0
+            for item in items:
+                sale = self._parse_sale(item)
+                if start_date and sale.created_at and sale.created_at < start_date:
+                    before_window += 1
+                    continue
+                if self._in_window(sale.created_at, start_date, end_date):
+                    yield sale
+
+            # Hyros lists newest first: a page entirely before the window
+            # means the rest of the history is too
+            if items and before_window == len(items):
+                return
+
+    def iter_leads(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        page_size: int = 250,
+        max_pages: Optional[int] = None,
+        timeout: float = 30,
+        errors: Optional[List[str]] = None,
+        deadline: Optional[float] = None
+    ) -> Iterator[HyrosLead]:
+        """
+        Stream every lead in a period, following Hyros nextPageId cursors.
+
+        Args:
+            start_date: Filter by creation start date
+            end_date: Filter by creation end date
+            page_size: Results per request
+            max_pages: Optional cap on the number of pages fetched
+            timeout: Per-request timeout in seconds
+            errors: Optional list that receives the error that ended paging
+            deadline: Optional time.monotonic() after which paging stops
+
+        Yields:
+            HyrosLead objects within the window
+        """
+        params = {'limit': page_size, **self._date_params(start_date, end_date)}
+
+        for items in self._iter_pages('/leads', params, max_pages, timeout, errors, deadline):
+            for item in items:
+                lead = self._parse_lead(item)
+                if self._in_window(lead.created_at, start_date, end_date):
+                    yield lead
+
+    def _iter_pages(
+        self,
+        endpoint: str,
+        params: Dict,
+        max_pages: Optional[int] = None,
+        timeout: float = 30,
+        errors: Optional[List[str]] = None,
+        deadline: Optional[float] = None
+    ) -> Iterator[List[Dict]]:
+        """
+        Yield the raw result list of each page of a cursor-paginated endpoint.
+
+        Stops at the first error, an empty page, a missing or repeated
+        nextPageId, after max_pages, or at the deadline (a time.monotonic()
+        value; request timeouts are shortened to meet it). The error
+        message, if any, is appended to `errors`.
+        """
+        params = dict(params)
+        seen = set()
+        pages = 0
+
+        while True:
+            request_timeout = timeout
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    if errors is not None:
+                        errors.append(f"Time budget exceeded after {pages} pages")
+                    return
+                request_timeout = min(timeout, remaining)
+
+            result = self._request(endpoint, params, timeout=request_timeout)
+            if 'error' in result:
+                if errors is not None:
+                    errors.append(str(result['error']))
+                return
+
+            items = result.get('result', []) or []
+            yield items
+            pages += 1
+
+            next_page = result.get('nextPageId')
+            if not items or not next_page or next_page in seen:
+                return
+            if max_pages and pages >= max_pages:
+                return
+
+            seen.add(next_page)
+            params['pageId'] = next_page
+
+    @staticmethod
+    def _date_params(start_date: Optional[datetime], end_date: Optional[datetime]) -> Dict:
+        """Date window params; Hyros applies it server-side"""
+        params = {}
+        if start_date:
+            params['fromDate'] = start_date.strftime('%Y-%m-%dT%H:%M:%S')
+        if end_date:
+            params['toDate'] = end_date.strftime('%Y-%m-%dT%H:%M:%S')
+        return params
+
+    @staticmethod
+    def _in_window(
+        created_at: Optional[datetime],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime]
+    ) -> bool:
+        """Local date check, kept as a fallback to the server-side filter"""
+        if created_at is None:
+            return True
+        if start_date and created_at < start_date:
+            return False
+        if end_date and created_at > end_date:
+            return False
+        return True
 
     def _parse_sale(self, data: Dict) -> HyrosSale:
         """Parse Hyros sale data"""
-        # Parse creation date
-        created_str = data.get('creationDate', '')
-        created_at = None
-        if created_str:
-            try:
-                # Format: "Sat Jan 03 11:39:31 UTC 2026"
-                created_at = datetime.strptime(created_str, '%a %b %d %H:%M:%S %Z %Y')
-            except:
-                try:
-                    created_at = datetime.fromisoformat(created_str.replace('Z', '+00:00'))
-                except:
-                    pass
+        # Parse creation date, e.g. "Sat Jan 03 11:39:31 UTC 2026"
+        created_at = parse_timestamp(data.get('creationDate', ''))
 
         # Extract lead info
         lead = data.get('lead', {}) or {}
@@ -202,6 +444,7 @@ class HyrosAdapter:
 
         # Get ad platform info
         ad_source = first_source.get('adSource', {}) or {}
+        last_ad_source = last_source.get('adSource', {}) or {}
 
         return HyrosSale(
             id=data.get('id', ''),
@@ -221,6 +464,7 @@ class HyrosAdapter:
             ad_platform=ad_source.get('platform', ''),
             ad_account_id=ad_source.get('adAccountId', ''),
             ad_id=ad_source.get('adSourceId', ''),
+            last_ad_id=last_ad_source.get('adSourceId', ''),
             tags=lead.get('tags', []),
             raw_data=data
         )
@@ -230,7 +474,7 @@ class HyrosAdapter:
         limit: int = 100,
         page_id: Optional[str] = None
     ) -> List[HyrosLead]:
-        """Fetch leads from Hyros"""
+        """Fetch one page of leads from Hyros (see iter_leads for full history)"""
         params = {'limit': limit}
         if page_id:
             params['pageId'] = page_id
@@ -248,13 +492,7 @@ class HyrosAdapter:
 
     def _parse_lead(self, data: Dict) -> HyrosLead:
         """Parse Hyros lead data"""
-        created_str = data.get('creationDate', '')
-        created_at = None
-        if created_str:
-            try:
-                created_at = datetime.fromisoformat(created_str.replace('Z', '+00:00'))
-            except:
-                pass
+        created_at = parse_timestamp(data.get('creationDate', ''))
 
         return HyrosLead(
             id=data.get('id', ''),
@@ -327,6 +565,92 @@ class HyrosAdapter:
 
         return result.get('result', [])
 
+    def fetch_bundle(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        timeouts: Optional[Dict[str, float]] = None,
+        limit: int = 100,
+        budgets: Optional[Dict[str, float]] = None
+    ) -> HyrosBundle:
+        """
+        Fetch sales, leads, sources, tags, ads and calls concurrently.
+
+        All six endpoints run in parallel on the adapter's long-lived
+        worker threads, each with its own keep-alive session, so repeated
+        calls reuse connections. A call takes about as long as its
+        slowest endpoint. A failing or slow endpoint never blocks the others: its
+        error is recorded in `bundle.errors` and whatever it returned so
+        far is kept. No request of an endpoint outlives its wall-clock
+        budget; paged endpoints keep the pages fetched within it.
+
+        Args:
+            start_date: Sales/leads window start (default: BUNDLE_DEFAULT_WINDOW
+                before end_date, never the whole history)
+            end_date: Sales/leads window end
+            timeouts: Per-endpoint request timeout overrides (seconds)
+            limit: Page size for the non-paged listings
+            budgets: Per-endpoint wall-clock budget overrides (seconds)
+
+        Returns:
+            HyrosBundle with data, errors and per-endpoint timings
+        """
+        timeouts = {**BUNDLE_TIMEOUTS, **(timeouts or {})}
+        budgets = {**BUNDLE_BUDGETS, **(budgets or {})}
+        if start_date is None:
+            start_date = (end_date or datetime.now()) - BUNDLE_DEFAULT_WINDOW
+        bundle = HyrosBundle()
+
+        def listing(endpoint: str, parse: Optional[Callable] = None) -> Callable[[float, float, List[str]], List]:
+            def fetch(timeout: float, deadline: float, errors: List[str]) -> List:
+                params = None if endpoint == '/tags' else {'limit': limit}
+                result = self._request(endpoint, params, timeout=min(timeout, deadline - time.monotonic()))
+                if 'error' in result:
+                    errors.append(str(result['error']))
+                    return []
+                items = result.get('result', []) or []
+                return [parse(item) for item in items] if parse else items
+            return fetch
+
+        def paged(iterate: Callable) -> Callable[[float, float, List[str]], List]:
+            def fetch(timeout: float, deadline: float, errors: List[str]) -> List:
+                return list(iterate(start_date, end_date, timeout=timeout, errors=errors, deadline=deadline))
+            return fetch
+
+        fetchers = {
+            'sales': paged(self.iter_sales),
+            'leads': paged(self.iter_leads),
+            'sources': listing('/sources', self._parse_source),
+            'tags': listing('/tags'),
+            'ads': listing('/ads'),
+            'calls': listing('/calls'),
+        }
+
+        def run(name: str):
+            errors: List[str] = []
+            started = time.monotonic()
+            try:
+                data = fetchers[name](timeouts[name], started + budgets[name], errors)
+            except Exception as e:
+                data = []
+                errors.append(str(e))
+            return name, data, errors, time.monotonic() - started
+
+        with self._bundle_executor_lock:
+            if self._bundle_executor is None:
+                self._bundle_executor = ThreadPoolExecutor(
+                    max_workers=len(BUNDLE_TIMEOUTS), thread_name_prefix='hyros-bundle'
+                )
+            executor = self._bundle_executor
+
+        for name, data, errors, elapsed in executor.map(run, fetchers):
+            setattr(bundle, name, data)
+            bundle.timings[name] = elapsed
+            if errors:
+                bundle.errors[name] = errors[-1]
+
+        return bundle
+
     def get_attribution_summary(
         self,
         start_date: Optional[datetime] = None,
@@ -335,54 +659,69 @@ class HyrosAdapter:
         """
         Get a summary of attribution data.
 
-        Returns aggregated data by source/platform.
+        Streams every sale in the period and returns aggregated data
+        by source/platform.
         """
-        sales = self.get_sales(limit=1000, start_date=start_date, end_date=end_date)
-
-        summary = {
-            'total_sales': len(sales),
-            'total_revenue': sum(s.amount for s in sales),
-            'by_platform': {},
-            'by_source': {},
-            'qualified_sales': sum(1 for s in sales if s.qualified),
-            'recurring_sales': sum(1 for s in sales if s.recurring)
-        }
+        by_platform: Dict[str, Dict] = {}
+        by_source: Dict[str, Dict] = {}
+        total_sales = qualified_sales = recurring_sales = 0
+        total_revenue = 0.0
+
+        for sale in self.iter_sales(start_date, end_date):
+            amount = sale.amount
+            total_sales += 1
+            total_revenue += amount
+            if sale.qualified:
+                qualified_sales += 1
+            if sale.recurring:
+                recurring_sales += 1
 
-        for sale in sales:
             # Group by platform
             platform = sale.ad_platform or 'organic'
-            if platform not in summary['by_platform']:
-                summary['by_platform'][platform] = {'sales': 0, 'revenue': 0}
-            summary['by_platform'][platform]['sales'] += 1
-            summary['by_platform'][platform]['revenue'] += sale.amount
+            group = by_platform.get(platform)
+            if group is None:
+                group = by_platform[platform] = {'sales': 0, 'revenue': 0}
+            group['sales'] += 1
+            group['revenue'] += amount
 
             # Group by source
             source = sale.first_source or 'unknown'
-            if source not in summary['by_source']:
-                summary['by_source'][source] = {'sales': 0, 'revenue': 0}
-            summary['by_source'][source]['sales'] += 1
-            summary['by_source'][source]['revenue'] += sale.amount
+            group = by_source.get(source)
+            if group is None:
+                group = by_source[source] = {'sales': 0, 'revenue': 0}
+            group['sales'] += 1
+            group['revenue'] += amount
 
-        return summary
+        return {
+            'total_sales': total_sales,
+            'total_revenue': total_revenue,
+            'by_platform': by_platform,
+            'by_source': by_source,
+            'qualified_sales': qualified_sales,
+            'recurring_sales': recurring_sales
+        }
 
-    def match_meta_campaign(self, meta_ad_account_id: str) -> List[HyrosSale]:
+    def match_meta_campaign(
+        self,
+        meta_ad_account_id: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[HyrosSale]:
         """
         Find Hyros sales attributed to a specific Meta ad account.
 
         Args:
             meta_ad_account_id: Meta Ads account ID (without 'act_' prefix)
+            start_date: Optional start of period (default: full history)
+            end_date: Optional end of period
 
         Returns:
             List of sales attributed to this Meta account
         """
-        sales = self.get_sales(limit=1000)
-
         # Clean the ad account ID
         clean_id = meta_ad_account_id.replace('act_', '')
 
-        matched = []
-        for sale in sales:
-            if sale.ad_account_id == clean_id and sale.ad_platform == 'FACEBOOK':
-                matched.append(sale)
-
-        return matched
+        return [
+            sale for sale in self.iter_sales(start_date, end_date)
+            if sale.ad_account_id == clean_id and sale.ad_platform == 'FACEBOOK'
+        ]
@@ -0,0 +1,395 @@
+"""
+Hyros Snapshot
+Per-client cache of Hyros sales, leads and sources shared by attribution queries
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from .hyros import HyrosAdapter, HyrosLead, HyrosSale, HyrosSource
+
+
+class _DatedCollection:
+    """
+    Records keyed by id, covering [covered_from, now] as of fetched_at.
+
+    Misses are filled incrementally: older history is backfilled only for
+    the uncovered range, and a stale snapshot re-fetches just the tail
+    (since the last fetch, minus an overlap for late-arriving updates).
+
+    Loading is split so the network part runs without the snapshot lock:
+    plan() picks the ranges, fetch_ranges() downloads them, and apply()
+    swaps the result in. A range whose listing hit an error keeps its
+    records but doesn't advance coverage or fetched_at, so it is fetched
+    again on the next query.
+    """
+
+    def __init__(self, fetch: Callable[[Optional[datetime], Optional[datetime], List[str]], Iterator]):
+        self.fetch = fetch
+        self.records: Dict[str, object] = {}
+        self.covered_from: Optional[datetime] = None
+        self.full_history = False
+        self.fetched_at: Optional[datetime] = None
+        self.fetched_at_monotonic = 0.0
+
+    def covers(self, start_date: Optional[datetime]) -> bool:
+        if self.fetched_at is None:
+            return False
+        if self.full_history:
+            return True
+        return start_date is not None and start_date >= self.covered_from
+
+    def plan(
+        self,
+        start_date: Optional[datetime],
+        tail_from: Optional[datetime]
+    ) -> List[Tuple[str, Optional[datetime], Optional[datetime]]]:
+        """
+        (kind, start, end) ranges to fetch: 'initial' [start_date, now],
+        'backfill' [start_date, covered_from) and 'tail' [tail_from, now]
+        """
+        if self.fetched_at is None:
+            return [('initial', start_date, None)]
+
+        ranges = []
+        if not self.covers(start_date):
+            ranges.append(('backfill', start_date, self.covered_from))
+        if tail_from is not None:
+            ranges.append(('tail', tail_from, None))
+        return ranges
+
+    def fetch_ranges(
+        self,
+        ranges: List[Tuple[str, Optional[datetime], Optional[datetime]]]
+    ) -> Tuple[List[Tuple[str, object]], List[str]]:
+        """
+        Download ranges; touches no shared state.
+
+        Returns:
+            ((key, record) pairs, kinds of the ranges that completed)
+        """
+        keyed, completed = [], []
+        for kind, start, end in ranges:
+            errors: List[str] = []
+            occurrences: Dict[str, int] = {}
+            for record in self.fetch(start, end, errors):
+                # Keep the snapshot compact; raw payloads are only needed for debugging
+                record.raw_data = {}
+                keyed.append((self._key(record, occurrences), record))
+
+            if errors:
+                print(f"Warning: Hyros {kind} fetch incomplete, will retry: {errors[0]}")
+            else:
+                completed.append(kind)
+        return keyed, completed
+
+    def apply(
+        self,
+        keyed: List[Tuple[str, object]],
+        completed: List[str],
+        start_date: Optional[datetime],
+        fetched_at: datetime,
+        fetched_at_monotonic: float
+    ):
+        """Store fetched records and extend coverage; call under the snapshot lock"""
+        self.records.update(keyed)
+
+        if 'initial' in completed or 'backfill' in completed:
+            if start_date is None:
+                self.full_history = True
+            elif self.covered_from is None or start_date < self.covered_from:
+                self.covered_from = start_date
+
+        if 'initial' in completed or 'tail' in completed:
+            self.fetched_at = fetched_at
+            self.fetched_at_monotonic = fetched_at_monotonic
+
+    def select(self, start_date: Optional[datetime], end_date: Optional[datetime]) -> List:
+        records = []
+        for record in self.records.values():
+            created_at = record.created_at
+            if created_at is not None:
+                if start_date and created_at < start_date:
+                    continue
+                if end_date and created_at > end_date:
+                    continue
+            records.append(record)
+        records.sort(key=lambda record: record.created_at or datetime.min, reverse=True)
+        return records
+
+    @staticmethod
+    def _key(record, occurrences: Dict[str, int]) -> str:
+        """
+        The record's id, or for id-less records its content plus how many
+        identical records preceded it in the same range, so they neither
+        collapse into one nor duplicate when the range is re-fetched
+        """
+        if record.id:
+            return record.id
+        content = repr(record)
+        index = occurrences.get(content, 0)
+        occurrences[content] = index + 1
+        return f"{content}#{index}"
+
+
+class HyrosSnapshot:
+    """
+    Serves Hyros attribution queries from a shared in-memory snapshot.
+
+    Sales and leads are fetched once and then refreshed at most every
+    `ttl`, incrementally by date. Sources, ads and calls are re-listed
+    once per `ttl`. Every query reports a hit or a miss in `stats()`.
+
+    Snapshots are shared per API key (one per client), so the dashboard's
+    summary, Meta matching and source panels reuse the same download.
+    Downloads run outside the snapshot lock: other datasets, and cached
+    reads of the one being refreshed, are served meanwhile.
+
+    Usage:
+        snapshot = HyrosSnapshot.for_adapter(HyrosAdapter(api_key="..."))
+        summary = snapshot.get_attribution_summary(start_date, end_date)
+        matched = snapshot.match_meta_campaign("act_123", start_date, end_date)
+        snapshot.stats()
+    """
+
+    _instances: Dict[str, 'HyrosSnapshot'] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(
+        self,
+        adapter: HyrosAdapter,
+        ttl: timedelta = timedelta(minutes=15),
+        overlap: timedelta = timedelta(hours=24)
+    ):
+        """
+        Args:
+            adapter: Configured Hyros adapter
+            ttl: How long fetched data is served before refreshing
+            overlap: How far before the last fetch a tail refresh starts,
+                to pick up late updates (refunds, re-attribution)
+        """
+        self.adapter = adapter
+        self.ttl = ttl
+        self.overlap = overlap
+
+        self._sales = _DatedCollection(lambda start, end, errors: adapter.iter_sales(start, end, errors=errors))
+        self._leads = _DatedCollection(lambda start, end, errors: adapter.iter_leads(start, end, errors=errors))
+        self._lists: Dict[str, tuple] = {}
+
+        self._lock = threading.Lock()
+        # One download at a time per dataset; concurrent misses wait and reuse it
+        self._fetch_locks: Dict[str, threading.Lock] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    @classmethod
+    def for_adapter(cls, adapter: HyrosAdapter, **kwargs) -> 'HyrosSnapshot':
+        """
+        Get the shared snapshot for this adapter's API key.
+
+        Raises:
+            ValueError: kwargs (ttl, overlap) differ from those the shared
+                snapshot was created with
+        """
+        with cls._instances_lock:
+            snapshot = cls._instances.get(adapter.api_key)
+            if snapshot is None:
+                return cls._instances.setdefault(adapter.api_key, cls(adapter, **kwargs))
+
+            for key, value in kwargs.items():
+                if getattr(snapshot, key) != value:
+                    raise ValueError(
+                        f"Shared Hyros snapshot already uses {key}={getattr(snapshot, key)!r}, got {value!r}"
+                    )
+            return snapshot
+
+    # -------------------------------------------------------------------------
+    # Datasets
+    # -------------------------------------------------------------------------
+
+    def get_sales(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[HyrosSale]:
+        """Sales in a period, newest first"""
+        return self._dated('sales', self._sales, start_date, end_date)
+
+    def get_leads(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[HyrosLead]:
+        """Leads in a period, newest first"""
+        return self._dated('leads', self._leads, start_date, end_date)
+
+    def get_sources(self) -> List[HyrosSource]:
+        return self._listing('sources', lambda: self.adapter.get_sources(limit=250))
+
+    def get_ads(self) -> List[Dict]:
+        return self._listing('ads', lambda: self.adapter.get_ads(limit=250))
+
+    def get_calls(self) -> List[Dict]:
+        return self._listing('calls', lambda: self.adapter.get_calls(limit=250))
+
+    def invalidate(self):
+        """Drop all cached data; the next query refetches"""
+        with self._lock:
+            self._sales = _DatedCollection(self._sales.fetch)
+            self._leads = _DatedCollection(self._leads.fetch)
+            self._lists.clear()
+
+    # -------------------------------------------------------------------------
+    # Attribution queries
+    # -------------------------------------------------------------------------
+
+    def get_attribution_summary(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> Dict:
+        """Same result as HyrosAdapter.get_attribution_summary, served from the snapshot"""
+        by_platform: Dict[str, Dict] = {}
+        by_source: Dict[str, Dict] = {}
+        sales = self.get_sales(start_date, end_date)
+
+        for sale in sales:
+            for key, target in ((sale.ad_platform or 'organic', by_platform),
+                                (sale.first_source or 'unknown', by_source)):
+                group = target.get(key)
+                if group is None:
+                    group = target[key] = {'sales': 0, 'revenue': 0}
+                group['sales'] += 1
+                group['revenue'] += sale.amount
+
+        return {
+            'total_sales': len(sales),
+            'total_revenue': sum(sale.amount for sale in sales),
+            'by_platform': by_platform,
+            'by_source': by_source,
+            'qualified_sales': sum(1 for sale in sales if sale.qualified),
+            'recurring_sales': sum(1 for sale in sales if sale.recurring)
+        }
+
+    def match_meta_campaign(
+        self,
+        meta_ad_account_id: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[HyrosSale]:
+        """Same result as HyrosAdapter.match_meta_campaign, served from the snapshot"""
+        clean_id = meta_ad_account_id.replace('act_', '')
+        return [
+            sale for sale in self.get_sales(start_date, end_date)
+            if sale.ad_account_id == clean_id and sale.ad_platform == 'FACEBOOK'
+        ]
+
+    # -------------------------------------------------------------------------
+    # Metrics
+    # -------------------------------------------------------------------------
+
+    def stats(self) -> Dict:
+        """
+        Hit/miss counters per dataset.
+
+        Returns:
+            Dict like {'sales': {'hits', 'misses', 'records_fetched',
+            'hit_rate'}, ..., 'cached_sales': n, 'cached_leads': n}
+        """
+        with self._lock:
+            result = {}
+            for name, counters in self._stats.items():
+                total = counters['hits'] + counters['misses']
+                result[name] = {
+                    **counters,
+                    'hit_rate': counters['hits'] / total if total else 0.0
+                }
+            result['cached_sales'] = len(self._sales.records)
+            result['cached_leads'] = len(self._leads.records)
+            return result
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    def _dated(
+        self,
+        name: str,
+        collection: _DatedCollection,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime]
+    ) -> List:
+        def cached() -> Optional[List]:
+            fresh = time.monotonic() - collection.fetched_at_monotonic < self.ttl.total_seconds()
+            if collection.covers(start_date) and fresh:
+                self._count(name, hit=True)
+                return collection.select(start_date, end_date)
+            return None
+
+        with self._lock:
+            records = cached()
+            if records is not None:
+                return records
+
+        with self._fetch_lock(name):
+            with self._lock:
+                # Another thread may have loaded it while we waited
+                records = cached()
+                if records is not None:
+                    return records
+
+                fresh = time.monotonic() - collection.fetched_at_monotonic < self.ttl.total_seconds()
+                tail_from = None
+                if collection.fetched_at is not None and not fresh:
+                    tail_from = collection.fetched_at - self.overlap
+                ranges = collection.plan(start_date, tail_from)
+
+            fetched_at, fetched_at_monotonic = datetime.now(), time.monotonic()
+            keyed, completed = collection.fetch_ranges(ranges)
+
+            with self._lock:
+                collection.apply(keyed, completed, start_date, fetched_at, fetched_at_monotonic)
+                self._count(name, hit=False, fetched=len(keyed))
+                return collection.select(start_date, end_date)
+
+    def _listing(self, name: str, fetch: Callable[[], List]) -> List:
+        def cached() -> Optional[List]:
+            entry = self._lists.get(name)
+            if entry and time.monotonic() - entry[0] < self.ttl.total_seconds():
+                self._count(name, hit=True)
+                return entry[1]
+            return None
+
+        with self._lock:
+            items = cached()
+            if items is not None:
+                return items
+
+        with self._fetch_lock(name):
+            with self._lock:
+                items = cached()
+                if items is not None:
+                    return items
+
+            fetched_at = time.monotonic()
+            items = fetch()
+            for item in items:
+                if hasattr(item, 'raw_data'):
+                    item.raw_data = {}
+
+            with self._lock:
+                # The adapter returns [] on errors, so an empty listing isn't cached
+                if items:
+                    self._lists[name] = (fetched_at, items)
+                self._count(name, hit=False, fetched=len(items))
+                return items
+
+    def _fetch_lock(self, name: str) -> threading.Lock:
+        with self._lock:
+            return self._fetch_locks.setdefault(name, threading.Lock())
+
+    def _count(self, name: str, hit: bool, fetched: int = 0):
+        counters = self._stats.setdefault(name, {'hits': 0, 'misses': 0, 'records_fetched': 0})
+        counters['hits' if hit else 'misses'] += 1
+        counters['records_fetched'] += fetched
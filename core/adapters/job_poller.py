@@ -0,0 +1,298 @@
+"""
+Job Poller
+One background thread that polls many pending render/generation jobs
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+
+# check(job_id) returns None while the job is pending, the final payload
+# when it is done, and raises when the job failed
+CheckFn = Callable[[str], Optional[Any]]
+
+# check_many(job_ids) returns {job_id: payload or None}; ids missing from
+# the result are treated as still pending
+CheckManyFn = Callable[[List[str]], Dict[str, Optional[Any]]]
+
+# Seconds callers blocking on a watched Future allow beyond the job's own
+# timeout, for the poller to notice and report it
+RESULT_MARGIN = 30
+
+
+@dataclass(eq=False)
+class _Job:
+    provider: str
+    job_id: str
+    check: CheckFn
+    check_many: Optional[CheckManyFn]
+    future: Future
+    min_interval: float
+    deadline: float
+    timeout: float
+    started_at: float = field(default_factory=time.monotonic)
+
+
+class JobPoller:
+    """
+    Multiplexes status polling for jobs across providers.
+
+    Instead of one thread per job sleeping in a loop, jobs are kept in a
+    schedule ordered by their next check. A single thread wakes when the
+    earliest job is due and hands the due checks (grouped into one call
+    per provider when a batch `check_many` is given) to a small I/O pool.
+    Outcomes are handled in completion callbacks, so a slow or hung check
+    never delays other jobs, and each job's deadline is scheduled on its
+    own: its Future fails with TimeoutError on time even while a check
+    is still in flight. Checks should still set request timeouts, as a
+    hung check occupies a pool worker.
+
+    The delay between checks grows with the job's age: young jobs are
+    checked every `min_interval`, a job that has run for a minute every
+    `age_factor` * 60 seconds, capped at `max_interval`.
+
+    Usage:
+        poller = JobPoller.shared()
+        future = poller.watch("creatomate", render_id, adapter._check_render, timeout=300)
+        future.add_done_callback(lambda f: print(f.result()["url"]))
+        results = [f.result() for f in futures]  # wait for a whole batch
+    """
+
+    _shared: Optional['JobPoller'] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        min_interval: float = 2.0,
+        max_interval: float = 30.0,
+        age_factor: float = 0.1,
+        max_workers: int = 8
+    ):
+        """
+        Args:
+            min_interval: Default seconds between checks for a new job
+            max_interval: Upper bound on the delay between checks
+            age_factor: Delay as a fraction of the job's age
+            max_workers: Concurrent single-job status requests
+        """
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.age_factor = age_factor
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='job-poll')
+        self._schedule: List[tuple] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._jobs: set = set()
+
+        self._stats = {'watched': 0, 'checks': 0, 'batch_calls': 0, 'completed': 0, 'failed': 0, 'timed_out': 0}
+
+    @classmethod
+    def shared(cls) -> 'JobPoller':
+        """Process-wide poller used when adapters get no explicit one"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def watch(
+        self,
+        provider: str,
+        job_id: str,
+        check: CheckFn,
+        timeout: float = 300,
+        min_interval: Optional[float] = None,
+        check_many: Optional[CheckManyFn] = None
+    ) -> Future:
+        """
+        Start tracking a job.
+
+        Args:
+            provider: Provider name; jobs of one provider share check_many
+            job_id: Provider's job id
+            check: Single-job status function (see CheckFn)
+            timeout: Seconds before the Future fails with TimeoutError
+            min_interval: Seconds before the first check (default: poller's)
+            check_many: Optional batch status function (see CheckManyFn)
+
+        Returns:
+            Future resolved with the check's final payload
+        """
+        future: Future = Future()
+        interval = min_interval if min_interval is not None else self.min_interval
+        now = time.monotonic()
+
+        job = _Job(
+            provider=provider,
+            job_id=job_id,
+            check=check,
+            check_many=check_many,
+            future=future,
+            min_interval=interval,
+            deadline=now + timeout,
+            timeout=timeout,
+            started_at=now
+        )
+
+        with self._condition:
+            self._stats['watched'] += 1
+            self._jobs.add(job)
+            self._push(job, now + interval)
+            self._push(job, job.deadline, deadline=True)
+            self._ensure_thread()
+            self._condition.notify()
+
+        return future
+
+    def pending(self) -> int:
+        with self._condition:
+            return self._pending()
+
+    def stats(self) -> Dict[str, int]:
+        with self._condition:
+            return {**self._stats, 'pending': self._pending()}
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    def _push(self, job: _Job, due: float, deadline: bool = False):
+        """Schedule a check of the job (or its timeout); caller holds the condition"""
+        heapq.heappush(self._schedule, (due, next(self._sequence), job, deadline))
+
+    def _pending(self) -> int:
+        self._jobs = {job for job in self._jobs if not job.future.done()}
+        return len(self._jobs)
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name='job-poller', daemon=True)
+            self._thread.start()
+
+    def _next_interval(self, job: _Job, now: float) -> float:
+        age = now - job.started_at
+        return min(self.max_interval, max(job.min_interval, age * self.age_factor))
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._schedule:
+                    self._condition.wait()
+
+                due_at = self._schedule[0][0]
+                now = time.monotonic()
+                if due_at > now:
+                    self._condition.wait(due_at - now)
+                    continue
+
+                # Pull in jobs due shortly after, so batch checks stay batched
+                horizon = now + self.min_interval / 2
+                due, expired = [], []
+                while self._schedule and self._schedule[0][0] <= horizon:
+                    entry_due, _, job, deadline = heapq.heappop(self._schedule)
+                    if job.future.done():
+                        continue
+                    if not deadline:
+                        due.append(job)
+                    elif entry_due <= now:
+                        expired.append(job)
+                    else:
+                        # Not yet: keep the deadline exact
+                        self._push(job, entry_due, deadline=True)
+                        break
+
+            for job in expired:
+                self._finish(job, error=self._timeout_error(job))
+            if due:
+                self._poll(due)
+
+    def _poll(self, jobs: List[_Job]):
+        """Submit checks for due jobs; outcomes are handled as they complete"""
+        batches: Dict[tuple, List[_Job]] = {}
+        for job in jobs:
+            if job.check_many is not None:
+                batches.setdefault((job.provider, job.check_many), []).append(job)
+            else:
+                self._submit_check(job)
+
+        for (_, check_many), batch in batches.items():
+            with self._condition:
+                self._stats['batch_calls'] += 1
+            outcome = self._executor.submit(check_many, [job.job_id for job in batch])
+            outcome.add_done_callback(lambda outcome, batch=batch: self._on_batch(batch, outcome))
+
+    def _submit_check(self, job: _Job):
+        with self._condition:
+            self._stats['checks'] += 1
+        outcome = self._executor.submit(job.check, job.job_id)
+        outcome.add_done_callback(lambda outcome, job=job: self._on_check(job, outcome))
+
+    def _on_batch(self, batch: List[_Job], outcome: Future):
+        try:
+            results = outcome.result()
+        except Exception as e:
+            # One bad batch call: fall back to checking those jobs one by one
+            print(f"Warning: batch status check failed ({e}); checking jobs individually")
+            for job in batch:
+                self._submit_check(job)
+            return
+
+        with self._condition:
+            self._stats['checks'] += len(batch)
+        for job in batch:
+            self._resolve(job, results.get(job.job_id))
+
+    def _on_check(self, job: _Job, outcome: Future):
+        try:
+            payload = outcome.result()
+        except Exception as e:
+            self._finish(job, error=e)
+            return
+        self._resolve(job, payload)
+
+    def _resolve(self, job: _Job, payload: Any):
+        """Finish a job with its payload, or schedule its next check"""
+        if job.future.done():
+            return
+
+        if payload is not None:
+            self._finish(job, payload=payload)
+            return
+
+        now = time.monotonic()
+        if now >= job.deadline:
+            self._finish(job, error=self._timeout_error(job))
+            return
+
+        with self._condition:
+            self._push(job, min(job.deadline, now + self._next_interval(job, now)))
+            self._condition.notify()
+
+    @staticmethod
+    def _timeout_error(job: _Job) -> TimeoutError:
+        return TimeoutError(
+            f"{job.provider} job {job.job_id} did not complete within {job.timeout:g} seconds"
+        )
+
+    def _finish(self, job: _Job, payload: Any = None, error: Optional[BaseException] = None):
+        try:
+            if error is None:
+                job.future.set_result(payload)
+            else:
+                job.future.set_exception(error)
+        except InvalidStateError:
+            return  # already timed out, or cancelled by the caller
+
+        with self._condition:
+            if error is None:
+                self._stats['completed'] += 1
+            elif isinstance(error, TimeoutError):
+                self._stats['timed_out'] += 1
+            else:
+                self._stats['failed'] += 1
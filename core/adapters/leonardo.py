@@ -6,10 +6,15 @@ Integration for AI image generation using Leonardo.ai API
 import os
 import time
 import requests
-from typing import Dict, Any, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+from .job_poller import JobPoller, RESULT_MARGIN
+from .media_downloader import MediaDownloader
+from .rate_limit import RateLimiter, is_unsent, retry_with_backoff
+
 
 class LeonardoModel(Enum):
     """Available Leonardo.ai models"""
@@ -41,10 +46,14 @@ class GeneratedImage:
     images: List[Dict] = None
     prompt: str = ""
     model_id: str = ""
+    error: Optional[str] = None
+    files: List[str] = None
 
     def __post_init__(self):
         if self.images is None:
             self.images = []
+        if self.files is None:
+            self.files = []
 
 
 class LeonardoAdapter:
@@ -68,7 +77,27 @@ class LeonardoAdapter:
 
     BASE_URL = "https://cloud.leonardo.ai/api/rest/v1"
 
-    def __init__(self, api_key: Optional[str] = None):
+    # Request budget for generation submissions (requests per second);
+    # lower it if the account's plan allows less
+    GENERATION_RATE = 5
+
+    # (connect, read) timeout for status requests made by the poller
+    STATUS_TIMEOUT = (5, 15)
+
+    FORMAT_MAPPING = {
+        'feed': AspectRatio.SQUARE_HD,
+        'story': AspectRatio.STORY_HD,
+        'display': AspectRatio.WIDESCREEN_HD,
+        'portrait': AspectRatio.PORTRAIT
+    }
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        poller: Optional[JobPoller] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        downloader: Optional[MediaDownloader] = None
+    ):
         self.api_key = api_key or os.getenv("LEONARDO_API_KEY")
         if not self.api_key:
             raise ValueError("LEONARDO_API_KEY is required")
@@ -79,6 +108,14 @@ class LeonardoAdapter:
             "authorization": f"Bearer {self.api_key}"
         }
 
+        # Shared status poller: waiting on many generations costs one thread
+        self.poller = poller or JobPoller.shared()
+        # Shared by every adapter using this API key
+        self.rate_limiter = rate_limiter or RateLimiter.for_key(
+            f"leonardo:{self.api_key}", rate=self.GENERATION_RATE
+        )
+        self.downloader = downloader or MediaDownloader.shared()
+
     def generate_image(
         self,
         prompt: str,
@@ -162,7 +199,8 @@ class LeonardoAdapter:
         """
         response = requests.get(
             f"{self.BASE_URL}/generations/{generation_id}",
-            headers=self.headers
+            headers=self.headers,
+            timeout=self.STATUS_TIMEOUT
         )
         response.raise_for_status()
 
@@ -185,20 +223,45 @@ class LeonardoAdapter:
         Returns:
             Final generation data with images
         """
-        start_time = time.time()
+        future = self.watch_generation(generation_id, max_wait, poll_interval)
+        try:
+            return future.result(timeout=max_wait + RESULT_MARGIN)
+        finally:
+            future.cancel()
 
-        while time.time() - start_time < max_wait:
-            result = self.get_generation(generation_id)
-            status = result.get("status", "PENDING")
+    def watch_generation(
+        self,
+        generation_id: str,
+        max_wait: int = 120,
+        poll_interval: int = 3
+    ) -> Future:
+        """
+        Track a generation on the shared poller without blocking.
 
-            if status == "COMPLETE":
-                return result
-            elif status == "FAILED":
-                raise Exception(f"Generation failed: {result.get('error', 'Unknown error')}")
+        Args:
+            generation_id: The generation ID to monitor
+            max_wait: Maximum seconds to wait
+            poll_interval: Initial seconds between status checks
 
-            time.sleep(poll_interval)
+        Returns:
+            Future resolved with the final generation data
+        """
+        return self.poller.watch(
+            "leonardo", generation_id, self._check_generation,
+            timeout=max_wait, min_interval=poll_interval
+        )
 
-        raise TimeoutError(f"Generation {generation_id} did not complete within {max_wait} seconds")
+    def _check_generation(self, generation_id: str) -> Optional[Dict[str, Any]]:
+        """Poller check: generation data once complete, None while pending"""
+        result = self.get_generation(generation_id)
+        status = result.get("status", "PENDING")
+
+        if status == "COMPLETE":
+            return result
+        elif status == "FAILED":
+            raise Exception(f"Generation failed: {result.get('error', 'Unknown error')}")
+
+        return None
 
     def generate_and_wait(
         self,
@@ -243,30 +306,124 @@ class LeonardoAdapter:
             model: Model to use
 
         Returns:
-            List of GeneratedImage for each format
+            List of GeneratedImage for each format, in order. A format
+            whose submission failed has status "FAILED" and the reason in
+            `error`; the others keep their generation ids (and credits)
+            either way.
         """
         if formats is None:
             formats = ['feed', 'story', 'display']
 
-        format_mapping = {
-            'feed': AspectRatio.SQUARE_HD,
-            'story': AspectRatio.STORY_HD,
-            'display': AspectRatio.WIDESCREEN_HD,
-            'portrait': AspectRatio.PORTRAIT
-        }
+        batch = self.generate_batch(
+            [
+                {
+                    'prompt': prompt,
+                    'aspect_ratio': self.FORMAT_MAPPING.get(fmt, AspectRatio.SQUARE),
+                    'model': model
+                }
+                for fmt in formats
+            ],
+            wait=False
+        )
+
+        return batch['generations']
 
-        results = []
+    def generate_batch(
+        self,
+        jobs: List[Dict[str, Any]],
+        wait: bool = True,
+        save_dir: Optional[str] = None,
+        max_workers: int = 8,
+        retries: int = 3,
+        max_wait: int = 120
+    ) -> Dict[str, Any]:
+        """
+        Submit many generations at once, optionally await and download them.
 
-        for fmt in formats:
-            aspect_ratio = format_mapping.get(fmt, AspectRatio.SQUARE)
-            result = self.generate_image(
-                prompt=prompt,
-                aspect_ratio=aspect_ratio,
-                model=model
-            )
-            results.append(result)
+        All jobs are submitted concurrently under the adapter's rate
+        limiter, then awaited together on the shared poller, so the batch
+        takes about one generation latency. Images are downloaded in
+        parallel. Only submissions that certainly created nothing
+        (connect timeouts, 429) are retried; after a 5xx or a dropped
+        connection the generation may exist and have used credits, so it
+        is reported as failed rather than resubmitted.
 
-        return results
+        Args:
+            jobs: generate_image keyword arguments, one dict per generation
+            wait: Wait for the generations to complete
+            save_dir: Download completed images here (requires wait)
+            max_workers: Concurrent submissions/downloads
+            retries: Retries per submission for throttling/connect failures
+            max_wait: Seconds before a generation times out
+
+        Returns:
+            Dict with:
+                - generations: GeneratedImage per job, in order; status is
+                  COMPLETE/FAILED once awaited, `error` set on failure and
+                  `files` listing downloaded paths
+                - timings: Seconds spent in submit, generate, download, total
+        """
+        timings = {'submit': 0.0, 'generate': 0.0, 'download': 0.0, 'total': 0.0}
+        if not jobs:
+            return {'generations': [], 'timings': timings}
+
+        workers = min(max_workers, len(jobs))
+        started = time.perf_counter()
+
+        def submit(job: Dict[str, Any]) -> GeneratedImage:
+            def attempt() -> GeneratedImage:
+                self.rate_limiter.acquire()
+                return self.generate_image(**job)
+
+            try:
+                return retry_with_backoff(attempt, retries=retries, should_retry=is_unsent)
+            except Exception as e:
+                return GeneratedImage(
+                    generation_id="",
+                    status="FAILED",
+                    prompt=job.get('prompt', ''),
+                    error=str(e)
+                )
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            generations = list(executor.map(submit, jobs))
+        timings['submit'] = time.perf_counter() - started
+
+        if wait:
+            stage = time.perf_counter()
+            futures = [
+                self.watch_generation(g.generation_id, max_wait=max_wait) if g.generation_id else None
+                for g in generations
+            ]
+            for generation, future in zip(generations, futures):
+                if future is None:
+                    continue
+                try:
+                    result = future.result(timeout=max_wait + RESULT_MARGIN)
+                    generation.status = result.get("status", "COMPLETE")
+                    generation.images = result.get("generated_images", [])
+                except Exception as e:
+                    generation.status = "FAILED"
+                    generation.error = str(e)
+            timings['generate'] = time.perf_counter() - stage
+
+            if save_dir:
+                stage = time.perf_counter()
+                os.makedirs(save_dir, exist_ok=True)
+                targets = [
+                    (index, image.get("url"), os.path.join(save_dir, f"{generation.generation_id}_{i}.png"))
+                    for index, generation in enumerate(generations)
+                    for i, image in enumerate(generation.images)
+                    if image.get("url")
+                ]
+                paths = self.download_images([(url, path) for _, url, path in targets], max_workers=max_workers)
+                for (index, _, _), path in zip(targets, paths):
+                    if path:
+                        generations[index].files.append(path)
+                timings['download'] = time.perf_counter() - stage
+
+        timings['total'] = time.perf_counter() - started
+        return {'generations': generations, 'timings': timings}
 
     def get_user_info(self) -> Dict[str, Any]:
         """Get user account information including credits"""
@@ -287,11 +444,22 @@ class LeonardoAdapter:
         return response.json().get("custom_models", [])
 
     def download_image(self, url: str, save_path: str) -> str:
-        """Download generated image to local file"""
-        response = requests.get(url)
-        response.raise_for_status()
+        """Download generated image to local file (streamed, resumable)"""
+        return self.downloader.download(url, save_path)
 
-        with open(save_path, "wb") as f:
-            f.write(response.content)
+    def download_images(
+        self,
+        items: List[Tuple[str, str]],
+        max_workers: int = 8
+    ) -> List[Optional[str]]:
+        """
+        Download several images in parallel.
 
-        return save_path
+        Args:
+            items: (url, save_path) pairs
+            max_workers: Concurrent downloads
+
+        Returns:
+            Saved path per item, in order; None where the download failed
+        """
+        return self.downloader.download_many(items, max_workers=max_workers)
@@ -0,0 +1,224 @@
+"""
+Media Downloader
+Streaming, resumable, verified downloads of generated images and videos
+"""
+
+import hashlib
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import requests
+
+from .rate_limit import is_transient, retry_with_backoff
+
+
+CONTENT_RANGE_PATTERN = re.compile(r'bytes (\d+)-(\d+)/(\d+|\*)')
+
+
+class IncompleteDownload(IOError):
+    """The connection ended before the announced size was received"""
+
+
+class MediaDownloader:
+    """
+    Downloads media files in fixed-size chunks, never holding a whole
+    file in memory.
+
+    Data is written to "<save_path>.part". When a transfer breaks off
+    (connection error, timeout, truncated body) it is retried with an
+    HTTP Range request from the bytes already on disk; servers that
+    ignore Range just restart from zero. The result is checked against
+    the announced size (or `expected_size`) and an optional SHA-256
+    before being atomically renamed into place, so `save_path` is either
+    complete or absent.
+
+    Usage:
+        downloader = MediaDownloader.shared()
+        downloader.download(render.url, "out/video.mp4")
+        paths = downloader.download_many([(url1, "a.mp4"), (url2, "b.mp4")])
+    """
+
+    CHUNK_SIZE = 1024 * 1024
+
+    _shared: Optional['MediaDownloader'] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        chunk_size: int = CHUNK_SIZE,
+        max_workers: int = 4,
+        retries: int = 3,
+        timeout: Tuple[float, float] = (10, 60)
+    ):
+        """
+        Args:
+            chunk_size: Bytes read and written per chunk
+            max_workers: Default concurrent downloads in download_many
+            retries: Resume attempts per file after a transient failure
+            timeout: (connect, read) timeout in seconds
+        """
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.retries = retries
+        self.timeout = timeout
+
+        self._lock = threading.Lock()
+        self._stats = {'downloads': 0, 'failed': 0, 'resumed': 0, 'bytes': 0}
+
+    @classmethod
+    def shared(cls) -> 'MediaDownloader':
+        """Process-wide downloader used when adapters get no explicit one"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def download(
+        self,
+        url: str,
+        save_path: str,
+        expected_size: Optional[int] = None,
+        sha256: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> str:
+        """
+        Stream a file to disk.
+
+        Args:
+            url: File URL
+            save_path: Final local path
+            expected_size: Size in bytes to verify (default: server's)
+            sha256: Hex digest to verify
+            headers: Extra request headers
+
+        Returns:
+            save_path
+
+        Raises:
+            ValueError: Size or checksum mismatch (nothing is kept)
+            requests.exceptions.RequestException: Download failed
+        """
+        directory = os.path.dirname(save_path)
+        os.makedirs(directory or ".", exist_ok=True)
+
+        part_path = f"{save_path}.part"
+        # A leftover part may belong to another URL; only resume our own
+        if os.path.exists(part_path):
+            os.remove(part_path)
+
+        try:
+            digest, size, total = retry_with_backoff(
+                lambda: self._fetch(url, part_path, headers),
+                retries=self.retries,
+                should_retry=lambda e: isinstance(e, IncompleteDownload) or is_transient(e)
+            )
+
+            expected = expected_size if expected_size is not None else total
+            if expected is not None and size != expected:
+                raise ValueError(f"Downloaded {size} bytes from {url}, expected {expected}")
+            if sha256 and digest.hexdigest() != sha256.lower():
+                raise ValueError(f"Checksum mismatch for {url}")
+
+            os.replace(part_path, save_path)
+        except Exception:
+            self._count('failed')
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise
+
+        self._count('downloads')
+        return save_path
+
+    def download_many(
+        self,
+        items: List[Tuple[str, str]],
+        max_workers: Optional[int] = None
+    ) -> List[Optional[str]]:
+        """
+        Download several files concurrently.
+
+        Args:
+            items: (url, save_path) pairs
+            max_workers: Concurrent downloads (default: downloader's)
+
+        Returns:
+            Saved path per item, in order; None where the download failed
+        """
+        def download(item: Tuple[str, str]) -> Optional[str]:
+            url, save_path = item
+            try:
+                return self.download(url, save_path)
+            except Exception as e:
+                print(f"Warning: download of {url} failed: {e}")
+                return None
+
+        if not items:
+            return []
+
+        workers = min(max_workers or self.max_workers, len(items))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(download, items))
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    def _fetch(self, url: str, part_path: str, headers: Optional[Dict[str, str]]):
+        """
+        One attempt: append to the part file from its current size.
+
+        Returns:
+            (sha256 of the whole part, its size, announced total or None)
+        """
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        # Sizes must be of the bytes on the wire, not a decompressed body
+        request_headers = {'Accept-Encoding': 'identity', **(headers or {})}
+        if offset:
+            request_headers['Range'] = f"bytes={offset}-"
+
+        with requests.get(url, headers=request_headers, stream=True, timeout=self.timeout) as response:
+            response.raise_for_status()
+
+            total = None
+            if offset and response.status_code == 206:
+                self._count('resumed')
+                match = CONTENT_RANGE_PATTERN.match(response.headers.get('Content-Range', ''))
+                if match and match.group(3) != '*':
+                    total = int(match.group(3))
+            else:
+                # Fresh download, or the server ignored Range
+                offset = 0
+                length = response.headers.get('Content-Length')
+                total = int(length) if length and length.isdigit() else None
+
+            digest = hashlib.sha256()
+            mode = 'ab' if offset else 'wb'
+            if offset:
+                with open(part_path, 'rb') as existing:
+                    for chunk in iter(lambda: existing.read(self.chunk_size), b''):
+                        digest.update(chunk)
+
+            size = offset
+            with open(part_path, mode) as f:
+                for chunk in response.iter_content(chunk_size=self.chunk_size):
+                    if chunk:
+                        f.write(chunk)
+                        digest.update(chunk)
+                        size += len(chunk)
+                        self._count('bytes', len(chunk))
+
+        if total is not None and size < total:
+            raise IncompleteDownload(f"Got {size} of {total} bytes from {url}")
+
+        return digest, size, total
+
+    def _count(self, name: str, amount: int = 1):
+        with self._lock:
+            self._stats[name] += amount
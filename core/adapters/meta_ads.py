@@ -5,10 +5,17 @@ Unified interface for Meta Ads API
 
 import requests
 import json
-from typing import Dict, List, Optional
+import re
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
+from .response_cache import ResponseCache
+
+
+# insights.date_preset(last_7d) / insights.time_range({...}) inside a fields list
+INSIGHTS_RANGE_PATTERN = re.compile(r'insights\.(?:date_preset\((\w+)\)|time_range\((\{[^}]*\})\))')
+
 
 @dataclass
 class MetaAdsConfig:
@@ -35,18 +42,49 @@ class MetaAdsAdapter:
         campaigns = adapter.get_campaigns()
     """
 
-    def __init__(self, access_token: str, ad_account_id: str, api_version: str = "v18.0"):
+    def __init__(
+        self,
+        access_token: str,
+        ad_account_id: str,
+        api_version: str = "v18.0",
+        response_cache: Optional[ResponseCache] = None
+    ):
+        """
+        Args:
+            access_token: Meta access token
+            ad_account_id: Ad account id (act_...)
+            api_version: Graph API version
+            response_cache: Optional cache for date-ranged reads; closed
+                insights ranges are then served from disk
+        """
         self.config = MetaAdsConfig(
             access_token=access_token,
             ad_account_id=ad_account_id,
             api_version=api_version
         )
+        self.response_cache = response_cache
 
     def _request(self, endpoint: str, params: Optional[Dict] = None, method: str = "GET") -> Dict:
         """Make API request"""
-        url = f"{self.config.base_url}{endpoint}"
         params = params or {}
-        params['access_token'] = self.config.access_token
+        date_range = self._date_range(params) if self.response_cache is not None else None
+
+        if method == "GET" and date_range is not None:
+            # Entity listings carry status and budgets, which change regardless of dates
+            return self.response_cache.get_or_fetch(
+                'meta', self.config.ad_account_id, endpoint, dict(params), [date_range],
+                fetch=lambda: self._send(endpoint, params, method),
+                mutable=not endpoint.endswith('/insights')
+            )
+
+        result = self._send(endpoint, params, method)
+        if method != "GET" and self.response_cache is not None and 'error' not in result:
+            self.response_cache.invalidate('meta', self.config.ad_account_id)
+        return result
+
+    def _send(self, endpoint: str, params: Dict, method: str) -> Dict:
+        url = f"{self.config.base_url}{endpoint}"
+        params = {**params, 'access_token': self.config.access_token}
 
         try:
             if method == "GET":
@@ -58,6 +96,48 @@ class MetaAdsAdapter:
         except Exception as e:
             return {'error': str(e)}
 
+    def _request_all(self, endpoint: str, params: Dict) -> List[Dict]:
+        """
+        GET every page of a listing, following paging.cursors.after.
+
+        A failed page ends the listing with a warning; the rows gathered
+        so far are returned.
+        """
+        rows: List[Dict] = []
+        params = dict(params)
+
+        while True:
+            result = self._request(endpoint, params)
+            if 'error' in result:
+                print(f"Warning: Meta listing {endpoint} stopped after {len(rows)} rows: {result['error']}")
+                return rows
+
+            rows.extend(result.get('data', []))
+
+            paging = result.get('paging', {})
+            after = paging.get('cursors', {}).get('after')
+            if not paging.get('next') or not after:
+                return rows
+            params['after'] = after
+
+    @staticmethod
+    def _date_range(params: Dict) -> Optional[Tuple[str, Optional[str]]]:
+        """(since, until) or (date_preset, None) requested by params, if any"""
+        if 'time_range' in params:
+            time_range = json.loads(params['time_range'])
+            return time_range.get('since'), time_range.get('until')
+        if 'date_preset' in params:
+            return params['date_preset'], None
+
+        match = INSIGHTS_RANGE_PATTERN.search(params.get('fields', ''))
+        if match:
+            if match.group(1):
+                return match.group(1), None
+            time_range = json.loads(match.group(2))
+            return time_range.get('since'), time_range.get('until')
+
+        return None
+
     def get_account_insights(
         self,
         date_preset: str = 'last_7d',
@@ -113,7 +193,7 @@ class MetaAdsAdapter:
             date_preset: Date preset for insights
 
         Returns:
-            List of campaign dictionaries
+            List of campaign dictionaries, across all pages
         """
         fields = ['id', 'name', 'status', 'effective_status', 'daily_budget', 'lifetime_budget', 'objective']
 
@@ -132,9 +212,7 @@ class MetaAdsAdapter:
                 'value': status_filter
             }])
 
-        result = self._request(f"/{self.config.ad_account_id}/campaigns", params)
-
-        return result.get('data', [])
+        return self._request_all(f"/{self.config.ad_account_id}/campaigns", params)
 
     def get_adsets(
         self,
@@ -151,7 +229,7 @@ class MetaAdsAdapter:
             date_preset: Date preset for insights
 
         Returns:
-            List of ad set dictionaries
+            List of ad set dictionaries, across all pages
         """
         fields = ['id', 'name', 'status', 'effective_status', 'daily_budget', 'campaign_id', 'targeting']
 
@@ -170,9 +248,7 @@ class MetaAdsAdapter:
                 'value': campaign_id
             }])
 
-        result = self._request(f"/{self.config.ad_account_id}/adsets", params)
-
-        return result.get('data', [])
+        return self._request_all(f"/{self.config.ad_account_id}/adsets", params)
 
     def get_ads(
         self,
@@ -180,8 +256,8 @@ class MetaAdsAdapter:
         include_insights: bool = True,
         date_preset: str = 'last_7d'
     ) -> List[Dict]:
-        """Fetch ads with optional insights"""
-        fields = ['id', 'name', 'status', 'effective_status', 'creative', 'adset_id']
+        """Fetch ads (all pages) with optional insights"""
+        fields = ['id', 'name', 'status', 'effective_status', 'creative', 'adset_id', 'campaign_id']
 
         if include_insights:
             fields.append(f'insights.date_preset({date_preset}){{spend,impressions,clicks,ctr,cpc}}')
@@ -198,9 +274,7 @@ class MetaAdsAdapter:
                 'value': adset_id
             }])
 
-        result = self._request(f"/{self.config.ad_account_id}/ads", params)
-
-        return result.get('data', [])
+        return self._request_all(f"/{self.config.ad_account_id}/ads", params)
 
     def update_status(self, entity_id: str, status: str) -> Dict:
         """
@@ -0,0 +1,140 @@
+"""
+Rate Limiting
+Token-bucket limiter and retry-with-backoff for provider APIs
+"""
+
+import random
+import threading
+import time
+from typing import Callable, Dict, Optional, TypeVar
+
+import requests
+
+
+T = TypeVar('T')
+
+# HTTP statuses worth retrying: throttling and transient server errors
+RETRYABLE_STATUS = {408, 425, 429, 500, 502, 503, 504}
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket.
+
+    `rate` requests are allowed per `per` seconds, with bursts up to
+    `burst` (default: rate). acquire() blocks until a token is free, so
+    any number of worker threads can share one limiter.
+
+    Usage:
+        limiter = RateLimiter.for_key("creatomate:<api_key>", rate=10, per=1.0)
+        limiter.acquire()
+        requests.post(...)
+    """
+
+    _instances: Dict[str, 'RateLimiter'] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, rate: float, per: float = 1.0, burst: Optional[float] = None):
+        self.rate = rate / per
+        self.capacity = burst if burst is not None else rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_key(cls, key: str, rate: float, per: float = 1.0, burst: Optional[float] = None) -> 'RateLimiter':
+        """Limiter shared by everything using the same credentials"""
+        with cls._instances_lock:
+            limiter = cls._instances.get(key)
+            if limiter is None:
+                limiter = cls._instances[key] = cls(rate, per, burst)
+            return limiter
+
+    def acquire(self, tokens: float = 1.0):
+        """Block until `tokens` are available, then take them"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+
+def is_transient(error: BaseException) -> bool:
+    """Connection problems, timeouts, throttling and 5xx responses"""
+    if isinstance(error, (
+        requests.exceptions.ConnectionError,
+        requests.exceptions.Timeout,
+        requests.exceptions.ChunkedEncodingError
+    )):
+        return True
+    if isinstance(error, requests.exceptions.HTTPError):
+        response = getattr(error, 'response', None)
+        return response is not None and response.status_code in RETRYABLE_STATUS
+    return False
+
+
+def is_unsent(error: BaseException) -> bool:
+    """
+    Failures after which the request certainly had no effect: the
+    connection was never established, or the server throttled it (429).
+
+    Use this for non-idempotent requests such as job submissions, where
+    a 5xx or a dropped connection may come after the job was created.
+    """
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if isinstance(error, requests.exceptions.HTTPError):
+        response = getattr(error, 'response', None)
+        return response is not None and response.status_code == 429
+    return False
+
+
+def retry_with_backoff(
+    call: Callable[[], T],
+    retries: int = 3,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+    should_retry: Callable[[BaseException], bool] = is_transient
+) -> T:
+    """
+    Run `call`, retrying transient failures with jittered exponential backoff.
+
+    A Retry-After header on a throttled response is honoured when longer
+    than the computed delay.
+
+    Args:
+        call: Zero-argument callable performing one attempt
+        retries: Retries after the first attempt
+        base_delay: Delay before the first retry, doubled each time
+        max_delay: Upper bound on any single delay
+        should_retry: Predicate deciding whether an error is retryable
+
+    Returns:
+        The call's result
+
+    Raises:
+        The last error, once retries are exhausted or it isn't retryable
+    """
+    attempt = 0
+    while True:
+        try:
+            return call()
+        except Exception as e:
+            if attempt >= retries or not should_retry(e):
+                raise
+
+            delay = min(max_delay, base_delay * 2 ** attempt) * random.uniform(0.5, 1.0)
+            response = getattr(e, 'response', None)
+            retry_after = response.headers.get('Retry-After') if response is not None else None
+            if retry_after and str(retry_after).isdigit():
+                delay = min(max_delay, max(delay, float(retry_after)))
+
+            time.sleep(delay)
+            attempt += 1
@@ -0,0 +1,317 @@
+"""
+Response Cache
+Date-range aware caching of analytics API responses (GA4, Meta)
+"""
+
+import os
+import re
+import threading
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from .disk_cache import DiskCache
+
+
+DEFAULT_RESPONSE_CACHE_PATH = os.getenv(
+    'RESPONSE_CACHE_PATH',
+    os.path.join(os.path.expanduser('~'), '.cache', 'marketing-agents', 'responses.db')
+)
+
+DateLike = Union[str, date, datetime, None]
+
+# (start, end) where end is None when start is a preset such as "last_7d"
+DateRange = Tuple[DateLike, DateLike]
+
+
+def _resolve_date(value: DateLike, today: date) -> Optional[date]:
+    """Absolute date for a GA/Meta date expression, None if unknown"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if not value:
+        return None
+
+    text = str(value)
+    if text == 'today':
+        return today
+    if text == 'yesterday':
+        return today - timedelta(days=1)
+
+    match = re.fullmatch(r'(\d+)daysAgo', text)
+    if match:
+        return today - timedelta(days=int(match.group(1)))
+
+    try:
+        return date.fromisoformat(text[:10])
+    except ValueError:
+        return None
+
+
+def _preset_range(preset: str, today: date) -> Optional[Tuple[date, date]]:
+    """Absolute range for a Meta date_preset, None if unknown"""
+    yesterday = today - timedelta(days=1)
+
+    if preset == 'today':
+        return today, today
+    if preset == 'yesterday':
+        return yesterday, yesterday
+
+    # last_Nd covers the N full days before today
+    match = re.fullmatch(r'last_(\d+)d', preset)
+    if match:
+        return today - timedelta(days=int(match.group(1))), yesterday
+
+    first_of_month = today.replace(day=1)
+    if preset == 'this_month':
+        return first_of_month, today
+    if preset == 'last_month':
+        last_month_end = first_of_month - timedelta(days=1)
+        return last_month_end.replace(day=1), last_month_end
+    if preset == 'this_year':
+        return today.replace(month=1, day=1), today
+    if preset == 'last_year':
+        return date(today.year - 1, 1, 1), date(today.year - 1, 12, 31)
+
+    monday = today - timedelta(days=today.weekday())
+    if preset == 'this_week_mon_today':
+        return monday, today
+    if preset == 'last_week_mon_sun':
+        return monday - timedelta(days=7), monday - timedelta(days=1)
+
+    return None
+
+
+def normalize_date_range(
+    start: DateLike,
+    end: DateLike = None,
+    today: Optional[date] = None
+) -> Optional[Tuple[date, date]]:
+    """
+    Turn a GA4 range ("7daysAgo".."today"), an ISO range or a Meta
+    date_preset (with end=None) into absolute dates.
+
+    Returns:
+        (start, end) dates, or None if the expression is not recognised
+    """
+    today = today or date.today()
+
+    if end is None and isinstance(start, str):
+        return _preset_range(start, today)
+
+    start_date = _resolve_date(start, today)
+    end_date = _resolve_date(end, today)
+    if start_date is None or end_date is None:
+        return None
+    return start_date, end_date
+
+
+class ResponseCache:
+    """
+    Caches API responses by (provider, account, endpoint, fields, dates).
+
+    Relative ranges are normalised to absolute dates first, so "7daysAgo"
+    requested today and the same explicit dates share an entry. Lifetime
+    depends on how settled the range is:
+
+        includes today (or unknown)          open_ttl
+        ended within the last settle_days    settling_ttl
+        older (closed)                       never expires
+
+    settle_days should cover the attribution window, during which
+    platforms still restate conversions. Responses that mix in mutable
+    state (campaign status, budgets) are stored with `mutable=True`,
+    which caps them at open_ttl and lets invalidate() drop them after
+    writes. Error responses are never cached.
+
+    Usage:
+        cache = ResponseCache.shared()
+        data = cache.get_or_fetch(
+            'meta', 'act_123', 'insights', {'fields': 'spend'},
+            [('2026-01-01', '2026-01-31')], fetch=lambda: ...
+        )
+    """
+
+    _shared: Dict[str, 'ResponseCache'] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        cache: DiskCache,
+        open_ttl: float = 300,
+        settling_ttl: float = 3600,
+        settle_days: int = 7
+    ):
+        """
+        Args:
+            cache: Underlying disk cache
+            open_ttl: Seconds to keep ranges that include today
+            settling_ttl: Seconds to keep ranges still inside settle_days
+            settle_days: Days after which a finished range is immutable
+        """
+        self.cache = cache
+        self.open_ttl = open_ttl
+        self.settling_ttl = settling_ttl
+        self.settle_days = settle_days
+
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    @classmethod
+    def shared(cls, path: str = DEFAULT_RESPONSE_CACHE_PATH, **kwargs) -> 'ResponseCache':
+        """Process-wide cache backed by the database at `path`"""
+        path = os.path.abspath(os.path.expanduser(path))
+        with cls._shared_lock:
+            cache = cls._shared.get(path)
+            if cache is None:
+                cache = cls._shared[path] = cls(DiskCache(path), **kwargs)
+            return cache
+
+    def ttl_for(self, date_ranges: Sequence[DateRange], today: Optional[date] = None) -> Optional[float]:
+        """Seconds an entry for these ranges stays valid (None never expires)"""
+        today = today or date.today()
+        settled_before = today - timedelta(days=self.settle_days)
+        ttl = None
+
+        for start, end in date_ranges or [(None, None)]:
+            normalized = normalize_date_range(start, end, today)
+            if normalized is None or normalized[1] >= today:
+                return self.open_ttl
+            if normalized[1] >= settled_before:
+                ttl = self.settling_ttl
+
+        return ttl
+
+    def get(
+        self,
+        provider: str,
+        account: str,
+        endpoint: str,
+        fields: Any,
+        date_ranges: Sequence[DateRange]
+    ) -> Optional[Any]:
+        """Cached response, or None"""
+        value = self.cache.get_json(self._key(provider, account, endpoint, fields, date_ranges))
+        self._count(provider, hit=value is not None)
+        return value
+
+    def put(
+        self,
+        provider: str,
+        account: str,
+        endpoint: str,
+        fields: Any,
+        date_ranges: Sequence[DateRange],
+        value: Any,
+        mutable: bool = False
+    ) -> bool:
+        """Store a response unless it is empty or an error; returns whether it was stored"""
+        if value is None or (isinstance(value, dict) and 'error' in value):
+            return False
+
+        ttl = self.ttl_for(date_ranges)
+        if mutable:
+            ttl = self.open_ttl if ttl is None else min(ttl, self.open_ttl)
+
+        return self.cache.set_json(
+            self._key(provider, account, endpoint, fields, date_ranges),
+            value,
+            ttl=ttl,
+            tag=self._tag(provider, account, mutable)
+        )
+
+    def get_or_fetch(
+        self,
+        provider: str,
+        account: str,
+        endpoint: str,
+        fields: Any,
+        date_ranges: Sequence[DateRange],
+        fetch: Callable[[], Any],
+        mutable: bool = False
+    ) -> Any:
+        """
+        Return the cached response or call `fetch` and cache its result.
+
+        Args:
+            provider: e.g. 'ga', 'meta'
+            account: Property or ad account id
+            endpoint: API method or path
+            fields: Everything else that shapes the response (JSON-able)
+            date_ranges: Requested (start, end) ranges
+            fetch: Callable performing the request
+            mutable: Response includes state that changes independently
+                of the date range
+
+        Returns:
+            The response (errors are returned but not cached)
+        """
+        value = self.get(provider, account, endpoint, fields, date_ranges)
+        if value is not None:
+            return value
+
+        value = fetch()
+        self.put(provider, account, endpoint, fields, date_ranges, value, mutable=mutable)
+        return value
+
+    def invalidate(self, provider: str, account: Optional[str] = None, mutable_only: bool = True) -> int:
+        """
+        Drop cached responses of a provider (optionally one account).
+
+        Returns:
+            Number of entries removed
+        """
+        pattern = f"{provider}:{account if account is not None else '%'}:"
+        pattern += 'mutable' if mutable_only else '%'
+        return self.cache.delete_tag(pattern)
+
+    def stats(self) -> Dict:
+        """
+        Hit/miss counters per provider plus the disk cache totals.
+
+        Returns:
+            Dict like {'ga': {'hits', 'misses', 'hit_rate'}, ...,
+            'cache': DiskCache.stats()}
+        """
+        with self._lock:
+            result = {}
+            for provider, counters in self._stats.items():
+                total = counters['hits'] + counters['misses']
+                result[provider] = {
+                    **counters,
+                    'hit_rate': counters['hits'] / total if total else 0.0
+                }
+        result['cache'] = self.cache.stats()
+        return result
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    def _key(
+        self,
+        provider: str,
+        account: str,
+        endpoint: str,
+        fields: Any,
+        date_ranges: Sequence[DateRange]
+    ) -> str:
+        today = date.today()
+        ranges: List = []
+        for start, end in date_ranges or []:
+            normalized = normalize_date_range(start, end, today)
+            # Unknown expressions are kept verbatim, scoped to today
+            ranges.append(
+                [normalized[0].isoformat(), normalized[1].isoformat()] if normalized
+                else [str(start), str(end), today.isoformat()]
+            )
+        return DiskCache.make_key(provider, account, endpoint, fields, ranges)
+
+    @staticmethod
+    def _tag(provider: str, account: str, mutable: bool) -> str:
+        return f"{provider}:{account}:{'mutable' if mutable else 'immutable'}"
+
+    def _count(self, provider: str, hit: bool):
+        with self._lock:
+            counters = self._stats.setdefault(provider, {'hits': 0, 'misses': 0})
+            counters['hits' if hit else 'misses'] += 1
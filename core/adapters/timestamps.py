@@ -0,0 +1,244 @@
+"""
+Timestamp Decoding
+Fast parsing of the timestamp formats returned by Hyros and checkout APIs
+
+Formats:
+    Java Date.toString  "Sat Jan 03 11:39:31 UTC 2026"  (Hyros sales)
+    ISO 8601            "2026-01-03T11:39:31Z", "2026-01-03 11:39:31+00:00"
+    Unix seconds/ms     1735904371, "1735904371"
+
+Benchmark:
+    python -m core.adapters.timestamps
+"""
+
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Optional, Sequence, Union
+
+
+MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+}
+
+# Zone names strptime's %Z accepts everywhere; values are returned naive
+JAVA_UTC_ZONES = ('UTC', 'GMT')
+
+JAVA_DATE_FORMAT = '%a %b %d %H:%M:%S %Z %Y'
+
+# Unix values above this are milliseconds (as seconds it would be past 2286)
+UNIX_MILLIS_THRESHOLD = 1e10
+
+
+def parse_timestamp(value: Union[str, int, float, None]) -> Optional[datetime]:
+    """
+    Decode a timestamp in any supported format.
+
+    The format is sniffed from the first character, so each value takes a
+    single parse attempt instead of a try/except chain. Results match the
+    previous per-adapter parsing: Java dates come back naive (UTC wall
+    time), ISO strings keep their offset, Unix values are local naive.
+
+    Args:
+        value: Timestamp string or Unix seconds/milliseconds
+
+    Returns:
+        datetime, or None if the value is empty or unparseable
+    """
+    if value is None or value == '':
+        return None
+
+    if isinstance(value, (int, float)):
+        return parse_unix(value)
+
+    text = str(value)
+    first = text[0]
+
+    if first.isdigit():
+        if text.isdigit():
+            return parse_unix(int(text))
+        return parse_iso(text)
+
+    return parse_java_date(text)
+
+
+def parse_unix(value: Union[int, float]) -> Optional[datetime]:
+    """Unix seconds or milliseconds (see UNIX_MILLIS_THRESHOLD) to a local naive datetime"""
+    try:
+        return datetime.fromtimestamp(_unix_seconds(value))
+    except (OverflowError, OSError, ValueError):
+        return None
+
+
+def parse_iso(text: str) -> Optional[datetime]:
+    """ISO 8601 with optional 'Z'/offset"""
+    if text.endswith('Z'):
+        text = text[:-1] + '+00:00'
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        return None
+
+
+def parse_java_date(text: str) -> Optional[datetime]:
+    """
+    Java Date.toString output, e.g. "Sat Jan 03 11:39:31 UTC 2026".
+
+    Reads fixed character positions instead of running strptime. Other
+    zone names or layouts fall back to strptime so behaviour is unchanged.
+    """
+    if len(text) == 28 and text[20:23] in JAVA_UTC_ZONES:
+        date = _java_date(text[4:7], text[8:10], text[24:28])
+        if date is not None:
+            try:
+                return datetime(
+                    date[0], date[1], date[2],
+                    int(text[11:13]), int(text[14:16]), int(text[17:19])
+                )
+            except ValueError:
+                return None
+
+    try:
+        return datetime.strptime(text, JAVA_DATE_FORMAT)
+    except ValueError:
+        return parse_iso(text)
+
+
+@lru_cache(maxsize=4096)
+def _java_date(month: str, day: str, year: str) -> Optional[tuple]:
+    """(year, month, day) for a Java date prefix; sales cluster on few days"""
+    month_number = MONTHS.get(month)
+    if month_number is None or not day.isdigit() or not year.isdigit():
+        return None
+    return int(year), month_number, int(day)
+
+
+@lru_cache(maxsize=4096)
+def _java_iso_prefix(month: str, day: str, year: str) -> Optional[str]:
+    """'YYYY-MM-DDT' for a Java date prefix"""
+    date = _java_date(month, day, year)
+    if date is None:
+        return None
+    return f"{date[0]:04d}-{date[1]:02d}-{date[2]:02d}T"
+
+
+def parse_timestamp_column(values: Sequence[Union[str, int, float, None]]):
+    """
+    Convert a whole column of timestamps at once.
+
+    Java dates are rewritten to ISO strings (reusing the cached date
+    prefixes) and the column is handed to NumPy's C datetime parser in a
+    single call. Values with an explicit offset are converted to UTC
+    individually.
+
+    Args:
+        values: Timestamps in any supported format (mixed formats allowed)
+
+    Returns:
+        numpy datetime64[ms] array in UTC, NaT where a value is missing
+        or unparseable. Naive values are treated as UTC; Unix values are
+        exact.
+    """
+    import numpy as np
+
+    iso = np.empty(len(values), dtype=object)
+    iso[:] = 'NaT'
+
+    for index, value in enumerate(values):
+        if value is None or value == '':
+            continue
+
+        if isinstance(value, (int, float)) or (isinstance(value, str) and value.isdigit()):
+            iso[index] = _unix_to_iso(float(value))
+            continue
+
+        text = str(value)
+        if not text[0].isdigit():
+            if len(text) == 28 and text[20:23] in JAVA_UTC_ZONES:
+                prefix = _java_iso_prefix(text[4:7], text[8:10], text[24:28])
+                if prefix is not None:
+                    iso[index] = prefix + text[11:19]
+                    continue
+            parsed = parse_java_date(text)
+        elif text.endswith('Z'):
+            iso[index] = text[:-1]
+            continue
+        elif len(text) > 19 and text[-6] in '+-' and text[-3] == ':':
+            parsed = parse_iso(text)
+        else:
+            iso[index] = text
+            continue
+
+        if parsed is not None:
+            iso[index] = _to_utc_iso(parsed)
+
+    try:
+        return np.array(iso.tolist(), dtype='datetime64[ms]')
+    except ValueError:
+        # A malformed string: fall back to converting values one by one
+        result = np.empty(len(iso), dtype='datetime64[ms]')
+        for index, text in enumerate(iso):
+            try:
+                result[index] = np.datetime64(text, 'ms')
+            except ValueError:
+                result[index] = np.datetime64('NaT')
+        return result
+
+
+def _unix_seconds(value: float) -> float:
+    return value / 1000 if value > UNIX_MILLIS_THRESHOLD else value
+
+
+def _unix_to_iso(value: float) -> str:
+    return datetime.fromtimestamp(_unix_seconds(value), timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3]
+
+
+def _to_utc_iso(value: datetime) -> str:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.isoformat()
+
+
+def _benchmark(count: int = 100_000):
+    """Compare the old strptime chain with the fast paths"""
+    import random
+    import time
+
+    random.seed(7)
+    base = datetime(2025, 1, 1).timestamp()
+    stamps = [datetime.fromtimestamp(base + random.randint(0, 180 * 86400)) for _ in range(count)]
+    java = [stamp.strftime('%a %b %d %H:%M:%S UTC %Y') for stamp in stamps]
+    iso = [stamp.strftime('%Y-%m-%dT%H:%M:%SZ') for stamp in stamps]
+
+    def legacy(text):
+        try:
+            return datetime.strptime(text, JAVA_DATE_FORMAT)
+        except Exception:
+            try:
+                return datetime.fromisoformat(text.replace('Z', '+00:00'))
+            except Exception:
+                return None
+
+    cases = (
+        ('java  strptime chain', lambda: [legacy(text) for text in java]),
+        ('java  parse_timestamp', lambda: [parse_timestamp(text) for text in java]),
+        ('java  column (numpy)', lambda: parse_timestamp_column(java)),
+        ('iso   strptime chain', lambda: [legacy(text) for text in iso]),
+        ('iso   parse_timestamp', lambda: [parse_timestamp(text) for text in iso]),
+        ('iso   column (numpy)', lambda: parse_timestamp_column(iso)),
+    )
+
+    print(f"Parsing {count:,} timestamps")
+    for name, run in cases:
+        _java_date.cache_clear()
+        _java_iso_prefix.cache_clear()
+        started = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - started
+        print(f"  {name:<24} {elapsed * 1000:8.1f} ms  ({elapsed / count * 1e6:.2f} us/value)")
+
+    assert [parse_timestamp(text) for text in java] == [legacy(text) for text in java]
+
+
+if __name__ == "__main__":
+    _benchmark()
@@ -0,0 +1,206 @@
+"""
+Token Cache
+Expiry-aware, thread-safe cache for OAuth access tokens
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking, thread locks still apply
+    fcntl = None
+
+
+# Default on-disk store shared by every process of the current user
+DEFAULT_TOKEN_PATH = os.getenv(
+    'TOKEN_CACHE_PATH',
+    os.path.join(os.path.expanduser('~'), '.cache', 'marketing-agents', 'tokens.json')
+)
+
+
+class TokenCache:
+    """
+    Caches access tokens until shortly before they expire.
+
+    Tokens are keyed by a caller-chosen string (e.g. "hotmart:<client_id>"),
+    so every adapter instance and worker thread using the same credentials
+    shares one token. Refreshes happen under a per-key lock: when a token
+    is about to expire, one thread mints a new one while the others wait
+    and reuse it.
+
+    With a `path`, tokens are also persisted as JSON so short-lived
+    processes (CLI runs, cron jobs) don't mint a token on every start.
+    Refreshes then also hold an exclusive lock on "<path>.lock", and the
+    file is re-read under it, so concurrent processes mint one token
+    between them rather than one each.
+
+    Usage:
+        cache = TokenCache.shared()
+        token = cache.get("hotmart:abc", fetch=lambda: ("tok", 3600))
+
+        cache = TokenCache.persistent()  # shared across processes
+    """
+
+    _shared: Optional['TokenCache'] = None
+    _persistent: Dict[str, 'TokenCache'] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path: Optional[str] = None, refresh_margin: int = 300):
+        """
+        Args:
+            path: Optional JSON file used to persist tokens across processes
+            refresh_margin: Seconds before expiry at which a token is renewed
+        """
+        self.path = path
+        self.refresh_margin = refresh_margin
+
+        self._tokens: Dict[str, Dict] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+        if path:
+            self._tokens.update(self._load())
+
+    @classmethod
+    def shared(cls) -> 'TokenCache':
+        """Process-wide in-memory cache used when adapters get no explicit cache"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @classmethod
+    def persistent(cls, path: str = DEFAULT_TOKEN_PATH) -> 'TokenCache':
+        """Process-wide cache backed by a file-locked store at `path`"""
+        path = os.path.abspath(os.path.expanduser(path))
+        with cls._shared_lock:
+            cache = cls._persistent.get(path)
+            if cache is None:
+                cache = cls._persistent[path] = cls(path=path)
+            return cache
+
+    def get(self, key: str, fetch: Callable[[], Tuple[str, int]]) -> str:
+        """
+        Return a valid token for `key`, minting one with `fetch` if needed.
+
+        Args:
+            key: Cache key identifying the credentials
+            fetch: Callable returning (access_token, expires_in_seconds);
+                exceptions propagate to the caller and nothing is cached
+
+        Returns:
+            Access token
+        """
+        token = self._valid(key)
+        if token:
+            return token
+
+        with self._lock_for(key), self._file_lock():
+            # Another thread (or process) may have refreshed while we waited
+            if self.path:
+                self._merge(self._load())
+            token = self._valid(key)
+            if token:
+                return token
+
+            access_token, expires_in = fetch()
+            self._tokens[key] = {
+                'access_token': access_token,
+                'expires_at': time.time() + int(expires_in)
+            }
+            if self.path:
+                self._save()
+            return access_token
+
+    def invalidate(self, key: str):
+        """Forget a token (e.g. after the API rejected it)"""
+        with self._lock_for(key), self._file_lock():
+            rejected = self._tokens.pop(key, None)
+            if self.path:
+                stored = self._load()
+                entry = stored.get(key)
+                # Keep a token another process minted after the rejected one
+                if entry and (rejected is None or entry['access_token'] == rejected['access_token']):
+                    del stored[key]
+                    self._save(stored)
+
+    def _valid(self, key: str) -> Optional[str]:
+        entry = self._tokens.get(key)
+        if entry and time.time() < entry['expires_at'] - self.refresh_margin:
+            return entry['access_token']
+        return None
+
+    def _lock_for(self, key: str) -> threading.Lock:
+        with self._locks_guard:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = threading.Lock()
+            return lock
+
+    @contextmanager
+    def _file_lock(self):
+        """Exclusive inter-process lock on the store (no-op without a path)"""
+        if not self.path or fcntl is None:
+            yield
+            return
+
+        lock_path = self.path + '.lock'
+        os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+        with open(lock_path, 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _merge(self, stored: Dict[str, Dict]):
+        """Adopt stored tokens that outlive the ones held in memory"""
+        for key, entry in stored.items():
+            current = self._tokens.get(key)
+            if current is None or entry['expires_at'] > current['expires_at']:
+                self._tokens[key] = entry
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        now = time.time()
+        return {
+            key: entry for key, entry in data.items()
+            if isinstance(entry, dict) and entry.get('expires_at', 0) > now
+        }
+
+    def _save(self, data: Optional[Dict[str, Dict]] = None):
+        """
+        Write tokens atomically, readable only by the current user.
+
+        Called under the file lock; tokens other processes stored since
+        our last read are kept.
+        """
+        if data is None:
+            data = self._load()
+            data.update(self._tokens)
+        now = time.time()
+        data = {key: entry for key, entry in data.items() if entry['expires_at'] > now}
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tokens-')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Warning: could not persist tokens to {self.path}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
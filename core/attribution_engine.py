@@ -0,0 +1,331 @@
+"""
+Attribution Engine - Joins Hyros-attributed revenue to Meta spend
+
+Builds a hash index of Meta ads, ad sets and campaigns, then streams
+Hyros sales through it once to produce "true ROAS" (Hyros revenue ÷
+Meta spend) per ad, ad set, campaign and funnel.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .campaign_parser import CampaignParser
+from .adapters.hyros import HyrosSale
+from .adapters.meta_ads import MetaAdsAdapter
+
+
+@dataclass
+class TrueRoasRow:
+    """Spend and attributed revenue for one ad, ad set, campaign or funnel"""
+    id: str
+    name: str
+    level: str  # ad, adset, campaign, funnel
+    spend: float = 0.0
+    revenue: float = 0.0
+    sales: int = 0
+    campaign_id: str = ""
+    funnel_tag: str = ""
+    meta_roas: Optional[float] = None  # Meta-reported purchase ROAS, when available
+
+    @property
+    def true_roas(self) -> float:
+        return self.revenue / self.spend if self.spend > 0 else 0.0
+
+    @property
+    def cpp(self) -> float:
+        return self.spend / self.sales if self.sales > 0 else 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            'id': self.id,
+            'name': self.name,
+            'level': self.level,
+            'spend': self.spend,
+            'revenue': self.revenue,
+            'sales': self.sales,
+            'true_roas': self.true_roas,
+            'meta_roas': self.meta_roas,
+            'cpp': self.cpp,
+            'campaign_id': self.campaign_id,
+            'funnel_tag': self.funnel_tag
+        }
+
+
+@dataclass
+class AttributionReport:
+    """True ROAS tables produced by AttributionEngine.attribute"""
+    model: str
+    by_ad: Dict[str, TrueRoasRow] = field(default_factory=dict)
+    by_adset: Dict[str, TrueRoasRow] = field(default_factory=dict)
+    by_campaign: Dict[str, TrueRoasRow] = field(default_factory=dict)
+    by_funnel: Dict[str, TrueRoasRow] = field(default_factory=dict)
+
+    total_sales: int = 0
+    total_revenue: float = 0.0
+    matched_sales: int = 0
+    matched_revenue: float = 0.0
+    total_spend: float = 0.0
+
+    @property
+    def true_roas(self) -> float:
+        return self.matched_revenue / self.total_spend if self.total_spend > 0 else 0.0
+
+    @property
+    def match_rate(self) -> float:
+        return (self.matched_sales / self.total_sales * 100) if self.total_sales > 0 else 0.0
+
+    def ranked(self, level: str = 'ad', min_spend: float = 0.0) -> List[TrueRoasRow]:
+        """Rows of one table sorted by true ROAS, best first"""
+        rows = getattr(self, f'by_{level}').values()
+        return sorted(
+            (row for row in rows if row.spend >= min_spend),
+            key=lambda row: row.true_roas,
+            reverse=True
+        )
+
+    def to_dict(self) -> Dict:
+        return {
+            'model': self.model,
+            'total_sales': self.total_sales,
+            'total_revenue': self.total_revenue,
+            'matched_sales': self.matched_sales,
+            'matched_revenue': self.matched_revenue,
+            'match_rate': self.match_rate,
+            'total_spend': self.total_spend,
+            'true_roas': self.true_roas,
+            'by_ad': [row.to_dict() for row in self.by_ad.values()],
+            'by_adset': [row.to_dict() for row in self.by_adset.values()],
+            'by_campaign': [row.to_dict() for row in self.by_campaign.values()],
+            'by_funnel': [row.to_dict() for row in self.by_funnel.values()]
+        }
+
+
+class AttributionEngine:
+    """
+    Hash-join of Hyros sales against Meta ads.
+
+    Hyros reports the clicked ad as `adSourceId`, which may be an ad, ad
+    set or campaign id depending on the tracking setup. All three are
+    indexed, so each sale is resolved with at most three dict lookups
+    and the whole join is a single linear pass.
+
+    Usage:
+        engine = AttributionEngine.from_meta(meta_adapter, date_preset='last_30d')
+        report = engine.attribute(hyros.iter_sales(start_date, end_date))
+        for row in report.ranked('ad', min_spend=50):
+            print(row.name, row.true_roas)
+    """
+
+    MODELS = ('first', 'last')
+
+    def __init__(self, model: str = 'first'):
+        """
+        Args:
+            model: 'first' uses the first-click ad, 'last' the last-click ad
+        """
+        if model not in self.MODELS:
+            raise ValueError(f"Unknown attribution model: {model}")
+
+        self.model = model
+        self.parser = CampaignParser()
+
+        # id -> (adset_id, campaign_id)
+        self._ads: Dict[str, Tuple[str, str]] = {}
+        # id -> campaign_id
+        self._adsets: Dict[str, str] = {}
+        # id -> funnel_tag
+        self._campaigns: Dict[str, str] = {}
+
+        self._names: Dict[str, str] = {}
+        self._spend: Dict[str, float] = {}
+        self._meta_roas: Dict[str, float] = {}
+
+    @classmethod
+    def from_meta(
+        cls,
+        adapter: MetaAdsAdapter,
+        date_preset: str = 'last_30d',
+        model: str = 'first'
+    ) -> 'AttributionEngine':
+        """
+        Build an engine indexed with an ad account's campaigns, ad sets and ads.
+
+        Args:
+            adapter: Configured Meta Ads adapter
+            date_preset: Meta insights window for spend; should match the
+                Hyros sales period
+            model: Attribution model ('first' or 'last')
+        """
+        engine = cls(model=model)
+        engine.index_meta(
+            campaigns=adapter.get_campaigns(date_preset=date_preset),
+            adsets=adapter.get_adsets(date_preset=date_preset),
+            ads=adapter.get_ads(date_preset=date_preset)
+        )
+        return engine
+
+    def index_meta(
+        self,
+        campaigns: Iterable[Dict],
+        adsets: Iterable[Dict],
+        ads: Iterable[Dict]
+    ):
+        """
+        Index Meta objects as returned by MetaAdsAdapter.
+
+        Args:
+            campaigns: Campaign dicts (id, name, optional insights)
+            adsets: Ad set dicts (id, name, campaign_id, optional insights)
+            ads: Ad dicts (id, name, adset_id, campaign_id, optional insights);
+                campaign_id is used when the ad set isn't indexed
+        """
+        for campaign in campaigns:
+            campaign_id = str(campaign.get('id', ''))
+            name = campaign.get('name', '')
+            funnel_tag, _, _ = self.parser.parse_campaign_name(name)
+            self._campaigns[campaign_id] = funnel_tag
+            self._index_common(campaign_id, name, campaign)
+
+        for adset in adsets:
+            adset_id = str(adset.get('id', ''))
+            self._adsets[adset_id] = str(adset.get('campaign_id', ''))
+            self._index_common(adset_id, adset.get('name', ''), adset)
+
+        for ad in ads:
+            ad_id = str(ad.get('id', ''))
+            adset_id = str(ad.get('adset_id', ''))
+            campaign_id = self._adsets.get(adset_id) or str(ad.get('campaign_id', ''))
+            self._ads[ad_id] = (adset_id, campaign_id)
+            self._index_common(ad_id, ad.get('name', ''), ad)
+
+    def resolve(self, source_id: str) -> Tuple[str, str, str]:
+        """
+        Map a Hyros adSourceId to (ad_id, adset_id, campaign_id).
+
+        Unknown levels are returned as ''.
+        """
+        hierarchy = self._ads.get(source_id)
+        if hierarchy is not None:
+            return source_id, hierarchy[0], hierarchy[1]
+
+        campaign_id = self._adsets.get(source_id)
+        if campaign_id is not None:
+            return '', source_id, campaign_id
+
+        if source_id in self._campaigns:
+            return '', '', source_id
+
+        return '', '', ''
+
+    def attribute(self, sales: Iterable[HyrosSale]) -> AttributionReport:
+        """
+        Join Hyros sales to the Meta index in a single pass.
+
+        Args:
+            sales: Hyros sales (a list or a streaming iterator)
+
+        Returns:
+            AttributionReport with true ROAS tables. Every indexed entity
+            with spend is listed, including those with no attributed sales.
+        """
+        ad_revenue: Dict[str, List] = {}
+        adset_revenue: Dict[str, List] = {}
+        campaign_revenue: Dict[str, List] = {}
+
+        report = AttributionReport(model=self.model)
+        use_last = self.model == 'last'
+        resolve = self.resolve
+
+        total_sales = matched_sales = 0
+        total_revenue = matched_revenue = 0.0
+
+        for sale in sales:
+            amount = sale.amount
+            total_sales += 1
+            total_revenue += amount
+
+            source_id = sale.last_ad_id if use_last else sale.ad_id
+            if not source_id:
+                continue
+
+            ad_id, adset_id, campaign_id = resolve(source_id)
+            if not campaign_id:
+                continue
+
+            matched_sales += 1
+            matched_revenue += amount
+
+            for key, target in ((ad_id, ad_revenue), (adset_id, adset_revenue), (campaign_id, campaign_revenue)):
+                if key:
+                    totals = target.get(key)
+                    if totals is None:
+                        totals = target[key] = [0, 0.0]
+                    totals[0] += 1
+                    totals[1] += amount
+
+        report.total_sales = total_sales
+        report.total_revenue = total_revenue
+        report.matched_sales = matched_sales
+        report.matched_revenue = matched_revenue
+
+        report.by_ad = self._rows('ad', self._ads, ad_revenue)
+        report.by_adset = self._rows('adset', self._adsets, adset_revenue)
+        report.by_campaign = self._rows('campaign', self._campaigns, campaign_revenue)
+        report.by_funnel = self._funnel_rows(report.by_campaign)
+        report.total_spend = sum(row.spend for row in report.by_campaign.values())
+
+        return report
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    def _index_common(self, entity_id: str, name: str, data: Dict):
+        self._names[entity_id] = name
+
+        insights = data.get('insights', {})
+        if isinstance(insights, dict) and insights.get('data'):
+            insights_data = insights['data'][0]
+            self._spend[entity_id] = float(insights_data.get('spend', 0) or 0)
+
+            roas_data = insights_data.get('purchase_roas', [])
+            if roas_data and isinstance(roas_data, list):
+                self._meta_roas[entity_id] = float(roas_data[0].get('value', 0))
+
+    def _campaign_of(self, level: str, entity_id: str) -> str:
+        if level == 'ad':
+            return self._ads[entity_id][1] if entity_id in self._ads else ''
+        if level == 'adset':
+            return self._adsets.get(entity_id, '')
+        return entity_id
+
+    def _rows(self, level: str, index: Dict, revenue: Dict[str, List]) -> Dict[str, TrueRoasRow]:
+        rows = {}
+        for entity_id in set(revenue) | {key for key in index if self._spend.get(key)}:
+            sales, amount = revenue.get(entity_id, (0, 0.0))
+            campaign_id = self._campaign_of(level, entity_id)
+            rows[entity_id] = TrueRoasRow(
+                id=entity_id,
+                name=self._names.get(entity_id, ''),
+                level=level,
+                spend=self._spend.get(entity_id, 0.0),
+                revenue=amount,
+                sales=sales,
+                campaign_id=campaign_id,
+                funnel_tag=self._campaigns.get(campaign_id, ''),
+                meta_roas=self._meta_roas.get(entity_id)
+            )
+        return rows
+
+    @staticmethod
+    def _funnel_rows(campaign_rows: Dict[str, TrueRoasRow]) -> Dict[str, TrueRoasRow]:
+        funnels: Dict[str, TrueRoasRow] = {}
+        for row in campaign_rows.values():
+            tag = row.funnel_tag or 'UNTAGGED'
+            funnel = funnels.get(tag)
+            if funnel is None:
+                funnel = funnels[tag] = TrueRoasRow(id=tag, name=tag, level='funnel', funnel_tag=tag)
+            funnel.spend += row.spend
+            funnel.revenue += row.revenue
+            funnel.sales += row.sales
+        return funnels
@@ -0,0 +1,338 @@
+"""
+Campaign Join - Matches Meta campaigns to GA4 and checkout UTM campaigns
+
+Meta campaigns are indexed by id and by a normalized name key. GA4
+`sessionCampaignName` rows and checkout `Sale.utm_campaign` values are
+resolved against that index once per distinct value, and the metrics
+are then summed per campaign with NumPy bincounts. That gives per-campaign
+session/LP-view ratio, true ROAS and tracking loss next to Meta's own
+numbers.
+"""
+
+import re
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+from .adapters.checkout.base import PaymentStatus, Sale
+from .adapters.checkout.sales_table import SalesTable
+
+
+# UTM values that never identify a paid campaign
+UNTRACKED_KEYS = {'', 'not_set', 'none', 'null', 'direct', 'organic', 'referral'}
+
+# Meta object ids embedded in UTM values such as "{{campaign.name}}_{{campaign.id}}"
+META_ID_PATTERN = re.compile(r'\d{10,}')
+
+
+def normalize_campaign_key(value: Optional[str]) -> str:
+    """
+    Lowercase ASCII key with runs of punctuation/spaces collapsed to '_'.
+
+    "BR | Escala - VSL" and "br_escala_vsl" both become "br_escala_vsl".
+    """
+    text = unicodedata.normalize('NFKD', str(value or '')).encode('ascii', 'ignore').decode('ascii')
+    return re.sub(r'[^a-z0-9]+', '_', text.lower()).strip('_')
+
+
+def _action_value(actions: Optional[List[Dict]], action_type: str) -> float:
+    for action in actions or []:
+        if action.get('action_type') == action_type:
+            return float(action.get('value', 0) or 0)
+    return 0.0
+
+
+class CampaignJoinResult:
+    """
+    Per-Meta-campaign columns produced by CampaignJoin.join.
+
+    All metric attributes are NumPy arrays aligned with `ids`.
+    """
+
+    def __init__(
+        self,
+        ids: List[str],
+        names: List[str],
+        meta: Dict[str, np.ndarray],
+        ga: Dict[str, np.ndarray],
+        checkout: Dict[str, np.ndarray],
+        unmatched_ga: Dict[str, int],
+        unmatched_sales: Dict[str, float],
+        has_checkout: bool
+    ):
+        self.ids = ids
+        self.names = names
+
+        self.spend = meta['spend']
+        self.lp_views = meta['lp_views']
+        self.meta_purchases = meta['purchases']
+        self.meta_revenue = meta['revenue']
+
+        self.ga_sessions = ga['sessions']
+        self.ga_users = ga['users']
+        self.ga_conversions = ga['conversions']
+        self.ga_revenue = ga['revenue']
+
+        self.sales = checkout['sales']
+        self.revenue = checkout['revenue']
+
+        self.unmatched_ga = unmatched_ga
+        self.unmatched_sales = unmatched_sales
+        self.has_checkout = has_checkout
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    # -------------------------------------------------------------------------
+    # Derived metrics
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _ratio(numerator: np.ndarray, denominator: np.ndarray, scale: float = 1.0) -> np.ndarray:
+        result = np.zeros(len(numerator))
+        np.divide(numerator * scale, denominator, out=result, where=denominator > 0)
+        return result
+
+    @property
+    def session_lp_ratio(self) -> np.ndarray:
+        """GA sessions per Meta landing page view, in %"""
+        return self._ratio(self.ga_sessions, self.lp_views, 100.0)
+
+    @property
+    def tracking_loss(self) -> np.ndarray:
+        """Share of Meta LP views with no GA session, in % (0 when GA sees more)"""
+        return np.clip(100.0 - self.session_lp_ratio, 0.0, 100.0) * (self.lp_views > 0)
+
+    @property
+    def true_revenue(self) -> np.ndarray:
+        """Checkout revenue when sales were joined, GA revenue otherwise"""
+        return self.revenue if self.has_checkout else self.ga_revenue
+
+    @property
+    def true_roas(self) -> np.ndarray:
+        return self._ratio(self.true_revenue, self.spend)
+
+    @property
+    def meta_roas(self) -> np.ndarray:
+        return self._ratio(self.meta_revenue, self.spend)
+
+    @property
+    def ga_match_rate(self) -> float:
+        """Share of GA campaign sessions attributed to a Meta campaign, in %"""
+        matched = float(self.ga_sessions.sum())
+        total = matched + sum(self.unmatched_ga.values())
+        return matched / total * 100 if total > 0 else 0.0
+
+    @property
+    def sales_match_rate(self) -> float:
+        """Share of checkout UTM revenue attributed to a Meta campaign, in %"""
+        matched = float(self.revenue.sum())
+        total = matched + sum(self.unmatched_sales.values())
+        return matched / total * 100 if total > 0 else 0.0
+
+    # -------------------------------------------------------------------------
+    # Output
+    # -------------------------------------------------------------------------
+
+    def rows(self, sort_by: str = 'spend', min_spend: float = 0.0) -> List[Dict]:
+        """
+        One dict per campaign, sorted descending by a metric.
+
+        Args:
+            sort_by: Any metric key of the returned rows
+            min_spend: Leave out campaigns that spent less
+        """
+        columns = {
+            'spend': self.spend,
+            'lp_views': self.lp_views,
+            'meta_purchases': self.meta_purchases,
+            'meta_revenue': self.meta_revenue,
+            'meta_roas': self.meta_roas,
+            'ga_sessions': self.ga_sessions,
+            'ga_users': self.ga_users,
+            'ga_conversions': self.ga_conversions,
+            'ga_revenue': self.ga_revenue,
+            'sales': self.sales,
+            'revenue': self.revenue,
+            'session_lp_ratio': self.session_lp_ratio,
+            'tracking_loss': self.tracking_loss,
+            'true_roas': self.true_roas,
+        }
+
+        selected = np.flatnonzero(self.spend >= min_spend)
+        order = selected[np.argsort(-columns[sort_by][selected], kind='stable')]
+
+        return [
+            {
+                'id': self.ids[i],
+                'name': self.names[i],
+                **{key: float(values[i]) for key, values in columns.items()}
+            }
+            for i in order
+        ]
+
+    def to_dict(self) -> Dict:
+        return {
+            'campaigns': self.rows(),
+            'ga_match_rate': self.ga_match_rate,
+            'sales_match_rate': self.sales_match_rate,
+            'unmatched_ga': self.unmatched_ga,
+            'unmatched_sales': self.unmatched_sales
+        }
+
+
+class CampaignJoin:
+    """
+    Hash join of Meta campaigns with GA4 and checkout campaign values.
+
+    A GA/UTM value resolves to a Meta campaign by, in order: exact id,
+    a Meta id embedded in the value, or the normalized campaign name.
+    Each distinct value is looked up once, so thousands of campaigns and
+    hundreds of thousands of sales stay interactive.
+
+    Usage:
+        join = CampaignJoin(meta.get_campaigns(date_preset='last_7d'))
+        result = join.join(
+            ga_campaigns=ga.get_campaign_performance('7daysAgo', 'yesterday', limit=None),
+            sales=adapter.get_sales_table(start_date, end_date)
+        )
+        for row in result.rows(sort_by='tracking_loss', min_spend=50):
+            print(row['name'], row['true_roas'], row['tracking_loss'])
+    """
+
+    def __init__(self, meta_campaigns: Iterable[Dict]):
+        """
+        Args:
+            meta_campaigns: Campaign dicts as returned by
+                MetaAdsAdapter.get_campaigns (id, name, optional insights)
+        """
+        self.ids: List[str] = []
+        self.names: List[str] = []
+        self._lookup: Dict[str, int] = {}
+
+        spend, lp_views, purchases, revenue = [], [], [], []
+
+        for campaign in meta_campaigns:
+            index = len(self.ids)
+            campaign_id = str(campaign.get('id', ''))
+            name = campaign.get('name', '')
+            self.ids.append(campaign_id)
+            self.names.append(name)
+
+            if campaign_id:
+                self._lookup.setdefault(campaign_id, index)
+            key = normalize_campaign_key(name)
+            if key not in UNTRACKED_KEYS:
+                # Duplicate names keep the first campaign
+                self._lookup.setdefault(key, index)
+
+            insights = campaign.get('insights', {})
+            data = insights.get('data', [{}])[0] if isinstance(insights, dict) and insights.get('data') else {}
+            spend.append(float(data.get('spend', 0) or 0))
+            lp_views.append(_action_value(data.get('actions'), 'landing_page_view'))
+            purchases.append(_action_value(data.get('actions'), 'purchase'))
+            revenue.append(_action_value(data.get('action_values'), 'purchase'))
+
+        self.meta = {
+            'spend': np.array(spend, dtype=np.float64),
+            'lp_views': np.array(lp_views, dtype=np.float64),
+            'purchases': np.array(purchases, dtype=np.float64),
+            'revenue': np.array(revenue, dtype=np.float64)
+        }
+
+    def resolve(self, value: Optional[str]) -> int:
+        """Index of the Meta campaign a GA/UTM value refers to, or -1"""
+        text = str(value or '').strip()
+        index = self._lookup.get(text)
+        if index is not None:
+            return index
+
+        for embedded_id in META_ID_PATTERN.findall(text):
+            index = self._lookup.get(embedded_id)
+            if index is not None:
+                return index
+
+        key = normalize_campaign_key(text)
+        if key in UNTRACKED_KEYS:
+            return -1
+        return self._lookup.get(key, -1)
+
+    def match(self, values: Sequence[str]) -> np.ndarray:
+        """Vector of Meta campaign indexes (-1 unmatched), resolving each distinct value once"""
+        if len(values) == 0:
+            return np.empty(0, dtype=np.int64)
+
+        distinct, inverse = np.unique(np.asarray(values, dtype=object).astype(str), return_inverse=True)
+        resolved = np.fromiter((self.resolve(value) for value in distinct), dtype=np.int64, count=len(distinct))
+        return resolved[inverse]
+
+    def join(
+        self,
+        ga_campaigns: Optional[Sequence[Dict]] = None,
+        sales: Optional[Union[SalesTable, Iterable[Sale]]] = None,
+        status: Optional[PaymentStatus] = PaymentStatus.APPROVED
+    ) -> CampaignJoinResult:
+        """
+        Attach GA4 and checkout metrics to each Meta campaign.
+
+        Args:
+            ga_campaigns: Rows from GoogleAnalyticsAdapter.get_campaign_performance
+            sales: SalesTable or Sale objects (utm_campaign, amount)
+            status: Only count sales with this status (None for all)
+
+        Returns:
+            CampaignJoinResult aligned with the Meta campaigns
+        """
+        size = len(self.ids)
+
+        ga = {metric: np.zeros(size) for metric in ('sessions', 'users', 'conversions', 'revenue')}
+        unmatched_ga: Dict[str, int] = {}
+        if ga_campaigns:
+            names = [row.get('campaign', '') for row in ga_campaigns]
+            indexes = self.match(names)
+            matched = indexes >= 0
+            for metric in ga:
+                values = np.array([float(row.get(metric, 0) or 0) for row in ga_campaigns])
+                ga[metric] = np.bincount(indexes[matched], weights=values[matched], minlength=size)
+            for position in np.flatnonzero(~matched):
+                name = names[position]
+                if normalize_campaign_key(name) not in UNTRACKED_KEYS:
+                    unmatched_ga[name] = unmatched_ga.get(name, 0) + int(ga_campaigns[position].get('sessions', 0))
+
+        checkout = {'sales': np.zeros(size), 'revenue': np.zeros(size)}
+        unmatched_sales: Dict[str, float] = {}
+        if sales is not None:
+            table = sales if isinstance(sales, SalesTable) else SalesTable.from_sales(sales)
+            if status is not None:
+                table = table.where(status)
+            codes = table.codes['utm_campaign']
+            tagged = codes >= 0
+            codes = codes[tagged]
+            amounts = table.amount[tagged]
+
+            # Resolve each distinct utm_campaign once, then map codes to campaigns
+            categories = table.categories['utm_campaign']
+            by_code = np.fromiter((self.resolve(value) for value in categories), dtype=np.int64, count=len(categories))
+            indexes = by_code[codes]
+            matched = indexes >= 0
+
+            checkout['sales'] = np.bincount(indexes[matched], minlength=size).astype(np.float64)
+            checkout['revenue'] = np.bincount(indexes[matched], weights=amounts[matched], minlength=size)
+
+            unmatched_revenue = np.bincount(codes[~matched], weights=amounts[~matched], minlength=len(categories))
+            for code in np.flatnonzero(unmatched_revenue):
+                if normalize_campaign_key(categories[code]) not in UNTRACKED_KEYS:
+                    unmatched_sales[categories[code]] = float(unmatched_revenue[code])
+
+        return CampaignJoinResult(
+            ids=self.ids,
+            names=self.names,
+            meta=self.meta,
+            ga=ga,
+            checkout=checkout,
+            unmatched_ga=unmatched_ga,
+            unmatched_sales=unmatched_sales,
+            has_checkout=sales is not None
+        )
+
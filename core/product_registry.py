@@ -281,14 +281,19 @@ class ProductRegistry:
     def sync_from_platform(
         self,
         adapter: BaseCheckoutAdapter,
-        funnel_mapping: Optional[Dict[str, str]] = None
+        funnel_mapping: Optional[Dict[str, str]] = None,
+        refresh: bool = False
     ) -> List[FunnelProduct]:
         """
         Sync products from a checkout platform.
 
+        Reads the adapter's cached catalog, so syncing next to CPP
+        analysis doesn't fetch products twice.
+
         Args:
             adapter: Checkout platform adapter
             funnel_mapping: Optional dict mapping product_id to funnel_tag
+            refresh: Force a fresh catalog fetch
 
         Returns:
             List of synced FunnelProduct objects
@@ -297,7 +302,7 @@ class ProductRegistry:
         synced = []
 
         try:
-            platform_products = adapter.get_products()
+            platform_products = adapter.get_catalog(refresh=refresh).values()
 
             for product in platform_products:
                 funnel_product = FunnelProduct(
@@ -18,9 +18,11 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core import (
     CampaignParser, ClientRegistry, FunnelRegistry, DataAggregator,
-    ProductRegistry, WhopAdapter, ClickFunnelsAdapter, HyrosAdapter
+    ProductRegistry, WhopAdapter, ClickFunnelsAdapter, HyrosAdapter,
+    CampaignJoin
 )
 from core.adapters.google_analytics import GoogleAnalyticsAdapter, get_mock_ga_data
+from core.adapters.response_cache import ResponseCache
 from dashboard.auth import check_password, logout
 
 # =============================================================================
@@ -291,6 +293,9 @@ PROJECTS = {
 API_VERSION = "v18.0"
 BASE_URL = f"https://graph.facebook.com/{API_VERSION}"
 
+# On-disk cache under st.cache_data: closed date ranges survive its TTL and restarts
+RESPONSE_CACHE = ResponseCache.shared()
+
 def get_credentials():
     try:
         return {
@@ -339,12 +344,16 @@ def fetch_account_insights(account_id: str, token: str, date_preset: str = None,
     # Use custom date range or preset
     if start_date and end_date:
         params['time_range'] = json.dumps({'since': start_date, 'until': end_date})
+        date_range = (start_date, end_date)
     else:
         params['date_preset'] = date_preset or 'last_7d'
+        date_range = (params['date_preset'], None)
 
     try:
-        response = requests.get(url, params=params)
-        data = response.json()
+        data = RESPONSE_CACHE.get_or_fetch(
+            'meta', account_id, 'insights', {'fields': META_FIELDS}, [date_range],
+            fetch=lambda: requests.get(url, params=params).json()
+        )
         if 'data' in data and data['data']:
             return data['data'][0]
     except:
@@ -361,9 +370,11 @@ def fetch_campaigns_with_insights(account_id: str, token: str, date_preset: str
     # Build insights clause
     if start_date and end_date:
         insights_clause = f'insights.time_range({{"since":"{start_date}","until":"{end_date}"}}){{{META_FIELDS}}}'
+        date_range = (start_date, end_date)
     else:
         preset = date_preset or 'last_7d'
         insights_clause = f'insights.date_preset({preset}){{{META_FIELDS}}}'
+        date_range = (preset, None)
 
     params = {
         'fields': f'id,name,status,effective_status,daily_budget,lifetime_budget,objective,{insights_clause}',
@@ -371,8 +382,12 @@ def fetch_campaigns_with_insights(account_id: str, token: str, date_preset: str
         'access_token': token
     }
     try:
-        response = requests.get(url, params=params)
-        data = response.json()
+        # Status and budgets change independently of the range: short TTL only
+        data = RESPONSE_CACHE.get_or_fetch(
+            'meta', account_id, 'campaigns', {'fields': params['fields'], 'limit': params['limit']}, [date_range],
+            fetch=lambda: requests.get(url, params=params).json(),
+            mutable=True
+        )
         if 'error' in data:
             return []
         return data.get('data', [])
@@ -384,6 +399,7 @@ def update_campaign_status(campaign_id: str, status: str, token: str):
     params = {'status': status, 'access_token': token}
     try:
         response = requests.post(url, params=params)
+        RESPONSE_CACHE.invalidate('meta')
         return response.json()
     except:
         return {'error': 'Failed'}
@@ -393,6 +409,7 @@ def update_campaign_budget(campaign_id: str, daily_budget: int, token: str):
     params = {'daily_budget': daily_budget, 'access_token': token}
     try:
         response = requests.post(url, params=params)
+        RESPONSE_CACHE.invalidate('meta')
         return response.json()
     except:
         return {'error': 'Failed'}
@@ -539,7 +556,8 @@ def fetch_ga_data(property_id: str, credentials_json: str, start_date: str, end_
     try:
         ga_adapter = GoogleAnalyticsAdapter(
             property_id=property_id,
-            credentials_json=credentials_json
+            credentials_json=credentials_json,
+            response_cache=RESPONSE_CACHE
         )
         return ga_adapter.get_full_report(start_date, end_date)
     except Exception as e:
@@ -578,8 +596,8 @@ def get_delta_color(trend: str, metric_type: str = 'positive') -> str:
             return '#10B981'  # green
     return '#94A3B8'  # gray for flat
 
-def cross_reference_data(meta_metrics: dict, ga_data: dict) -> dict:
-    """Cross-reference Meta Ads data with Google Analytics"""
+def cross_reference_data(meta_metrics: dict, ga_data: dict, campaigns: list = None) -> dict:
+    """Cross-reference Meta Ads data with Google Analytics (per campaign when campaigns are given)"""
     meta_purchases = meta_metrics.get('purchases', 0)
     meta_revenue = meta_metrics.get('revenue', 0)
     meta_spend = meta_metrics.get('spend', 0)
@@ -635,7 +653,10 @@ def cross_reference_data(meta_metrics: dict, ga_data: dict) -> dict:
         'channels': ga_data.get('channels', {}),
         'devices': ga_data.get('devices', {}),
         'top_pages': ga_data.get('top_pages', []),
-        'landing_pages': ga_data.get('landing_pages', [])
+        'landing_pages': ga_data.get('landing_pages', []),
+
+        # Meta campaign x GA sessionCampaignName
+        'campaign_join': CampaignJoin(campaigns).join(ga_data.get('campaigns', [])).to_dict() if campaigns else {}
     }
 
 def generate_improvement_suggestions(metrics_3d: dict, metrics_7d: dict, cross_data: dict) -> list:
@@ -1583,8 +1604,9 @@ elif st.session_state.current_page == 'traffic':
         ga_data_3d = fetch_ga_data(creds['ga_property_id'], creds['ga_credentials_json'], ga_start_3d, ga_end)
         ga_data = ga_data_7d  # Maintain backwards compatibility
 
-        # Cross-reference data
-        cross_data = cross_reference_data(metrics_7d, ga_data_7d)
+        # Cross-reference data (GA 7d window matches Meta's last_7d preset)
+        campaigns_7d = fetch_campaigns_with_insights(creds['meta_account'], creds['meta_token'], date_preset='last_7d')
+        cross_data = cross_reference_data(metrics_7d, ga_data_7d, campaigns_7d)
         cross_data_3d = cross_reference_data(metrics_3d, ga_data_3d)
 
         # Generate improvement suggestions
@@ -2295,6 +2317,32 @@ elif st.session_state.current_page == 'traffic':
                         }
                     )
 
+            # Per-campaign Meta x GA join
+            campaign_join = cross_data.get('campaign_join', {})
+            joined_campaigns = [c for c in campaign_join.get('campaigns', []) if c['spend'] > 0]
+            if joined_campaigns:
+                st.markdown("#### 🔗 Campanhas (Meta × GA)")
+                st.caption(f"{campaign_join['ga_match_rate']:.0f}% das sessões de campanha do GA casadas com campanhas Meta")
+                join_df = pd.DataFrame(joined_campaigns)[
+                    ['name', 'spend', 'lp_views', 'ga_sessions', 'session_lp_ratio', 'tracking_loss', 'ga_revenue', 'true_roas', 'meta_roas']
+                ]
+                st.dataframe(
+                    join_df,
+                    use_container_width=True,
+                    hide_index=True,
+                    column_config={
+                        'name': 'Campanha',
+                        'spend': st.column_config.NumberColumn('Gasto', format='$%.2f'),
+                        'lp_views': st.column_config.NumberColumn('LP Views', format='%d'),
+                        'ga_sessions': st.column_config.NumberColumn('Sessões GA', format='%d'),
+                        'session_lp_ratio': st.column_config.NumberColumn('Sessões/LP', format='%.0f%%'),
+                        'tracking_loss': st.column_config.NumberColumn('Perda Tracking', format='%.0f%%'),
+                        'ga_revenue': st.column_config.NumberColumn('Faturamento GA', format='$%.2f'),
+                        'true_roas': st.column_config.NumberColumn('True ROAS', format='%.2fx'),
+                        'meta_roas': st.column_config.NumberColumn('ROAS Meta', format='%.2fx')
+                    }
+                )
+
         # ========== TAB 4: IMPROVEMENTS ==========
         with tab4:
             st.markdown("### 💡 Melhorias Sugeridas")